@@ -1,14 +1,104 @@
+import ckan.lib.redis as redis
 import ckan.model as model
 import ckan.plugins.toolkit as toolkit
 import ckan.logic as logic
+import hashlib
+import json
+import logging
 import secrets
 import string
 
+from ckan.logic.schema import default_user_schema
+from sqlalchemy import case, func, or_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+log = logging.getLogger(__name__)
+
+# how many users create_inventory_users_bulk creates per transaction
+CREATE_USERS_BATCH_SIZE = 100
+
 
 def create_inventory_user(context, data_dict):
     """Create a new user with email validation and auto-generated password."""
     toolkit.check_access('create_inventory_user', context, data_dict)
 
+    user_dict = _inventory_user_dict(data_dict)
+
+    try:
+        user = toolkit.get_action('user_create')(context, user_dict)
+    except logic.ValidationError as e:
+        raise e
+
+    return user
+
+
+def create_inventory_users_bulk(context, data_dict):
+    """Create many users at once, each with an auto-generated password.
+
+    Every row is validated before any user is created, and the valid ones
+    are then created in batches of `CREATE_USERS_BATCH_SIZE` with one
+    commit per batch.
+
+    :param users: the users to create
+    :type users: list of dicts with ``name`` and ``email``
+
+    :returns: the number of users ``created`` and ``failed``, and the
+        ``results`` for each row in order: its ``row`` number, ``name``,
+        ``email``, ``success`` and either the new user's ``id`` or the
+        validation ``errors``
+    :rtype: dict
+    """
+    toolkit.check_access('create_inventory_users_bulk', context, data_dict)
+
+    users = data_dict.get('users')
+    if not isinstance(users, list) or not users:
+        raise logic.ValidationError({'users': ['Missing value']})
+
+    results = []
+    pending = []
+    seen_names = set()
+    seen_emails = set()
+    for row, user in enumerate(users, 1):
+        if not isinstance(user, dict):
+            user = {}
+        name = (user.get('name') or '').strip()
+        email = (user.get('email') or '').strip()
+        result = {'row': row, 'name': name, 'email': email}
+        results.append(result)
+
+        try:
+            user_dict = _inventory_user_dict({'name': name, 'email': email})
+            errors = _user_schema_errors(context, user_dict)
+        except logic.ValidationError as e:
+            errors = e.error_dict
+        if not errors and name in seen_names:
+            errors = {'name': ['Duplicate username in this upload']}
+        if not errors and email.lower() in seen_emails:
+            errors = {'email': ['Duplicate email in this upload']}
+        seen_names.add(name)
+        seen_emails.add(email.lower())
+
+        if errors:
+            result.update(success=False, errors=errors)
+        else:
+            pending.append((result, user_dict))
+
+    for start in range(0, len(pending), CREATE_USERS_BATCH_SIZE):
+        _create_users_batch(
+            context, pending[start:start + CREATE_USERS_BATCH_SIZE]
+        )
+
+    created = sum(1 for result in results if result['success'])
+    return {
+        'created': created,
+        'failed': len(results) - created,
+        'results': results,
+    }
+
+
+def _inventory_user_dict(data_dict):
+    """Validate the name and email of a new inventory user and return the
+    `user_create` data for them, with a generated password."""
     name = data_dict.get('name', '').strip()
     email = data_dict.get('email', '').strip()
 
@@ -24,18 +114,53 @@ def create_inventory_user(context, data_dict):
     alphabet = string.ascii_letters + string.digits + string.punctuation
     password = ''.join(secrets.choice(alphabet) for i in range(32))
 
-    user_dict = {
+    return {
         'name': name,
         'email': email,
         'password': password
     }
 
-    try:
-        user = toolkit.get_action('user_create')(context, user_dict)
-    except logic.ValidationError as e:
-        raise e
 
-    return user
+def _user_schema_errors(context, user_dict):
+    """The errors `user_create` would raise for `user_dict`.
+
+    `user_create` rolls the session back when validation fails, which
+    would throw away the rest of a batch, so rows are checked up front.
+    """
+    _data, errors = toolkit.navl_validate(
+        user_dict, default_user_schema(),
+        dict(context, session=model.Session)
+    )
+    return errors
+
+
+def _create_users_batch(context, batch):
+    try:
+        created = [
+            (result, toolkit.get_action('user_create')(
+                dict(context, defer_commit=True), user_dict
+            ))
+            for result, user_dict in batch
+        ]
+        model.repo.commit()
+    except Exception as e:
+        model.Session.rollback()
+        if len(batch) > 1:
+            # e.g. a name taken since the rows were validated; retry one
+            # user per transaction so only the offending rows fail
+            for item in batch:
+                _create_users_batch(context, [item])
+            return
+        if isinstance(e, logic.ValidationError):
+            errors = e.error_dict
+        else:
+            log.exception('Error creating user %s', batch[0][0]['name'])
+            errors = {'user': [str(e)]}
+        batch[0][0].update(success=False, errors=errors)
+        return
+
+    for result, user in created:
+        result.update(success=True, id=user['id'])
 
 
 def reactivate_user(context, data_dict):
@@ -69,48 +194,347 @@ def reactivate_user(context, data_dict):
     return user_dict
 
 
+def reactivate_users_bulk(context, data_dict):
+    """Reactivate many deleted users at once.
+
+    :param ids: the ids or names of the users to reactivate
+    :type ids: list of strings
+
+    :returns: the number of users ``updated``, their ``id`` and ``name``
+        as ``users``, and the ``not_updated`` ids or names, which are
+        unknown or not deleted
+    :rtype: dict
+    """
+    toolkit.check_access('reactivate_users_bulk', context, data_dict)
+
+    return _set_users_state(
+        _user_ids(data_dict), model.State.DELETED, model.State.ACTIVE
+    )
+
+
+def deactivate_users_bulk(context, data_dict):
+    """Delete many active users at once, along with their memberships
+    and dataset collaborations, as `user_delete` does.
+
+    :param ids: the ids or names of the users to deactivate
+    :type ids: list of strings
+
+    :returns: the number of users ``updated``, their ``id`` and ``name``
+        as ``users``, and the ``not_updated`` ids or names, which are
+        unknown or not active
+    :rtype: dict
+    """
+    toolkit.check_access('deactivate_users_bulk', context, data_dict)
+
+    ids = _user_ids(data_dict)
+    current = model.User.get(context.get('user') or '')
+    if current and (current.id in ids or current.name in ids):
+        raise logic.ValidationError(
+            {'ids': ['You cannot deactivate yourself']}
+        )
+
+    return _set_users_state(ids, model.State.ACTIVE, model.State.DELETED)
+
+
+def _user_ids(data_dict):
+    ids = data_dict.get('ids')
+    if isinstance(ids, str):
+        ids = ids.split(',')
+    if not isinstance(ids, list):
+        ids = []
+    ids = list(dict.fromkeys(
+        str(user_id).strip() for user_id in ids if str(user_id).strip()
+    ))
+    if not ids:
+        raise logic.ValidationError({'ids': ['Missing value']})
+    return ids
+
+
+def _set_users_state(ids, from_state, to_state):
+    """Move the users with these ids or names from `from_state` to
+    `to_state` with a single UPDATE and commit. Deleted users also lose
+    their memberships and dataset collaborations."""
+    users = model.user_table
+    updated = model.Session.execute(
+        users.update().where(
+            or_(users.c.id.in_(ids), users.c.name.in_(ids)),
+            users.c.state == from_state,
+        ).values(state=to_state).returning(users.c.id, users.c.name)
+    ).fetchall()
+
+    if to_state == model.State.DELETED and updated:
+        user_ids = [row.id for row in updated]
+        members = model.member_table
+        model.Session.execute(
+            members.update().where(
+                members.c.table_name == 'user',
+                members.c.table_id.in_(user_ids),
+                members.c.state == model.State.ACTIVE,
+            ).values(state=model.State.DELETED)
+        )
+        collaborators = model.package_member_table
+        model.Session.execute(
+            collaborators.delete().where(
+                collaborators.c.user_id.in_(user_ids)
+            )
+        )
+    model.Session.commit()
+
+    found = {row.id for row in updated} | {row.name for row in updated}
+    return {
+        'updated': len(updated),
+        'users': [{'id': row.id, 'name': row.name} for row in updated],
+        'not_updated': [user_id for user_id in ids if user_id not in found],
+    }
+
+
+# Sections of the user org roles page, in display order, with the
+# category number `_user_category` gives their users.
+USER_ORG_ROLES_SECTIONS = {
+    'sysadmins': 0,
+    'users-with-organizations': 1,
+    'users-without-organizations': 2,
+    'deleted-users': 3,
+}
+
+USER_ORG_ROLES_SORT_FIELDS = ('name', 'email', 'last_active', 'organization')
+
+# how many users iter_user_org_roles fetches from the database at a time
+USER_ORG_ROLES_BATCH_SIZE = 1000
+
+# Cached user_org_roles results live under the current generation, which
+# is bumped whenever a user, organization or membership changes.
+USER_ORG_ROLES_GENERATION_KEY = 'datagov_inventory:user_org_roles:generation'
+USER_ORG_ROLES_CACHE_KEY = 'datagov_inventory:user_org_roles:{}:{}'
+USER_ORG_ROLES_CACHE_TTL = 300
+
+# Actions that change what user_org_roles returns.
+USER_ORG_ROLES_CHANGING_ACTIONS = (
+    'user_create',
+    'user_update',
+    'user_patch',
+    'user_delete',
+    'user_invite',
+    'create_inventory_user',
+    'create_inventory_users_bulk',
+    'reactivate_user',
+    'reactivate_users_bulk',
+    'deactivate_users_bulk',
+    'organization_create',
+    'organization_update',
+    'organization_patch',
+    'organization_delete',
+    'organization_purge',
+    'organization_member_create',
+    'organization_member_delete',
+    'member_create',
+    'member_delete',
+)
+
+
 @toolkit.side_effect_free
 def user_org_roles(context, data_dict):
-    """Return users with organization roles, grouped by catagories."""
+    """Return users with organization roles, grouped by catagories.
+
+    Users are ordered by category (active sysadmins, active users with
+    organization roles, active users without, deleted users) and then by
+    `sort` within each category.
+
+    :param section: only return users in this section of the user org
+        roles page (optional)
+    :type section: string
+    :param q: only return users whose name, full name or email contains
+        this (optional)
+    :type q: string
+    :param sort: field and direction to sort users by within each
+        category: ``name``, ``email``, ``last_active`` or ``organization``
+        (the first organization's name), then ``asc`` or ``desc``
+        (optional, default: ``name asc``)
+    :type sort: string
+    :param limit: the maximum number of users to return (optional)
+    :type limit: int
+    :param offset: the number of users to skip (optional)
+    :type offset: int
+
+    Results are cached in redis until a user, organization or membership
+    changes through the action API, or for
+    ``ckanext.datagov_inventory.user_org_roles.cache_ttl`` seconds, so
+    ``last_active`` may lag behind by that long.
+    """
     toolkit.check_access('user_org_roles', context, data_dict)
 
-    org_roles_by_user = _org_roles_by_user()
-    users = model.Session.query(model.User).filter(
-        model.User.state.in_([model.State.ACTIVE, model.State.DELETED])
-    ).all()
-
-    result = []
-    for user in users:
-        organizations = sorted(
-            org_roles_by_user.get(user.id, []),
-            key=lambda org: (org['name'] or '').lower()
-        )
-        result.append({
-            'id': user.id,
-            'name': user.name,
-            'fullname': user.fullname,
-            'email': user.email,
-            'last_active': _format_datetime(user.last_active),
-            'state': user.state,
-            'sysadmin': user.sysadmin,
-            'organizations': organizations,
-        })
+    params = {
+        'section': data_dict.get('section') or None,
+        'q': (data_dict.get('q') or '').strip(),
+        'sort': data_dict.get('sort') or None,
+        'limit': _natural_number(data_dict, 'limit'),
+        'offset': _natural_number(data_dict, 'offset'),
+    }
+    return _cached_user_org_roles(
+        'users', params, lambda: _user_org_roles(**params)
+    )
 
-    return sorted(result, key=_user_sort_key)
 
+def _user_org_roles(section, q, sort, limit, offset):
+    query = _user_org_roles_select(
+        section, q, _user_org_roles_order_by(sort)
+    )
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+
+    return [
+        _user_org_roles_dict(user, user_organizations)
+        for user, user_organizations in query
+    ]
+
+
+def iter_user_org_roles(section=None, q=None, sort=None,
+                        batch_size=USER_ORG_ROLES_BATCH_SIZE):
+    """Yield the users `user_org_roles` would return, without caching and
+    without holding them all in memory.
+
+    The arguments are validated straight away, but the query only runs
+    once iteration starts, fetching `batch_size` users at a time from a
+    server-side cursor. Callers must already have checked access to
+    `user_org_roles`.
+    """
+    order_by = _user_org_roles_order_by(sort)
+    _user_org_roles_section_category(section)
+    return _iter_user_org_roles(section, q, order_by, batch_size)
+
+
+def _iter_user_org_roles(section, q, order_by, batch_size):
+    query = _user_org_roles_select(section, q, order_by)
+    for user, user_organizations in query.yield_per(batch_size):
+        yield _user_org_roles_dict(user, user_organizations)
+
+
+def _user_org_roles_select(section, q, order_by):
+    organizations = _org_roles_subquery()
+    category = _user_category(organizations)
+    return _user_org_roles_query(
+        model.Session.query(
+            model.User, organizations.c.organizations
+        ).outerjoin(organizations, organizations.c.user_id == model.User.id),
+        category,
+        {'section': section, 'q': q},
+    ).order_by(category, *order_by(organizations))
+
+
+def _user_org_roles_dict(user, user_organizations):
+    return {
+        'id': user.id,
+        'name': user.name,
+        'fullname': user.fullname,
+        'email': user.email,
+        'last_active': _format_datetime(user.last_active),
+        'state': user.state,
+        'sysadmin': user.sysadmin,
+        'organizations': [
+            {
+                'id': organization['id'],
+                'name': organization['name'],
+                'title': organization['title'],
+                'role': organization['role'],
+            }
+            for organization in user_organizations or []
+        ],
+    }
 
-def _format_datetime(value):
-    if not value:
-        return ''
-    return value.replace(microsecond=0).isoformat(sep=' ')
 
+def user_org_roles_counts(q=None):
+    """Count the users and table rows (one per organization role, or one
+    for a user without any) in each section of the user org roles page.
 
-def _org_roles_by_user():
+    Callers must already have checked access to `user_org_roles`.
     """
-    Retrieve a dictionary mapping user IDs to their roles within organizations.
+    q = (q or '').strip()
+    return _cached_user_org_roles(
+        'counts', {'q': q}, lambda: _user_org_roles_counts(q)
+    )
+
+
+def _user_org_roles_counts(q):
+    organizations = _org_roles_subquery()
+    category = _user_category(organizations)
+    query = _user_org_roles_query(
+        model.Session.query(
+            category,
+            func.count(model.User.id),
+            func.sum(func.coalesce(organizations.c.organization_count, 1)),
+        ).outerjoin(organizations, organizations.c.user_id == model.User.id),
+        category,
+        {'q': q},
+    ).group_by(category)
+
+    counts = {
+        section: {'users': 0, 'rows': 0}
+        for section in USER_ORG_ROLES_SECTIONS
+    }
+    sections = {value: key for key, value in USER_ORG_ROLES_SECTIONS.items()}
+    for user_category, users, rows in query:
+        counts[sections[user_category]] = {'users': users, 'rows': int(rows)}
+    return counts
+
+
+def user_org_roles_cache_ttl():
+    """How long user_org_roles results are cached for; 0 disables the
+    cache."""
+    return toolkit.asint(toolkit.config.get(
+        'ckanext.datagov_inventory.user_org_roles.cache_ttl',
+        USER_ORG_ROLES_CACHE_TTL
+    ))
+
+
+def invalidate_user_org_roles_cache(sender=None, **kwargs):
+    """Drop every cached user_org_roles result.
+
+    Also works as a signal receiver. Entries of older generations are
+    never read again and expire on their own.
     """
-    org_roles_by_user = {}
-    query = model.Session.query(model.Member, model.Group).join(
+    redis.connect_to_redis().incr(USER_ORG_ROLES_GENERATION_KEY)
+
+
+def _cached_user_org_roles(kind, params, load):
+    ttl = user_org_roles_cache_ttl()
+    if not ttl:
+        return load()
+
+    conn = redis.connect_to_redis()
+    # read the generation before loading, so a change made while loading
+    # leaves the result under a generation that is already stale
+    generation = int(conn.get(USER_ORG_ROLES_GENERATION_KEY) or 0)
+    key = USER_ORG_ROLES_CACHE_KEY.format(generation, hashlib.sha256(
+        json.dumps([kind, params], sort_keys=True).encode('utf-8')
+    ).hexdigest())
+
+    cached = conn.get(key)
+    if cached is not None:
+        return json.loads(cached)
+    result = load()
+    conn.set(key, json.dumps(result), ex=ttl)
+    return result
+
+
+def _org_roles_subquery():
+    """Each user's active organization roles, ordered by organization
+    name, as one row per user."""
+    return model.Session.query(
+        model.Member.table_id.label('user_id'),
+        func.array_agg(aggregate_order_by(
+            func.json_build_object(
+                'id', model.Group.id,
+                'name', model.Group.name,
+                'title', model.Group.title,
+                'role', model.Member.capacity,
+            ),
+            _lower_name(model.Group.name),
+        )).label('organizations'),
+        func.min(_lower_name(model.Group.name)).label('first_organization'),
+        func.count(model.Member.id).label('organization_count'),
+    ).join(
         model.Group,
         model.Member.group_id == model.Group.id
     ).filter(
@@ -118,35 +542,99 @@ def _org_roles_by_user():
         model.Member.state == 'active',
         model.Group.state == 'active',
         model.Group.is_organization.is_(True),
+    ).group_by(model.Member.table_id).subquery()
+
+
+def _user_category(organizations):
+    """The display category of a user, see `USER_ORG_ROLES_SECTIONS`."""
+    return case(
+        (model.User.state == model.State.DELETED, 3),
+        (model.User.sysadmin.is_(True), 0),
+        (organizations.c.user_id.isnot(None), 1),
+        else_=2,
     )
 
-    for member, organization in query:
-        org_roles_by_user.setdefault(member.table_id, []).append({
-            'id': organization.id,
-            'name': organization.name,
-            'title': organization.title,
-            'role': member.capacity,
-        })
 
-    return org_roles_by_user
+def _user_org_roles_query(query, category, data_dict):
+    query = query.filter(
+        model.User.state.in_([model.State.ACTIVE, model.State.DELETED])
+    )
 
+    section_category = _user_org_roles_section_category(
+        data_dict.get('section')
+    )
+    if section_category is not None:
+        query = query.filter(category == section_category)
 
-def _user_sort_key(user):
-    """Sort users by display category, then by username within each category.
+    q = (data_dict.get('q') or '').strip()
+    if q:
+        pattern = '%{}%'.format(
+            q.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        )
+        query = query.filter(or_(
+            model.User.name.ilike(pattern),
+            model.User.fullname.ilike(pattern),
+            model.User.email.ilike(pattern),
+        ))
+    return query
+
+
+def _user_org_roles_section_category(section):
+    if not section:
+        return None
+    if section not in USER_ORG_ROLES_SECTIONS:
+        raise logic.ValidationError({'section': [
+            'Must be one of: {}'.format(', '.join(USER_ORG_ROLES_SECTIONS))
+        ]})
+    return USER_ORG_ROLES_SECTIONS[section]
+
+
+def _user_org_roles_order_by(sort):
+    """Return a function giving the ORDER BY clauses for `sort` given the
+    organizations subquery."""
+    field, _, direction = (sort or 'name asc').strip().partition(' ')
+    direction = direction.strip() or 'asc'
+    if (field not in USER_ORG_ROLES_SORT_FIELDS
+            or direction not in ('asc', 'desc')):
+        raise logic.ValidationError({'sort': [
+            'Must be one of {} followed by asc or desc'.format(
+                ', '.join(USER_ORG_ROLES_SORT_FIELDS)
+            )
+        ]})
+
+    def order_by(organizations):
+        column = {
+            'name': _lower_name(model.User.name),
+            'email': _lower_name(model.User.email),
+            'last_active': model.User.last_active,
+            'organization': organizations.c.first_organization,
+        }[field]
+        column = column.desc() if direction == 'desc' else column.asc()
+        # users without a value always go last, then ties by name
+        return [column.nullslast(), _lower_name(model.User.name)]
+
+    return order_by
+
+
+def _lower_name(column):
+    """Lower case `column` for sorting the way Python sorts strings."""
+    return func.lower(func.coalesce(column, '')).collate('C')
+
+
+def _natural_number(data_dict, key):
+    value = data_dict.get(key)
+    if value is None or value == '':
+        return None
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        value = -1
+    if value < 0:
+        raise logic.ValidationError({key: ['Must be a natural number']})
+    return value
 
-    The category order is:
-    1. active sysadmins
-    2. active users with at least one organization role
-    3. active users without organization roles
-    4. deleted users
-    """
-    if user['state'] == model.State.DELETED:
-        group = 3
-    elif user['sysadmin']:
-        group = 0
-    elif user['organizations']:
-        group = 1
-    else:
-        group = 2
-
-    return (group, (user['name'] or '').lower())
+
+def _format_datetime(value):
+    if not value:
+        return ''
+    return value.replace(microsecond=0).isoformat(sep=' ')
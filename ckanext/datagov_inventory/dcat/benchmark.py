@@ -0,0 +1,427 @@
+"""Benchmark the DCAT-US v1.1 to v3.0 export pipeline.
+
+Builds synthetic v1.1 catalogs of the requested sizes and times each step
+of the export: every dataset transform, the whole conversion, v3.0
+validation and writing the zip. Each size runs in a fresh process so its
+peak RSS is its own. Results are written as JSON, tagged with the git
+commit, so runs on different commits can be compared with ``--compare``.
+
+    python -m ckanext.datagov_inventory.dcat.benchmark -s 1000,10000
+"""
+import copy
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import click
+
+from . import dcat_converter, transforms, validator
+
+
+DEFAULT_SIZES = "1000,10000,100000"
+RESULTS_FORMAT_VERSION = 1
+
+MODIFIED_VALUES = [
+    "2024-01-15",
+    "2023-05-05T08:00:00Z",
+    "2021-06-01T12:30:00-05:00",
+    "R/P1M",
+    "R/P1Y",
+]
+TEMPORAL_VALUES = [
+    "2020-01-01/2025-12-31",
+    "2020-01-01T10:00:00Z/2021-01-01T10:00:00Z",
+    "2019-03-01/..",
+    "R/2020-01-01/P1Y",
+    "2018-01-01/P2Y",
+    None,
+]
+SPATIAL_VALUES = [
+    "United States",
+    "Washington, DC",
+    "-77.1,38.8,-76.9,39.0",
+    {"type": "Point", "coordinates": [-77.03, 38.9]},
+    None,
+]
+LANGUAGE_VALUES = [
+    ["en-US"],
+    ["en"],
+    ["English"],
+    ["en-US", "es"],
+    ["es-MX", "Spanish", "fr"],
+    None,
+]
+ACCESS_LEVELS = ["public", "public", "restricted public", "non-public"]
+FORMATS = [
+    ("text/csv", "CSV"),
+    ("application/json", "JSON"),
+    ("application/zip", "ZIP"),
+    ("application/pdf", "PDF"),
+]
+LICENSE = "https://creativecommons.org/publicdomain/zero/1.0/"
+
+# one in this many datasets gets a value that fails v3.0 validation
+INVALID_EVERY = 20
+
+
+def generate_catalog(size: int, seed: int = 0,
+                     max_distributions: int = 5) -> dict:
+    """Return a DCAT-US v1.1 catalog of `size` synthetic datasets.
+
+    The same `size` and `seed` always give the same catalog. Datasets mix
+    the date, temporal, spatial and language forms the transforms handle,
+    carry 0 to `max_distributions` distributions, and a few of them are
+    invalid.
+    """
+    rng = random.Random(seed)
+    return {
+        "@type": "dcat:Catalog",
+        "@context": (
+            "https://project-open-data.cio.gov/v1.1/schema/catalog.jsonld"
+        ),
+        "conformsTo": "https://project-open-data.cio.gov/v1.1/schema",
+        "describedBy": (
+            "https://project-open-data.cio.gov/v1.1/schema/catalog.json"
+        ),
+        "modified": "2024-01-15T10:30:00",
+        "dataset": [
+            generate_dataset(rng, i, max_distributions) for i in range(size)
+        ],
+    }
+
+
+def generate_dataset(rng: random.Random, index: int,
+                     max_distributions: int = 5) -> dict:
+    identifier = f"benchmark-{index:07d}"
+    dataset = {
+        "@type": "dcat:Dataset",
+        "identifier": identifier,
+        "title": f"Benchmark dataset {index}",
+        "description": " ".join(
+            rng.choice(["agency", "data", "survey", "annual", "county",
+                        "records", "program", "statistics"])
+            for _ in range(rng.randint(8, 40))
+        ),
+        "keyword": [f"keyword-{rng.randint(0, 500)}" for _ in range(3)],
+        "modified": rng.choice(MODIFIED_VALUES),
+        "issued": "2020-01-01",
+        "accessLevel": rng.choice(ACCESS_LEVELS),
+        "bureauCode": ["015:11"],
+        "programCode": ["015:001"],
+        "license": LICENSE,
+        "rights": "This data is in the public domain.",
+        "landingPage": f"https://example.gov/datasets/{identifier}",
+        "conformsTo": "https://example.gov/standard",
+        "describedBy": "https://example.gov/schema.json",
+        "describedByType": "application/schema+json",
+        "publisher": {
+            "@type": "org:Organization",
+            "name": "Benchmark Office",
+            "subOrganizationOf": {
+                "@type": "org:Organization",
+                "name": "Benchmark Agency",
+                "subOrganizationOf": {
+                    "@type": "org:Organization",
+                    "name": "Benchmark Department",
+                },
+            },
+        },
+        "contactPoint": {
+            "@type": "vcard:Contact",
+            "fn": "Jane Doe",
+            "hasEmail": "mailto:jane.doe@example.gov",
+        },
+        "distribution": [
+            generate_distribution(rng, identifier, i)
+            for i in range(rng.randint(0, max_distributions))
+        ],
+    }
+    for key, values in (
+        ("temporal", TEMPORAL_VALUES),
+        ("spatial", SPATIAL_VALUES),
+        ("language", LANGUAGE_VALUES),
+    ):
+        value = rng.choice(values)
+        if value is not None:
+            dataset[key] = copy.deepcopy(value)
+    if index % INVALID_EVERY == INVALID_EVERY - 1:
+        del dataset["title"]
+    return dataset
+
+
+def generate_distribution(rng: random.Random, identifier: str,
+                          index: int) -> dict:
+    media_type, title = rng.choice(FORMATS)
+    url = f"https://example.gov/files/{identifier}/{index}"
+    distribution = {
+        "@type": "dcat:Distribution",
+        "title": f"{title} file {index}",
+        "mediaType": media_type,
+        "format": title,
+        "describedBy": "https://example.gov/dictionary.csv",
+        "conformsTo": "https://example.gov/standard",
+    }
+    if rng.random() < 0.5:
+        distribution["downloadURL"] = url
+    else:
+        distribution["accessURL"] = url
+    return distribution
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def benchmark_catalog(catalog: dict, workers: int = 1) -> dict:
+    """Time each step of the export of `catalog`, in seconds."""
+    datasets = catalog["dataset"]
+
+    copies, copy_seconds = _timed(copy.deepcopy, datasets)
+    transform_seconds = {}
+    for transform in transforms.DATASET_TRANSFORMS:
+        start = time.perf_counter()
+        for dataset in copies:
+            try:
+                transform(dataset, in_place=True)
+            except Exception:
+                pass
+        transform_seconds[transform.__name__] = (
+            time.perf_counter() - start
+        )
+
+    (converted, conversion_errors), convert_seconds = _timed(
+        dcat_converter.convert_dcat_catalog, catalog, fused=True,
+        workers=workers
+    )
+    validation_errors, validate_seconds = _timed(
+        validator.validate_v3_0_catalog, converted, workers=workers
+    )
+    zip_data, zip_seconds = _timed(
+        lambda: b"".join(validator.iter_export_zip(
+            converted, conversion_errors, validation_errors
+        ))
+    )
+
+    export_seconds = convert_seconds + validate_seconds + zip_seconds
+    return {
+        "datasets": len(datasets),
+        "distributions": sum(
+            len(dataset.get("distribution", [])) for dataset in datasets
+        ),
+        "conversion_errors": len(conversion_errors),
+        "validation_errors": len(validation_errors),
+        "zip_bytes": len(zip_data),
+        "seconds": {
+            "deepcopy": copy_seconds,
+            "transforms": transform_seconds,
+            "convert": convert_seconds,
+            "validate": validate_seconds,
+            "zip": zip_seconds,
+            "export": export_seconds,
+        },
+        "datasets_per_second": (
+            len(datasets) / export_seconds if export_seconds else None
+        ),
+    }
+
+
+def run_size(size: int, seed: int = 0, workers: int = 1) -> dict:
+    """Generate and benchmark a catalog of `size` datasets, reporting the
+    peak RSS of the current process."""
+    catalog, generate_seconds = _timed(generate_catalog, size, seed)
+    result = benchmark_catalog(catalog, workers=workers)
+    result["seconds"]["generate"] = generate_seconds
+    result["size"] = size
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    if sys.platform == "darwin":
+        peak /= 1024
+    return round(peak / 1024, 1)
+
+
+def run_benchmarks(sizes: list, seed: int = 0, workers: int = 1) -> dict:
+    """Benchmark each size in a fresh process and return the results with
+    details of the environment they were measured in."""
+    results = []
+    for size in sizes:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results.append(
+                executor.submit(run_size, size, seed, workers).result()
+            )
+    return {
+        "format": RESULTS_FORMAT_VERSION,
+        "commit": _git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "workers": workers,
+        "results": results,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(baseline: dict, current: dict) -> list:
+    """Return `(size, metric, baseline, current, change)` rows for the
+    sizes both runs measured, where `change` is current / baseline."""
+    baseline_by_size = {
+        result["size"]: result for result in baseline["results"]
+    }
+    rows = []
+    for result in current["results"]:
+        previous = baseline_by_size.get(result["size"])
+        if previous is None:
+            continue
+        for metric, before, after in _comparable_metrics(previous, result):
+            change = (
+                after / before if before and after is not None else None
+            )
+            rows.append((result["size"], metric, before, after, change))
+    return rows
+
+
+def _comparable_metrics(before: dict, after: dict):
+    for key in ("convert", "validate", "zip", "export"):
+        yield (
+            f"{key}_seconds", before["seconds"][key], after["seconds"][key]
+        )
+    for name, seconds in after["seconds"]["transforms"].items():
+        if name in before["seconds"]["transforms"]:
+            yield (
+                f"{name}_seconds",
+                before["seconds"]["transforms"][name],
+                seconds,
+            )
+    yield "peak_rss_mb", before["peak_rss_mb"], after["peak_rss_mb"]
+    yield (
+        "datasets_per_second",
+        before["datasets_per_second"],
+        after["datasets_per_second"],
+    )
+
+
+def _format_number(value, spec: str) -> str:
+    """Format `value` with `spec`, or as ``n/a`` if there is none, as
+    for the throughput of an empty run."""
+    return "n/a" if value is None else format(value, spec)
+
+
+def _echo_results(results: dict) -> None:
+    for result in results["results"]:
+        seconds = result["seconds"]
+        throughput = _format_number(result["datasets_per_second"], ".0f")
+        click.echo(
+            f"{result['size']} datasets: "
+            f"{throughput} datasets/s, "
+            f"convert {seconds['convert']:.2f}s, "
+            f"validate {seconds['validate']:.2f}s, "
+            f"zip {seconds['zip']:.2f}s, "
+            f"peak RSS {result['peak_rss_mb']} MB"
+        )
+        for name, transform_seconds in seconds["transforms"].items():
+            click.echo(f"    {name}: {transform_seconds:.3f}s")
+
+
+def _echo_comparison(rows: list) -> None:
+    for size, metric, before, after, change in rows:
+        before = _format_number(before, ".3f")
+        after = _format_number(after, ".3f")
+        change = f"{change:.2f}x" if change is not None else "n/a"
+        click.echo(
+            f"{size:>8} {metric:<40} {before:>12} {after:>12} "
+            f"{change:>8}"
+        )
+
+
+def _parse_sizes(ctx, param, value):
+    try:
+        sizes = [int(size) for size in value.split(",") if size.strip()]
+    except ValueError:
+        raise click.BadParameter("must be comma separated numbers")
+    if not sizes or min(sizes) < 1:
+        raise click.BadParameter("must be comma separated numbers")
+    return sizes
+
+
+@click.command()
+@click.option(
+    "-s", "--sizes",
+    help="Comma separated numbers of datasets to benchmark",
+    default=DEFAULT_SIZES,
+    show_default=True,
+    callback=_parse_sizes
+)
+@click.option(
+    "-o", "--output",
+    help="File to write the JSON results to",
+    type=click.Path(dir_okay=False),
+    default=None
+)
+@click.option(
+    "--seed",
+    help="Seed for the synthetic catalogs",
+    type=int,
+    default=0,
+    show_default=True
+)
+@click.option(
+    "-w", "--workers",
+    help="Number of processes to convert and validate datasets with",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True
+)
+@click.option(
+    "-c", "--compare",
+    help="JSON results of an earlier run to compare against",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None
+)
+def main(sizes, output, seed, workers, compare):
+    """Benchmark the DCAT-US v1.1 to v3.0 export pipeline."""
+    results = run_benchmarks(sizes, seed=seed, workers=workers)
+    _echo_results(results)
+
+    if output is None:
+        commit = (results["commit"] or "unknown")[:12]
+        output = f"dcat-benchmark-{commit}.json"
+    Path(output).write_text(json.dumps(results, indent=2))
+    click.echo(f"Wrote {output}")
+
+    if compare:
+        baseline = json.loads(Path(compare).read_text())
+        click.echo(f"Compared to {compare} ({baseline.get('commit')}):")
+        _echo_comparison(compare_results(baseline, results))
+
+
+if __name__ == "__main__":
+    main()
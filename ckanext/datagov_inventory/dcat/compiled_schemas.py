@@ -0,0 +1,9694 @@
+"""DCAT-US schemas compiled to Python by `schema_compiler`.
+
+Generated by ``python -m ckanext.datagov_inventory.dcat.schema_compiler``;
+do not edit.
+"""
+# flake8: noqa
+import numbers
+import re
+
+from jsonschema import Draft202012Validator
+from jsonschema._utils import equal, uniq
+
+conforms = Draft202012Validator.FORMAT_CHECKER.conforms
+
+_C0 = frozenset(['dcat:Catalog'])
+_C1 = frozenset(['https://project-open-data.cio.gov/v1.1/schema'])
+_C2 = frozenset(['non-public', 'public', 'restricted public'])
+_C3 = re.compile('^R\\/P(?:\\d+(?:\\.\\d+)?Y)?(?:\\d+(?:\\.\\d+)?M)?(?:\\d+(?:\\.\\d+)?W)?(?:\\d+(?:\\.\\d+)?D)?(?:T(?:\\d+(?:\\.\\d+)?H)?(?:\\d+(?:\\.\\d+)?M)?(?:\\d+(?:\\.\\d+)?S)?)?$')
+_C4 = re.compile('^(\\[\\[REDACTED).*?(\\]\\])$')
+_C5 = re.compile('[0-9]{3}:[0-9]{2}')
+_C6 = re.compile("^mailto:[\\w\\_\\~\\!\\$\\&\\'\\(\\)\\*\\+\\,\\;\\=\\:.-]+@[\\w.-]+\\.[\\w.-]+?$")
+_C7 = re.compile('^[-\\w]+/[-\\w]+(\\.[-\\w]+)*([+][-\\w]+)?$')
+_C8 = re.compile('^([\\+-]?\\d{4}(?!\\d{2}\\b))((-?)((0[1-9]|1[0-2])(\\3([12]\\d|0[1-9]|3[01]))?|W([0-4]\\d|5[0-2])(-?[1-7])?|(00[1-9]|0[1-9]\\d|[12]\\d{2}|3([0-5]\\d|6[1-6])))([T\\s]((([01]\\d|2[0-3])((:?)[0-5]\\d)?|24\\:?00)([\\.,]\\d+(?!:))?)?(\\17[0-5]\\d([\\.,]\\d+)?)?([zZ]|([\\+-])([01]\\d|2[0-3]):?([0-5]\\d)?)?)?)?$')
+_C9 = re.compile('^(((([A-Za-z]{2,3}(-([A-Za-z]{3}(-[A-Za-z]{3}){0,2}))?)|[A-Za-z]{4}|[A-Za-z]{5,8})(-([A-Za-z]{4}))?(-([A-Za-z]{2}|[0-9]{3}))?(-([A-Za-z0-9]{5,8}|[0-9][A-Za-z0-9]{3}))*(-([0-9A-WY-Za-wy-z](-[A-Za-z0-9]{2,8})+))*(-(x(-[A-Za-z0-9]{1,8})+))?)|(x(-[A-Za-z0-9]{1,8})+)|((en-GB-oed|i-ami|i-bnn|i-default|i-enochian|i-hak|i-klingon|i-lux|i-mingo|i-navajo|i-pwn|i-tao|i-tay|i-tsu|sgn-BE-FR|sgn-BE-NL|sgn-CH-DE)|(art-lojban|cel-gaulish|no-bok|no-nyn|zh-guoyu|zh-hakka|zh-min|zh-min-nan|zh-xiang)))$')
+_C10 = re.compile('^(R\\d*\\/)?P(?:\\d+(?:\\.\\d+)?Y)?(?:\\d+(?:\\.\\d+)?M)?(?:\\d+(?:\\.\\d+)?W)?(?:\\d+(?:\\.\\d+)?D)?(?:T(?:\\d+(?:\\.\\d+)?H)?(?:\\d+(?:\\.\\d+)?M)?(?:\\d+(?:\\.\\d+)?S)?)?$')
+_C11 = re.compile('^(R\\d*\\/)?([\\+-]?\\d{4}(?!\\d{2}\\b))((-?)((0[1-9]|1[0-2])(\\4([12]\\d|0[1-9]|3[01]))?|W([0-4]\\d|5[0-2])(-?[1-7])?|(00[1-9]|0[1-9]\\d|[12]\\d{2}|3([0-5]\\d|6[1-6])))([T\\s]((([01]\\d|2[0-3])((:?)[0-5]\\d)?|24\\:?00)([\\.,]\\d+(?!:))?)?(\\18[0-5]\\d([\\.,]\\d+)?)?([zZ]|([\\+-])([01]\\d|2[0-3]):?([0-5]\\d)?)?)?)?(\\/)P(?:\\d+(?:\\.\\d+)?Y)?(?:\\d+(?:\\.\\d+)?M)?(?:\\d+(?:\\.\\d+)?W)?(?:\\d+(?:\\.\\d+)?D)?(?:T(?:\\d+(?:\\.\\d+)?H)?(?:\\d+(?:\\.\\d+)?M)?(?:\\d+(?:\\.\\d+)?S)?)?$')
+_C12 = re.compile('[0-9]{3}-[0-9]{9}')
+_C13 = re.compile('[0-9]{3}:[0-9]{3}')
+_C14 = frozenset(['org:Organization'])
+_C15 = re.compile('^([\\+-]?\\d{4}(?!\\d{2}\\b))((-?)((0[1-9]|1[0-2])(\\3([12]\\d|0[1-9]|3[01]))?|W([0-4]\\d|5[0-2])(-?[1-7])?|(00[1-9]|0[1-9]\\d|[12]\\d{2}|3([0-5]\\d|6[1-6])))([T\\s]((([01]\\d|2[0-3])((:?)[0-5]\\d)?|24\\:?00)([\\.,]\\d+(?!:))?)?(\\17[0-5]\\d([\\.,]\\d+)?)?([zZ]|([\\+-])([01]\\d|2[0-3]):?([0-5]\\d)?)?)?)?(\\/)([\\+-]?\\d{4}(?!\\d{2}\\b))((-?)((0[1-9]|1[0-2])(\\3([12]\\d|0[1-9]|3[01]))?|W([0-4]\\d|5[0-2])(-?[1-7])?|(00[1-9]|0[1-9]\\d|[12]\\d{2}|3([0-5]\\d|6[1-6])))([T\\s]((([01]\\d|2[0-3])((:?)[0-5]\\d)?|24\\:?00)([\\.,]\\d+(?!:))?)?(\\17[0-5]\\d([\\.,]\\d+)?)?([zZ]|([\\+-])([01]\\d|2[0-3]):?([0-5]\\d)?)?)?)?$')
+_C16 = re.compile('^(R\\d*\\/)?P(?:\\d+(?:\\.\\d+)?Y)?(?:\\d+(?:\\.\\d+)?M)?(?:\\d+(?:\\.\\d+)?W)?(?:\\d+(?:\\.\\d+)?D)?(?:T(?:\\d+(?:\\.\\d+)?H)?(?:\\d+(?:\\.\\d+)?M)?(?:\\d+(?:\\.\\d+)?S)?)?\\/([\\+-]?\\d{4}(?!\\d{2}\\b))((-?)((0[1-9]|1[0-2])(\\4([12]\\d|0[1-9]|3[01]))?|W([0-4]\\d|5[0-2])(-?[1-7])?|(00[1-9]|0[1-9]\\d|[12]\\d{2}|3([0-5]\\d|6[1-6])))([T\\s]((([01]\\d|2[0-3])((:?)[0-5]\\d)?|24\\:?00)([\\.,]\\d+(?!:))?)?(\\18[0-5]\\d([\\.,]\\d+)?)?([zZ]|([\\+-])([01]\\d|2[0-3]):?([0-5]\\d)?)?)?)?$')
+_C17 = re.compile('^[0-9]{4}$')
+_C18 = re.compile('^[0-9]{4}-[0-9]{2}$')
+_C19 = frozenset(['annually', 'asNeeded', 'biannually', 'continual', 'daily', 'fortnightly', 'irregular', 'monthly', 'notPlanned', 'quarterly', 'unknown', 'weekly'])
+_C20 = re.compile('^R/P.+$')
+_C21 = frozenset(['annual', 'biennial', 'bimonthly', 'biweekly', 'continuous', 'daily', 'irregular', 'monthly', 'quarterly', 'semiannual', 'semimonthly', 'semiweekly', 'threeTimesAMonth', 'threeTimesAWeek', 'threeTimesAYear', 'triennial', 'weekly'])
+
+
+def _v0(x):
+    # https://project-open-data.cio.gov/v1.1/schema/catalog.json#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and ('@context' not in x):
+            return False
+    if isinstance(x, dict) and ('conformsTo' not in x or 'dataset' not in x):
+        return False
+    if isinstance(x, dict):
+        if '@context' in x and not _v1(x['@context']):
+            return False
+        if '@id' in x and not _v2(x['@id']):
+            return False
+        if '@type' in x and not _v3(x['@type']):
+            return False
+        if 'conformsTo' in x and not _v4(x['conformsTo']):
+            return False
+        if 'describedBy' in x and not _v5(x['describedBy']):
+            return False
+        if 'dataset' in x and not _v6(x['dataset']):
+            return False
+    return True
+
+
+def _v1(x):
+    # https://project-open-data.cio.gov/v1.1/schema/catalog.json#/properties/@context
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v2(x):
+    # https://project-open-data.cio.gov/v1.1/schema/catalog.json#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v3(x):
+    # https://project-open-data.cio.gov/v1.1/schema/catalog.json#/properties/@type
+    if not (isinstance(x, str) and x in _C0):
+        return False
+    return True
+
+
+def _v4(x):
+    # https://project-open-data.cio.gov/v1.1/schema/catalog.json#/properties/conformsTo
+    if not (isinstance(x, str) and x in _C1):
+        return False
+    return True
+
+
+def _v5(x):
+    # https://project-open-data.cio.gov/v1.1/schema/catalog.json#/properties/describedBy
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v6(x):
+    # https://project-open-data.cio.gov/v1.1/schema/catalog.json#/properties/dataset
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v7(item):
+                return False
+    return True
+
+
+def _v7(x):
+    # https://project-open-data.cio.gov/v1.1/schema/catalog.json#/properties/dataset/items
+    if not _v8(x):
+        return False
+    return True
+
+
+def _v8(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict) and ('title' not in x or 'description' not in x or 'keyword' not in x or 'modified' not in x or 'publisher' not in x or 'contactPoint' not in x or 'identifier' not in x or 'accessLevel' not in x):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and not _v9(x['@type']):
+            return False
+        if 'accessLevel' in x and not _v10(x['accessLevel']):
+            return False
+        if 'rights' in x and not _v11(x['rights']):
+            return False
+        if 'accrualPeriodicity' in x and not _v14(x['accrualPeriodicity']):
+            return False
+        if 'bureauCode' in x and not _v19(x['bureauCode']):
+            return False
+        if 'contactPoint' in x and not _v24(x['contactPoint']):
+            return False
+        if 'describedBy' in x and not _v31(x['describedBy']):
+            return False
+        if 'describedByType' in x and not _v35(x['describedByType']):
+            return False
+        if 'conformsTo' in x and not _v39(x['conformsTo']):
+            return False
+        if 'dataQuality' in x and not _v43(x['dataQuality']):
+            return False
+        if 'description' in x and not _v47(x['description']):
+            return False
+        if 'distribution' in x and not _v48(x['distribution']):
+            return False
+        if 'identifier' in x and not _v95(x['identifier']):
+            return False
+        if 'issued' in x and not _v96(x['issued']):
+            return False
+        if 'keyword' in x and not _v100(x['keyword']):
+            return False
+        if 'landingPage' in x and not _v104(x['landingPage']):
+            return False
+        if 'language' in x and not _v108(x['language']):
+            return False
+        if 'license' in x and not _v113(x['license']):
+            return False
+        if 'modified' in x and not _v117(x['modified']):
+            return False
+        if 'primaryITInvestmentUII' in x and not _v122(x['primaryITInvestmentUII']):
+            return False
+        if 'programCode' in x and not _v126(x['programCode']):
+            return False
+        if 'publisher' in x and not _v131(x['publisher']):
+            return False
+        if 'references' in x and not _v140(x['references']):
+            return False
+        if 'spatial' in x and not _v147(x['spatial']):
+            return False
+        if 'systemOfRecords' in x and not _v155(x['systemOfRecords']):
+            return False
+        if 'temporal' in x and not _v158(x['temporal']):
+            return False
+        if 'isPartOf' in x and not _v164(x['isPartOf']):
+            return False
+        if 'theme' in x and not _v167(x['theme']):
+            return False
+        if 'title' in x and not _v172(x['title']):
+            return False
+    return True
+
+
+def _v9(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/@type
+    if not (isinstance(x, str) and x == 'dcat:Dataset'):
+        return False
+    return True
+
+
+def _v10(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/accessLevel
+    if not (isinstance(x, str) and x in _C2):
+        return False
+    return True
+
+
+def _v11(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/rights
+    if not (_v12(x) or _v13(x)):
+        return False
+    return True
+
+
+def _v12(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/rights/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    if isinstance(x, str) and len(x) > 255:
+        return False
+    return True
+
+
+def _v13(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/rights/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v14(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/accrualPeriodicity
+    if not (_v15(x) or _v16(x) or _v17(x) or _v18(x)):
+        return False
+    return True
+
+
+def _v15(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/accrualPeriodicity/anyOf/0
+    if not (isinstance(x, str) and x == 'irregular'):
+        return False
+    return True
+
+
+def _v16(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/accrualPeriodicity/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C3.search(x):
+        return False
+    return True
+
+
+def _v17(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/accrualPeriodicity/anyOf/2
+    if not (x is None):
+        return False
+    return True
+
+
+def _v18(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/accrualPeriodicity/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v19(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/bureauCode
+    if not (_v20(x) or _v22(x) or _v23(x)):
+        return False
+    return True
+
+
+def _v20(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/bureauCode/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v21(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    return True
+
+
+def _v21(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/bureauCode/anyOf/0/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C5.search(x):
+        return False
+    return True
+
+
+def _v22(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/bureauCode/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v23(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/bureauCode/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v24(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/contactPoint
+    if not _v25(x):
+        return False
+    return True
+
+
+def _v25(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict) and ('fn' not in x or 'hasEmail' not in x):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and not _v26(x['@type']):
+            return False
+        if 'fn' in x and not _v27(x['fn']):
+            return False
+        if 'hasEmail' in x and not _v28(x['hasEmail']):
+            return False
+    return True
+
+
+def _v26(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/@type
+    if not (isinstance(x, str) and x == 'vcard:Contact'):
+        return False
+    return True
+
+
+def _v27(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/fn
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v28(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/hasEmail
+    if not (_v29(x) or _v30(x)):
+        return False
+    return True
+
+
+def _v29(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/hasEmail/anyOf/0
+    if isinstance(x, str) and not _C6.search(x):
+        return False
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v30(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/hasEmail/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v31(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/describedBy
+    if not (_v32(x) or _v33(x) or _v34(x)):
+        return False
+    return True
+
+
+def _v32(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/describedBy/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v33(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/describedBy/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v34(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/describedBy/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v35(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/describedByType
+    if not (_v36(x) or _v37(x) or _v38(x)):
+        return False
+    return True
+
+
+def _v36(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/describedByType/anyOf/0
+    if isinstance(x, str) and not _C7.search(x):
+        return False
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v37(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/describedByType/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v38(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/describedByType/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v39(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/conformsTo
+    if not (_v40(x) or _v41(x) or _v42(x)):
+        return False
+    return True
+
+
+def _v40(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/conformsTo/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v41(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/conformsTo/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v42(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/conformsTo/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v43(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/dataQuality
+    if not (_v44(x) or _v45(x) or _v46(x)):
+        return False
+    return True
+
+
+def _v44(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/dataQuality/anyOf/0
+    if not (isinstance(x, bool)):
+        return False
+    return True
+
+
+def _v45(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/dataQuality/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v46(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/dataQuality/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v47(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/description
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    if isinstance(x, str) and len(x) > 10000:
+        return False
+    return True
+
+
+def _v48(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/distribution
+    if not (_v49(x) or _v93(x) or _v94(x)):
+        return False
+    return True
+
+
+def _v49(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/distribution/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v50(item):
+                return False
+    return True
+
+
+def _v50(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/distribution/anyOf/0/items
+    if not (_v51(x) or _v92(x)):
+        return False
+    return True
+
+
+def _v51(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/distribution/anyOf/0/items/anyOf/0
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    if not _v52(x):
+        return False
+    return True
+
+
+def _v52(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and not _v53(x['@type']):
+            return False
+        if 'downloadURL' in x and not _v54(x['downloadURL']):
+            return False
+        if 'mediaType' in x and not _v57(x['mediaType']):
+            return False
+        if 'format' in x and not _v61(x['format']):
+            return False
+        if 'accessURL' in x and not _v64(x['accessURL']):
+            return False
+        if 'description' in x and not _v68(x['description']):
+            return False
+        if 'title' in x and not _v72(x['title']):
+            return False
+        if 'conformsTo' in x and not _v76(x['conformsTo']):
+            return False
+        if 'describedBy' in x and not _v80(x['describedBy']):
+            return False
+        if 'describedByType' in x and not _v84(x['describedByType']):
+            return False
+    if isinstance(x, dict):
+        if 'downloadURL' in x and (not _v88(x)):
+            return False
+    return True
+
+
+def _v53(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/@type
+    if not (isinstance(x, str) and x == 'dcat:Distribution'):
+        return False
+    return True
+
+
+def _v54(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/downloadURL
+    if not (_v55(x) or _v56(x)):
+        return False
+    return True
+
+
+def _v55(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/downloadURL/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v56(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/downloadURL/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v57(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/mediaType
+    if not (_v58(x) or _v59(x) or _v60(x)):
+        return False
+    return True
+
+
+def _v58(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/mediaType/anyOf/0
+    if isinstance(x, str) and not _C7.search(x):
+        return False
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v59(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/mediaType/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v60(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/mediaType/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v61(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/format
+    if not (_v62(x) or _v63(x)):
+        return False
+    return True
+
+
+def _v62(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/format/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v63(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/format/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v64(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/accessURL
+    if not (_v65(x) or _v66(x) or _v67(x)):
+        return False
+    return True
+
+
+def _v65(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/accessURL/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v66(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/accessURL/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v67(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/accessURL/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v68(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/description
+    if not (_v69(x) or _v70(x) or _v71(x)):
+        return False
+    return True
+
+
+def _v69(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/description/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    if isinstance(x, str) and len(x) > 10000:
+        return False
+    return True
+
+
+def _v70(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/description/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v71(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/description/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v72(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/title
+    if not (_v73(x) or _v74(x) or _v75(x)):
+        return False
+    return True
+
+
+def _v73(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/title/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v74(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/title/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v75(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/title/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v76(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/conformsTo
+    if not (_v77(x) or _v78(x) or _v79(x)):
+        return False
+    return True
+
+
+def _v77(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/conformsTo/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v78(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/conformsTo/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v79(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/conformsTo/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v80(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedBy
+    if not (_v81(x) or _v82(x) or _v83(x)):
+        return False
+    return True
+
+
+def _v81(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedBy/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v82(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedBy/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v83(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedBy/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v84(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedByType
+    if not (_v85(x) or _v86(x) or _v87(x)):
+        return False
+    return True
+
+
+def _v85(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedByType/anyOf/0
+    if isinstance(x, str) and not _C7.search(x):
+        return False
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v86(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedByType/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v87(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedByType/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v88(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/dependentSchemas/downloadURL
+    if isinstance(x, dict):
+        if 'mediaType' in x and not _v89(x['mediaType']):
+            return False
+    if isinstance(x, dict) and ('mediaType' not in x):
+        return False
+    return True
+
+
+def _v89(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/dependentSchemas/downloadURL/properties/mediaType
+    if not (_v90(x) or _v91(x)):
+        return False
+    return True
+
+
+def _v90(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/dependentSchemas/downloadURL/properties/mediaType/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C7.search(x):
+        return False
+    return True
+
+
+def _v91(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/dependentSchemas/downloadURL/properties/mediaType/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v92(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/distribution/anyOf/0/items/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v93(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/distribution/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v94(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/distribution/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v95(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/identifier
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v96(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/issued
+    if not (_v97(x) or _v98(x) or _v99(x)):
+        return False
+    return True
+
+
+def _v97(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/issued/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C8.search(x):
+        return False
+    return True
+
+
+def _v98(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/issued/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v99(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/issued/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v100(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/keyword
+    if not (_v101(x) or _v103(x)):
+        return False
+    return True
+
+
+def _v101(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/keyword/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v102(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and len(x) > 1000:
+        return False
+    return True
+
+
+def _v102(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/keyword/anyOf/0/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    if isinstance(x, str) and len(x) > 1000:
+        return False
+    return True
+
+
+def _v103(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/keyword/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v104(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/landingPage
+    if not (_v105(x) or _v106(x) or _v107(x)):
+        return False
+    return True
+
+
+def _v105(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/landingPage/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v106(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/landingPage/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v107(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/landingPage/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v108(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/language
+    if not (_v109(x) or _v110(x) or _v111(x)):
+        return False
+    return True
+
+
+def _v109(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/language/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v110(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/language/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v111(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/language/anyOf/2
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v112(item):
+                return False
+    return True
+
+
+def _v112(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/language/anyOf/2/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C9.search(x):
+        return False
+    return True
+
+
+def _v113(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/license
+    if not (_v114(x) or _v115(x) or _v116(x)):
+        return False
+    return True
+
+
+def _v114(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/license/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v115(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/license/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v116(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/license/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v117(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/modified
+    if not (_v118(x) or _v119(x) or _v120(x) or _v121(x)):
+        return False
+    return True
+
+
+def _v118(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/modified/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C8.search(x):
+        return False
+    return True
+
+
+def _v119(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/modified/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C10.search(x):
+        return False
+    return True
+
+
+def _v120(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/modified/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C11.search(x):
+        return False
+    return True
+
+
+def _v121(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/modified/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v122(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/primaryITInvestmentUII
+    if not (_v123(x) or _v124(x) or _v125(x)):
+        return False
+    return True
+
+
+def _v123(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/primaryITInvestmentUII/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C12.search(x):
+        return False
+    return True
+
+
+def _v124(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/primaryITInvestmentUII/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v125(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/primaryITInvestmentUII/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v126(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/programCode
+    if not (_v127(x) or _v129(x) or _v130(x)):
+        return False
+    return True
+
+
+def _v127(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/programCode/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v128(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    return True
+
+
+def _v128(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/programCode/anyOf/0/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C13.search(x):
+        return False
+    return True
+
+
+def _v129(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/programCode/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v130(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/programCode/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v131(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/publisher
+    if not _v132(x):
+        return False
+    return True
+
+
+def _v132(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/$defs/organization
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict) and ('name' not in x):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and not _v133(x['@type']):
+            return False
+        if 'name' in x and not _v134(x['name']):
+            return False
+        if 'subOrganizationOf' in x and not _v135(x['subOrganizationOf']):
+            return False
+    return True
+
+
+def _v133(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/$defs/organization/properties/@type
+    if not (isinstance(x, str) and x == 'org:Organization'):
+        return False
+    return True
+
+
+def _v134(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/$defs/organization/properties/name
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v135(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/$defs/organization/properties/subOrganizationOf
+    if not _v136(x):
+        return False
+    return True
+
+
+def _v136(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict) and ('name' not in x):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and not _v137(x['@type']):
+            return False
+        if 'name' in x and not _v138(x['name']):
+            return False
+        if 'subOrganizationOf' in x and not _v139(x['subOrganizationOf']):
+            return False
+    return True
+
+
+def _v137(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/properties/@type
+    if not (isinstance(x, str) and x in _C14):
+        return False
+    return True
+
+
+def _v138(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/properties/name
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v139(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/properties/subOrganizationOf
+    if not _v136(x):
+        return False
+    return True
+
+
+def _v140(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/references
+    if not (_v141(x) or _v145(x) or _v146(x)):
+        return False
+    return True
+
+
+def _v141(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/references/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v142(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    return True
+
+
+def _v142(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/references/anyOf/0/items
+    if not (_v143(x) or _v144(x)):
+        return False
+    return True
+
+
+def _v143(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/references/anyOf/0/items/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v144(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/references/anyOf/0/items/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v145(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/references/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v146(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/references/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v147(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/spatial
+    if not (_v148(x) or _v149(x) or _v154(x)):
+        return False
+    return True
+
+
+def _v148(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/spatial/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v149(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/spatial/anyOf/1
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'coordinates' in x and not _v150(x['coordinates']):
+            return False
+        if 'type' in x and not _v153(x['type']):
+            return False
+    return True
+
+
+def _v150(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/spatial/anyOf/1/properties/coordinates
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v151(item):
+                return False
+    return True
+
+
+def _v151(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/spatial/anyOf/1/properties/coordinates/items
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v152(item):
+                return False
+    return True
+
+
+def _v152(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/spatial/anyOf/1/properties/coordinates/items/items
+    if not ((isinstance(x, numbers.Number) and not isinstance(x, bool))):
+        return False
+    return True
+
+
+def _v153(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/spatial/anyOf/1/properties/type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v154(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/spatial/anyOf/2
+    if not (x is None):
+        return False
+    return True
+
+
+def _v155(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/systemOfRecords
+    if not (_v156(x) or _v157(x)):
+        return False
+    return True
+
+
+def _v156(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/systemOfRecords/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v157(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/systemOfRecords/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v158(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/temporal
+    if not (_v159(x) or _v160(x) or _v161(x) or _v162(x) or _v163(x)):
+        return False
+    return True
+
+
+def _v159(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/temporal/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C15.search(x):
+        return False
+    return True
+
+
+def _v160(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/temporal/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C11.search(x):
+        return False
+    return True
+
+
+def _v161(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/temporal/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C16.search(x):
+        return False
+    return True
+
+
+def _v162(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/temporal/anyOf/3
+    if not (x is None):
+        return False
+    return True
+
+
+def _v163(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/temporal/anyOf/4
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v164(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/isPartOf
+    if not (_v165(x) or _v166(x)):
+        return False
+    return True
+
+
+def _v165(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/isPartOf/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v166(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/isPartOf/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v167(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/theme
+    if not (_v168(x) or _v170(x) or _v171(x)):
+        return False
+    return True
+
+
+def _v168(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/theme/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v169(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    return True
+
+
+def _v169(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/theme/anyOf/0/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v170(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/theme/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v171(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/theme/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v172(x):
+    # https://project-open-data.cio.gov/v1.1/schema/dataset.json#/properties/title
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v173(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict) and ('title' not in x or 'description' not in x or 'keyword' not in x or 'modified' not in x or 'publisher' not in x or 'contactPoint' not in x or 'identifier' not in x or 'accessLevel' not in x):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and not _v174(x['@type']):
+            return False
+        if 'accessLevel' in x and not _v175(x['accessLevel']):
+            return False
+        if 'rights' in x and not _v176(x['rights']):
+            return False
+        if 'accrualPeriodicity' in x and not _v179(x['accrualPeriodicity']):
+            return False
+        if 'bureauCode' in x and not _v184(x['bureauCode']):
+            return False
+        if 'contactPoint' in x and not _v189(x['contactPoint']):
+            return False
+        if 'describedBy' in x and not _v196(x['describedBy']):
+            return False
+        if 'describedByType' in x and not _v200(x['describedByType']):
+            return False
+        if 'conformsTo' in x and not _v204(x['conformsTo']):
+            return False
+        if 'dataQuality' in x and not _v208(x['dataQuality']):
+            return False
+        if 'description' in x and not _v212(x['description']):
+            return False
+        if 'distribution' in x and not _v213(x['distribution']):
+            return False
+        if 'identifier' in x and not _v260(x['identifier']):
+            return False
+        if 'issued' in x and not _v261(x['issued']):
+            return False
+        if 'keyword' in x and not _v265(x['keyword']):
+            return False
+        if 'landingPage' in x and not _v269(x['landingPage']):
+            return False
+        if 'language' in x and not _v273(x['language']):
+            return False
+        if 'license' in x and not _v278(x['license']):
+            return False
+        if 'modified' in x and not _v282(x['modified']):
+            return False
+        if 'primaryITInvestmentUII' in x and not _v287(x['primaryITInvestmentUII']):
+            return False
+        if 'programCode' in x and not _v291(x['programCode']):
+            return False
+        if 'publisher' in x and not _v296(x['publisher']):
+            return False
+        if 'references' in x and not _v301(x['references']):
+            return False
+        if 'spatial' in x and not _v308(x['spatial']):
+            return False
+        if 'systemOfRecords' in x and not _v316(x['systemOfRecords']):
+            return False
+        if 'temporal' in x and not _v319(x['temporal']):
+            return False
+        if 'isPartOf' in x and not _v325(x['isPartOf']):
+            return False
+        if 'theme' in x and not _v328(x['theme']):
+            return False
+        if 'title' in x and not _v333(x['title']):
+            return False
+    return True
+
+
+def _v174(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/@type
+    if not (isinstance(x, str) and x == 'dcat:Dataset'):
+        return False
+    return True
+
+
+def _v175(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/accessLevel
+    if not (isinstance(x, str) and x in _C2):
+        return False
+    return True
+
+
+def _v176(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/rights
+    if not (_v177(x) or _v178(x)):
+        return False
+    return True
+
+
+def _v177(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/rights/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    if isinstance(x, str) and len(x) > 255:
+        return False
+    return True
+
+
+def _v178(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/rights/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v179(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/accrualPeriodicity
+    if not (_v180(x) or _v181(x) or _v182(x) or _v183(x)):
+        return False
+    return True
+
+
+def _v180(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/accrualPeriodicity/anyOf/0
+    if not (isinstance(x, str) and x == 'irregular'):
+        return False
+    return True
+
+
+def _v181(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/accrualPeriodicity/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C3.search(x):
+        return False
+    return True
+
+
+def _v182(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/accrualPeriodicity/anyOf/2
+    if not (x is None):
+        return False
+    return True
+
+
+def _v183(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/accrualPeriodicity/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v184(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/bureauCode
+    if not (_v185(x) or _v187(x) or _v188(x)):
+        return False
+    return True
+
+
+def _v185(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/bureauCode/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v186(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    return True
+
+
+def _v186(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/bureauCode/anyOf/0/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C5.search(x):
+        return False
+    return True
+
+
+def _v187(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/bureauCode/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v188(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/bureauCode/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v189(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/contactPoint
+    if not _v190(x):
+        return False
+    return True
+
+
+def _v190(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict) and ('fn' not in x or 'hasEmail' not in x):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and not _v191(x['@type']):
+            return False
+        if 'fn' in x and not _v192(x['fn']):
+            return False
+        if 'hasEmail' in x and not _v193(x['hasEmail']):
+            return False
+    return True
+
+
+def _v191(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/@type
+    if not (isinstance(x, str) and x == 'vcard:Contact'):
+        return False
+    return True
+
+
+def _v192(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/fn
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v193(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/hasEmail
+    if not (_v194(x) or _v195(x)):
+        return False
+    return True
+
+
+def _v194(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/hasEmail/anyOf/0
+    if isinstance(x, str) and not _C6.search(x):
+        return False
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v195(x):
+    # https://project-open-data.cio.gov/v1.1/schema/vcard.json#/$defs/vcard/properties/hasEmail/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v196(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/describedBy
+    if not (_v197(x) or _v198(x) or _v199(x)):
+        return False
+    return True
+
+
+def _v197(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/describedBy/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v198(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/describedBy/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v199(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/describedBy/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v200(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/describedByType
+    if not (_v201(x) or _v202(x) or _v203(x)):
+        return False
+    return True
+
+
+def _v201(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/describedByType/anyOf/0
+    if isinstance(x, str) and not _C7.search(x):
+        return False
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v202(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/describedByType/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v203(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/describedByType/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v204(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/conformsTo
+    if not (_v205(x) or _v206(x) or _v207(x)):
+        return False
+    return True
+
+
+def _v205(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/conformsTo/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v206(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/conformsTo/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v207(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/conformsTo/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v208(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/dataQuality
+    if not (_v209(x) or _v210(x) or _v211(x)):
+        return False
+    return True
+
+
+def _v209(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/dataQuality/anyOf/0
+    if not (isinstance(x, bool)):
+        return False
+    return True
+
+
+def _v210(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/dataQuality/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v211(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/dataQuality/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v212(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/description
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    if isinstance(x, str) and len(x) > 10000:
+        return False
+    return True
+
+
+def _v213(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/distribution
+    if not (_v214(x) or _v258(x) or _v259(x)):
+        return False
+    return True
+
+
+def _v214(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/distribution/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v215(item):
+                return False
+    return True
+
+
+def _v215(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/distribution/anyOf/0/items
+    if not (_v216(x) or _v257(x)):
+        return False
+    return True
+
+
+def _v216(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/distribution/anyOf/0/items/anyOf/0
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    if not _v217(x):
+        return False
+    return True
+
+
+def _v217(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and not _v218(x['@type']):
+            return False
+        if 'downloadURL' in x and not _v219(x['downloadURL']):
+            return False
+        if 'mediaType' in x and not _v222(x['mediaType']):
+            return False
+        if 'format' in x and not _v226(x['format']):
+            return False
+        if 'accessURL' in x and not _v229(x['accessURL']):
+            return False
+        if 'description' in x and not _v233(x['description']):
+            return False
+        if 'title' in x and not _v237(x['title']):
+            return False
+        if 'conformsTo' in x and not _v241(x['conformsTo']):
+            return False
+        if 'describedBy' in x and not _v245(x['describedBy']):
+            return False
+        if 'describedByType' in x and not _v249(x['describedByType']):
+            return False
+    if isinstance(x, dict):
+        if 'downloadURL' in x and (not _v253(x)):
+            return False
+    return True
+
+
+def _v218(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/@type
+    if not (isinstance(x, str) and x == 'dcat:Distribution'):
+        return False
+    return True
+
+
+def _v219(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/downloadURL
+    if not (_v220(x) or _v221(x)):
+        return False
+    return True
+
+
+def _v220(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/downloadURL/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v221(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/downloadURL/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v222(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/mediaType
+    if not (_v223(x) or _v224(x) or _v225(x)):
+        return False
+    return True
+
+
+def _v223(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/mediaType/anyOf/0
+    if isinstance(x, str) and not _C7.search(x):
+        return False
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v224(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/mediaType/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v225(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/mediaType/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v226(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/format
+    if not (_v227(x) or _v228(x)):
+        return False
+    return True
+
+
+def _v227(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/format/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v228(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/format/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v229(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/accessURL
+    if not (_v230(x) or _v231(x) or _v232(x)):
+        return False
+    return True
+
+
+def _v230(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/accessURL/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v231(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/accessURL/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v232(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/accessURL/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v233(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/description
+    if not (_v234(x) or _v235(x) or _v236(x)):
+        return False
+    return True
+
+
+def _v234(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/description/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    if isinstance(x, str) and len(x) > 10000:
+        return False
+    return True
+
+
+def _v235(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/description/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v236(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/description/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v237(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/title
+    if not (_v238(x) or _v239(x) or _v240(x)):
+        return False
+    return True
+
+
+def _v238(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/title/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v239(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/title/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v240(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/title/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v241(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/conformsTo
+    if not (_v242(x) or _v243(x) or _v244(x)):
+        return False
+    return True
+
+
+def _v242(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/conformsTo/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v243(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/conformsTo/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v244(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/conformsTo/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v245(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedBy
+    if not (_v246(x) or _v247(x) or _v248(x)):
+        return False
+    return True
+
+
+def _v246(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedBy/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v247(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedBy/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v248(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedBy/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v249(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedByType
+    if not (_v250(x) or _v251(x) or _v252(x)):
+        return False
+    return True
+
+
+def _v250(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedByType/anyOf/0
+    if isinstance(x, str) and not _C7.search(x):
+        return False
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v251(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedByType/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v252(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/properties/describedByType/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v253(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/dependentSchemas/downloadURL
+    if isinstance(x, dict):
+        if 'mediaType' in x and not _v254(x['mediaType']):
+            return False
+    if isinstance(x, dict) and ('mediaType' not in x):
+        return False
+    return True
+
+
+def _v254(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/dependentSchemas/downloadURL/properties/mediaType
+    if not (_v255(x) or _v256(x)):
+        return False
+    return True
+
+
+def _v255(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/dependentSchemas/downloadURL/properties/mediaType/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C7.search(x):
+        return False
+    return True
+
+
+def _v256(x):
+    # https://project-open-data.cio.gov/v1.1/schema/distribution.json#/$defs/distribution/dependentSchemas/downloadURL/properties/mediaType/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v257(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/distribution/anyOf/0/items/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v258(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/distribution/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v259(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/distribution/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v260(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/identifier
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v261(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/issued
+    if not (_v262(x) or _v263(x) or _v264(x)):
+        return False
+    return True
+
+
+def _v262(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/issued/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C8.search(x):
+        return False
+    return True
+
+
+def _v263(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/issued/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v264(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/issued/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v265(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/keyword
+    if not (_v266(x) or _v268(x)):
+        return False
+    return True
+
+
+def _v266(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/keyword/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v267(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and len(x) > 1000:
+        return False
+    return True
+
+
+def _v267(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/keyword/anyOf/0/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    if isinstance(x, str) and len(x) > 1000:
+        return False
+    return True
+
+
+def _v268(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/keyword/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v269(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/landingPage
+    if not (_v270(x) or _v271(x) or _v272(x)):
+        return False
+    return True
+
+
+def _v270(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/landingPage/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v271(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/landingPage/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v272(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/landingPage/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v273(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/language
+    if not (_v274(x) or _v275(x) or _v276(x)):
+        return False
+    return True
+
+
+def _v274(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/language/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v275(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/language/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v276(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/language/anyOf/2
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v277(item):
+                return False
+    return True
+
+
+def _v277(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/language/anyOf/2/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C9.search(x):
+        return False
+    return True
+
+
+def _v278(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/license
+    if not (_v279(x) or _v280(x) or _v281(x)):
+        return False
+    return True
+
+
+def _v279(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/license/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v280(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/license/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v281(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/license/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v282(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/modified
+    if not (_v283(x) or _v284(x) or _v285(x) or _v286(x)):
+        return False
+    return True
+
+
+def _v283(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/modified/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C8.search(x):
+        return False
+    return True
+
+
+def _v284(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/modified/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C10.search(x):
+        return False
+    return True
+
+
+def _v285(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/modified/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C11.search(x):
+        return False
+    return True
+
+
+def _v286(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/modified/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v287(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/primaryITInvestmentUII
+    if not (_v288(x) or _v289(x) or _v290(x)):
+        return False
+    return True
+
+
+def _v288(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/primaryITInvestmentUII/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C12.search(x):
+        return False
+    return True
+
+
+def _v289(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/primaryITInvestmentUII/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v290(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/primaryITInvestmentUII/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v291(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/programCode
+    if not (_v292(x) or _v294(x) or _v295(x)):
+        return False
+    return True
+
+
+def _v292(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/programCode/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v293(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    return True
+
+
+def _v293(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/programCode/anyOf/0/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C13.search(x):
+        return False
+    return True
+
+
+def _v294(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/programCode/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v295(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/programCode/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v296(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/publisher
+    if not _v297(x):
+        return False
+    return True
+
+
+def _v297(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/$defs/organization
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict) and ('name' not in x):
+        return False
+    if isinstance(x, dict):
+        if '@type' in x and not _v298(x['@type']):
+            return False
+        if 'name' in x and not _v299(x['name']):
+            return False
+        if 'subOrganizationOf' in x and not _v300(x['subOrganizationOf']):
+            return False
+    return True
+
+
+def _v298(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/$defs/organization/properties/@type
+    if not (isinstance(x, str) and x == 'org:Organization'):
+        return False
+    return True
+
+
+def _v299(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/$defs/organization/properties/name
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v300(x):
+    # https://project-open-data.cio.gov/v1.1/schema/organization.json#/$defs/organization/properties/subOrganizationOf
+    if not _v136(x):
+        return False
+    return True
+
+
+def _v301(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/references
+    if not (_v302(x) or _v306(x) or _v307(x)):
+        return False
+    return True
+
+
+def _v302(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/references/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v303(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    return True
+
+
+def _v303(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/references/anyOf/0/items
+    if not (_v304(x) or _v305(x)):
+        return False
+    return True
+
+
+def _v304(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/references/anyOf/0/items/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'uri'):
+        return False
+    return True
+
+
+def _v305(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/references/anyOf/0/items/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v306(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/references/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v307(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/references/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v308(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/spatial
+    if not (_v309(x) or _v310(x) or _v315(x)):
+        return False
+    return True
+
+
+def _v309(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/spatial/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v310(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/spatial/anyOf/1
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'coordinates' in x and not _v311(x['coordinates']):
+            return False
+        if 'type' in x and not _v314(x['type']):
+            return False
+    return True
+
+
+def _v311(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/spatial/anyOf/1/properties/coordinates
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v312(item):
+                return False
+    return True
+
+
+def _v312(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/spatial/anyOf/1/properties/coordinates/items
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v313(item):
+                return False
+    return True
+
+
+def _v313(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/spatial/anyOf/1/properties/coordinates/items/items
+    if not ((isinstance(x, numbers.Number) and not isinstance(x, bool))):
+        return False
+    return True
+
+
+def _v314(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/spatial/anyOf/1/properties/type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v315(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/spatial/anyOf/2
+    if not (x is None):
+        return False
+    return True
+
+
+def _v316(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/systemOfRecords
+    if not (_v317(x) or _v318(x)):
+        return False
+    return True
+
+
+def _v317(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/systemOfRecords/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v318(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/systemOfRecords/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v319(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/temporal
+    if not (_v320(x) or _v321(x) or _v322(x) or _v323(x) or _v324(x)):
+        return False
+    return True
+
+
+def _v320(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/temporal/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C15.search(x):
+        return False
+    return True
+
+
+def _v321(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/temporal/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C11.search(x):
+        return False
+    return True
+
+
+def _v322(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/temporal/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C16.search(x):
+        return False
+    return True
+
+
+def _v323(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/temporal/anyOf/3
+    if not (x is None):
+        return False
+    return True
+
+
+def _v324(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/temporal/anyOf/4
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v325(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/isPartOf
+    if not (_v326(x) or _v327(x)):
+        return False
+    return True
+
+
+def _v326(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/isPartOf/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v327(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/isPartOf/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v328(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/theme
+    if not (_v329(x) or _v331(x) or _v332(x)):
+        return False
+    return True
+
+
+def _v329(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/theme/anyOf/0
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v330(item):
+                return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not uniq(x):
+        return False
+    return True
+
+
+def _v330(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/theme/anyOf/0/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v331(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/theme/anyOf/1
+    if not (x is None):
+        return False
+    return True
+
+
+def _v332(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/theme/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C4.search(x):
+        return False
+    return True
+
+
+def _v333(x):
+    # https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json#/properties/title
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v334(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v335(x['@id']):
+            return False
+        if '@type' in x and not _v336(x['@type']):
+            return False
+        if 'catalog' in x and not _v337(x['catalog']):
+            return False
+        if 'contactPoint' in x and not _v339(x['contactPoint']):
+            return False
+        if 'dataset' in x and not _v361(x['dataset']):
+            return False
+        if 'keyword' in x and not _v975(x['keyword']):
+            return False
+        if 'record' in x and not _v977(x['record']):
+            return False
+        if 'service' in x and not _v1009(x['service']):
+            return False
+        if 'theme' in x and not _v1011(x['theme']):
+            return False
+        if 'themeTaxonomy' in x and not _v1013(x['themeTaxonomy']):
+            return False
+        if 'accessRights' in x and not _v1015(x['accessRights']):
+            return False
+        if 'conformsTo' in x and not _v1018(x['conformsTo']):
+            return False
+        if 'creator' in x and not _v1021(x['creator']):
+            return False
+        if 'description' in x and not _v1023(x['description']):
+            return False
+        if 'hasPart' in x and not _v1024(x['hasPart']):
+            return False
+        if 'identifier' in x and not _v1026(x['identifier']):
+            return False
+        if 'otherIdentifier' in x and not _v1029(x['otherIdentifier']):
+            return False
+        if 'issued' in x and not _v1031(x['issued']):
+            return False
+        if 'language' in x and not _v1038(x['language']):
+            return False
+        if 'license' in x and not _v1043(x['license']):
+            return False
+        if 'modified' in x and not _v1046(x['modified']):
+            return False
+        if 'publisher' in x and not _v1053(x['publisher']):
+            return False
+        if 'rights' in x and not _v1056(x['rights']):
+            return False
+        if 'rightsHolder' in x and not _v1058(x['rightsHolder']):
+            return False
+        if 'spatial' in x and not _v1060(x['spatial']):
+            return False
+        if 'subject' in x and not _v1062(x['subject']):
+            return False
+        if 'temporal' in x and not _v1064(x['temporal']):
+            return False
+        if 'title' in x and not _v1066(x['title']):
+            return False
+        if 'category' in x and not _v1067(x['category']):
+            return False
+        if 'homepage' in x and not _v1069(x['homepage']):
+            return False
+        if 'qualifiedAttribution' in x and not _v1072(x['qualifiedAttribution']):
+            return False
+    if isinstance(x, dict) and ('dataset' not in x):
+        return False
+    return True
+
+
+def _v335(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v336(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v337(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/catalog
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v338(item):
+                return False
+    return True
+
+
+def _v338(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/catalog/items
+    if not _v334(x):
+        return False
+    return True
+
+
+def _v339(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/contactPoint
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v340(item):
+                return False
+    return True
+
+
+def _v340(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/contactPoint/items
+    if not _v341(x):
+        return False
+    return True
+
+
+def _v341(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v342(x['@id']):
+            return False
+        if '@type' in x and not _v343(x['@type']):
+            return False
+        if 'address' in x and not _v344(x['address']):
+            return False
+        if 'hasEmail' in x and not _v354(x['hasEmail']):
+            return False
+        if 'family-name' in x and not _v355(x['family-name']):
+            return False
+        if 'fn' in x and not _v356(x['fn']):
+            return False
+        if 'given-name' in x and not _v357(x['given-name']):
+            return False
+        if 'organization-name' in x and not _v358(x['organization-name']):
+            return False
+        if 'tel' in x and not _v359(x['tel']):
+            return False
+        if 'title' in x and not _v360(x['title']):
+            return False
+    if isinstance(x, dict) and ('hasEmail' not in x or 'fn' not in x):
+        return False
+    return True
+
+
+def _v342(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v343(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v344(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/address
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v345(item):
+                return False
+    return True
+
+
+def _v345(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/address/items
+    if not _v346(x):
+        return False
+    return True
+
+
+def _v346(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/address#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v347(x['@id']):
+            return False
+        if '@type' in x and not _v348(x['@type']):
+            return False
+        if 'country-name' in x and not _v349(x['country-name']):
+            return False
+        if 'locality' in x and not _v350(x['locality']):
+            return False
+        if 'postal-code' in x and not _v351(x['postal-code']):
+            return False
+        if 'region' in x and not _v352(x['region']):
+            return False
+        if 'street-address' in x and not _v353(x['street-address']):
+            return False
+    return True
+
+
+def _v347(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/address#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v348(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/address#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v349(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/address#/properties/country-name
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v350(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/address#/properties/locality
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v351(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/address#/properties/postal-code
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v352(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/address#/properties/region
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v353(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/address#/properties/street-address
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v354(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/hasEmail
+    if isinstance(x, str) and not _C6.search(x):
+        return False
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v355(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/family-name
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v356(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/fn
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v357(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/given-name
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v358(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/organization-name
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v359(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/tel
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v360(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/kind#/properties/title
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v361(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/dataset
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v362(item):
+                return False
+    return True
+
+
+def _v362(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/dataset/items
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v363(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v364(x['@id']):
+            return False
+        if '@type' in x and not _v365(x['@type']):
+            return False
+        if 'otherIdentifier' in x and not _v366(x['otherIdentifier']):
+            return False
+        if 'sample' in x and not _v396(x['sample']):
+            return False
+        if 'status' in x and not _v780(x['status']):
+            return False
+        if 'supportedSchema' in x and not _v783(x['supportedSchema']):
+            return False
+        if 'versionNotes' in x and not _v786(x['versionNotes']):
+            return False
+        if 'contactPoint' in x and not _v787(x['contactPoint']):
+            return False
+        if 'distribution' in x and not _v791(x['distribution']):
+            return False
+        if 'first' in x and not _v793(x['first']):
+            return False
+        if 'hasCurrentVersion' in x and not _v796(x['hasCurrentVersion']):
+            return False
+        if 'hasVersion' in x and not _v799(x['hasVersion']):
+            return False
+        if 'inSeries' in x and not _v801(x['inSeries']):
+            return False
+        if 'keyword' in x and not _v844(x['keyword']):
+            return False
+        if 'landingPage' in x and not _v846(x['landingPage']):
+            return False
+        if 'previousVersion' in x and not _v849(x['previousVersion']):
+            return False
+        if 'qualifiedRelation' in x and not _v852(x['qualifiedRelation']):
+            return False
+        if 'spatialResolutionInMeters' in x and not _v859(x['spatialResolutionInMeters']):
+            return False
+        if 'temporalResolution' in x and not _v860(x['temporalResolution']):
+            return False
+        if 'theme' in x and not _v861(x['theme']):
+            return False
+        if 'version' in x and not _v863(x['version']):
+            return False
+        if 'describedBy' in x and not _v864(x['describedBy']):
+            return False
+        if 'liabilityStatement' in x and not _v867(x['liabilityStatement']):
+            return False
+        if 'metadataDistribution' in x and not _v870(x['metadataDistribution']):
+            return False
+        if 'purpose' in x and not _v872(x['purpose']):
+            return False
+        if 'accessRights' in x and not _v873(x['accessRights']):
+            return False
+        if 'accrualPeriodicity' in x and not _v876(x['accrualPeriodicity']):
+            return False
+        if 'conformsTo' in x and not _v881(x['conformsTo']):
+            return False
+        if 'contributor' in x and not _v883(x['contributor']):
+            return False
+        if 'created' in x and not _v885(x['created']):
+            return False
+        if 'creator' in x and not _v892(x['creator']):
+            return False
+        if 'description' in x and not _v895(x['description']):
+            return False
+        if 'hasPart' in x and not _v896(x['hasPart']):
+            return False
+        if 'identifier' in x and not _v898(x['identifier']):
+            return False
+        if 'isReferencedBy' in x and not _v901(x['isReferencedBy']):
+            return False
+        if 'issued' in x and not _v903(x['issued']):
+            return False
+        if 'language' in x and not _v910(x['language']):
+            return False
+        if 'modified' in x and not _v915(x['modified']):
+            return False
+        if 'provenance' in x and not _v922(x['provenance']):
+            return False
+        if 'publisher' in x and not _v924(x['publisher']):
+            return False
+        if 'relation' in x and not _v927(x['relation']):
+            return False
+        if 'replaces' in x and not _v929(x['replaces']):
+            return False
+        if 'license' in x and not _v931(x['license']):
+            return False
+        if 'accessRestriction' in x and not _v934(x['accessRestriction']):
+            return False
+        if 'cuiRestriction' in x and not _v936(x['cuiRestriction']):
+            return False
+        if 'useRestriction' in x and not _v939(x['useRestriction']):
+            return False
+        if 'rights' in x and not _v941(x['rights']):
+            return False
+        if 'rightsHolder' in x and not _v943(x['rightsHolder']):
+            return False
+        if 'source' in x and not _v945(x['source']):
+            return False
+        if 'spatial' in x and not _v947(x['spatial']):
+            return False
+        if 'subject' in x and not _v952(x['subject']):
+            return False
+        if 'temporal' in x and not _v954(x['temporal']):
+            return False
+        if 'title' in x and not _v956(x['title']):
+            return False
+        if 'category' in x and not _v957(x['category']):
+            return False
+        if 'hasQualityMeasurement' in x and not _v959(x['hasQualityMeasurement']):
+            return False
+        if 'page' in x and not _v961(x['page']):
+            return False
+        if 'qualifiedAttribution' in x and not _v963(x['qualifiedAttribution']):
+            return False
+        if 'wasAttributedTo' in x and not _v965(x['wasAttributedTo']):
+            return False
+        if 'wasGeneratedBy' in x and not _v967(x['wasGeneratedBy']):
+            return False
+        if 'wasUsedBy' in x and not _v969(x['wasUsedBy']):
+            return False
+        if 'image' in x and not _v971(x['image']):
+            return False
+        if 'scopeNote' in x and not _v974(x['scopeNote']):
+            return False
+    if isinstance(x, dict) and ('description' not in x or 'title' not in x or 'contactPoint' not in x or 'identifier' not in x):
+        return False
+    return True
+
+
+def _v364(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v365(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v366(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/otherIdentifier
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v367(item):
+                return False
+    return True
+
+
+def _v367(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/otherIdentifier/items
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v368(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#
+    if not (_v369(x) or _v370(x)):
+        return False
+    return True
+
+
+def _v369(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v370(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v371(x['@id']):
+            return False
+        if '@type' in x and not _v372(x['@type']):
+            return False
+        if 'schemaAgency' in x and not _v373(x['schemaAgency']):
+            return False
+        if 'creator' in x and not _v374(x['creator']):
+            return False
+        if 'issued' in x and not _v387(x['issued']):
+            return False
+        if 'version' in x and not _v394(x['version']):
+            return False
+        if 'notation' in x and not _v395(x['notation']):
+            return False
+    return True
+
+
+def _v371(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v372(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v373(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/schemaAgency
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v374(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/creator
+    if not (_v375(x) or _v376(x)):
+        return False
+    return True
+
+
+def _v375(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/creator/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v376(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/creator/anyOf/1
+    if not _v377(x):
+        return False
+    return True
+
+
+def _v377(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v378(x['@id']):
+            return False
+        if '@type' in x and not _v379(x['@type']):
+            return False
+        if 'name' in x and not _v380(x['name']):
+            return False
+        if 'subOrganizationOf' in x and not _v381(x['subOrganizationOf']):
+            return False
+        if 'altLabel' in x and not _v383(x['altLabel']):
+            return False
+        if 'notation' in x and not _v384(x['notation']):
+            return False
+        if 'prefLabel' in x and not _v386(x['prefLabel']):
+            return False
+    if isinstance(x, dict) and ('name' not in x):
+        return False
+    return True
+
+
+def _v378(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v379(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v380(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#/properties/name
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v381(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#/properties/subOrganizationOf
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v382(item):
+                return False
+    return True
+
+
+def _v382(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#/properties/subOrganizationOf/items
+    if not _v377(x):
+        return False
+    return True
+
+
+def _v383(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#/properties/altLabel
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v384(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#/properties/notation
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v385(item):
+                return False
+    return True
+
+
+def _v385(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#/properties/notation/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v386(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/organization#/properties/prefLabel
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v387(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/issued
+    if not (_v388(x) or _v389(x)):
+        return False
+    return True
+
+
+def _v388(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/issued/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v389(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/issued/anyOf/1
+    if not (_v390(x) or _v391(x) or _v392(x) or _v393(x)):
+        return False
+    return True
+
+
+def _v390(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/issued/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v391(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/issued/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v392(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/issued/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v393(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/issued/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v394(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/version
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v395(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/identifier#/anyOf/1/properties/notation
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v396(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/sample
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v397(item):
+                return False
+    return True
+
+
+def _v397(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/sample/items
+    if not _v398(x):
+        return False
+    return True
+
+
+def _v398(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v399(x['@id']):
+            return False
+        if '@type' in x and not _v400(x['@type']):
+            return False
+        if 'representationTechnique' in x and not _v401(x['representationTechnique']):
+            return False
+        if 'status' in x and not _v444(x['status']):
+            return False
+        if 'characterEncoding' in x and not _v447(x['characterEncoding']):
+            return False
+        if 'accessService' in x and not _v451(x['accessService']):
+            return False
+        if 'accessURL' in x and not _v667(x['accessURL']):
+            return False
+        if 'byteSize' in x and not _v670(x['byteSize']):
+            return False
+        if 'compressFormat' in x and not _v671(x['compressFormat']):
+            return False
+        if 'downloadURL' in x and not _v672(x['downloadURL']):
+            return False
+        if 'mediaType' in x and not _v675(x['mediaType']):
+            return False
+        if 'packageFormat' in x and not _v676(x['packageFormat']):
+            return False
+        if 'spatialResolutionInMeters' in x and not _v677(x['spatialResolutionInMeters']):
+            return False
+        if 'temporalResolution' in x and not _v678(x['temporalResolution']):
+            return False
+        if 'availability' in x and not _v679(x['availability']):
+            return False
+        if 'accessRestriction' in x and not _v682(x['accessRestriction']):
+            return False
+        if 'cuiRestriction' in x and not _v684(x['cuiRestriction']):
+            return False
+        if 'describedBy' in x and not _v687(x['describedBy']):
+            return False
+        if 'useRestriction' in x and not _v690(x['useRestriction']):
+            return False
+        if 'accessRights' in x and not _v692(x['accessRights']):
+            return False
+        if 'conformsTo' in x and not _v695(x['conformsTo']):
+            return False
+        if 'description' in x and not _v697(x['description']):
+            return False
+        if 'format' in x and not _v698(x['format']):
+            return False
+        if 'identifier' in x and not _v699(x['identifier']):
+            return False
+        if 'otherIdentifier' in x and not _v702(x['otherIdentifier']):
+            return False
+        if 'issued' in x and not _v704(x['issued']):
+            return False
+        if 'language' in x and not _v711(x['language']):
+            return False
+        if 'license' in x and not _v716(x['license']):
+            return False
+        if 'modified' in x and not _v719(x['modified']):
+            return False
+        if 'rights' in x and not _v726(x['rights']):
+            return False
+        if 'title' in x and not _v728(x['title']):
+            return False
+        if 'hasQualityMeasurement' in x and not _v729(x['hasQualityMeasurement']):
+            return False
+        if 'page' in x and not _v731(x['page']):
+            return False
+        if 'image' in x and not _v769(x['image']):
+            return False
+        if 'checksum' in x and not _v772(x['checksum']):
+            return False
+    return True
+
+
+def _v399(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v400(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v401(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/representationTechnique
+    if not (_v402(x) or _v403(x)):
+        return False
+    return True
+
+
+def _v402(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/representationTechnique/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v403(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/representationTechnique/anyOf/1
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v404(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#
+    if not (_v405(x) or _v406(x)):
+        return False
+    return True
+
+
+def _v405(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v406(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v407(x['@id']):
+            return False
+        if '@type' in x and not _v408(x['@type']):
+            return False
+        if 'altLabel' in x and not _v409(x['altLabel']):
+            return False
+        if 'definition' in x and not _v410(x['definition']):
+            return False
+        if 'inScheme' in x and not _v411(x['inScheme']):
+            return False
+        if 'notation' in x and not _v439(x['notation']):
+            return False
+        if 'prefLabel' in x and not _v443(x['prefLabel']):
+            return False
+    if isinstance(x, dict) and ('prefLabel' not in x):
+        return False
+    return True
+
+
+def _v407(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v408(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v409(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/altLabel
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v410(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/definition
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v411(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/inScheme
+    if not _v412(x):
+        return False
+    return True
+
+
+def _v412(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v413(x['@id']):
+            return False
+        if '@type' in x and not _v414(x['@type']):
+            return False
+        if 'version' in x and not _v415(x['version']):
+            return False
+        if 'created' in x and not _v416(x['created']):
+            return False
+        if 'description' in x and not _v423(x['description']):
+            return False
+        if 'issued' in x and not _v424(x['issued']):
+            return False
+        if 'modified' in x and not _v431(x['modified']):
+            return False
+        if 'title' in x and not _v438(x['title']):
+            return False
+    if isinstance(x, dict) and ('title' not in x):
+        return False
+    return True
+
+
+def _v413(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v414(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v415(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/version
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v416(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/created
+    if not (_v417(x) or _v418(x)):
+        return False
+    return True
+
+
+def _v417(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/created/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v418(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/created/anyOf/1
+    if not (_v419(x) or _v420(x) or _v421(x) or _v422(x)):
+        return False
+    return True
+
+
+def _v419(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/created/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v420(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/created/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v421(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/created/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v422(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/created/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v423(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/description
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v424(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/issued
+    if not (_v425(x) or _v426(x)):
+        return False
+    return True
+
+
+def _v425(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/issued/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v426(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/issued/anyOf/1
+    if not (_v427(x) or _v428(x) or _v429(x) or _v430(x)):
+        return False
+    return True
+
+
+def _v427(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/issued/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v428(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/issued/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v429(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/issued/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v430(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/issued/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v431(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/modified
+    if not (_v432(x) or _v433(x)):
+        return False
+    return True
+
+
+def _v432(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/modified/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v433(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/modified/anyOf/1
+    if not (_v434(x) or _v435(x) or _v436(x) or _v437(x)):
+        return False
+    return True
+
+
+def _v434(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/modified/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v435(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/modified/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v436(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/modified/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v437(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/modified/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v438(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/conceptscheme#/properties/title
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v439(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/notation
+    if not (_v440(x) or _v441(x)):
+        return False
+    return True
+
+
+def _v440(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/notation/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v441(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/notation/anyOf/1
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v442(item):
+                return False
+    return True
+
+
+def _v442(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/notation/anyOf/1/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v443(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/concept#/anyOf/1/properties/prefLabel
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v444(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/status
+    if not (_v445(x) or _v446(x)):
+        return False
+    return True
+
+
+def _v445(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/status/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v446(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/status/anyOf/1
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v447(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/characterEncoding
+    if not (_v448(x) or _v449(x)):
+        return False
+    return True
+
+
+def _v448(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/characterEncoding/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v449(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/characterEncoding/anyOf/1
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v450(item):
+                return False
+    return True
+
+
+def _v450(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/characterEncoding/anyOf/1/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v451(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessService
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v452(item):
+                return False
+    return True
+
+
+def _v452(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessService/items
+    if not _v453(x):
+        return False
+    return True
+
+
+def _v453(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v454(x['@id']):
+            return False
+        if '@type' in x and not _v455(x['@type']):
+            return False
+        if 'contactPoint' in x and not _v456(x['contactPoint']):
+            return False
+        if 'endpointDescription' in x and not _v458(x['endpointDescription']):
+            return False
+        if 'endpointURL' in x and not _v460(x['endpointURL']):
+            return False
+        if 'keyword' in x and not _v462(x['keyword']):
+            return False
+        if 'servesDataset' in x and not _v464(x['servesDataset']):
+            return False
+        if 'spatialResolutionInMeters' in x and not _v466(x['spatialResolutionInMeters']):
+            return False
+        if 'temporalResolution' in x and not _v467(x['temporalResolution']):
+            return False
+        if 'theme' in x and not _v468(x['theme']):
+            return False
+        if 'accessRights' in x and not _v470(x['accessRights']):
+            return False
+        if 'conformsTo' in x and not _v473(x['conformsTo']):
+            return False
+        if 'created' in x and not _v511(x['created']):
+            return False
+        if 'creator' in x and not _v518(x['creator']):
+            return False
+        if 'description' in x and not _v526(x['description']):
+            return False
+        if 'identifier' in x and not _v527(x['identifier']):
+            return False
+        if 'otherIdentifier' in x and not _v530(x['otherIdentifier']):
+            return False
+        if 'language' in x and not _v532(x['language']):
+            return False
+        if 'license' in x and not _v537(x['license']):
+            return False
+        if 'modified' in x and not _v540(x['modified']):
+            return False
+        if 'publisher' in x and not _v547(x['publisher']):
+            return False
+        if 'accessRestriction' in x and not _v548(x['accessRestriction']):
+            return False
+        if 'cuiRestriction' in x and not _v558(x['cuiRestriction']):
+            return False
+        if 'useRestriction' in x and not _v568(x['useRestriction']):
+            return False
+        if 'rights' in x and not _v578(x['rights']):
+            return False
+        if 'rightsHolder' in x and not _v580(x['rightsHolder']):
+            return False
+        if 'spatial' in x and not _v582(x['spatial']):
+            return False
+        if 'temporal' in x and not _v614(x['temporal']):
+            return False
+        if 'title' in x and not _v635(x['title']):
+            return False
+        if 'category' in x and not _v636(x['category']):
+            return False
+        if 'hasQualityMeasurement' in x and not _v638(x['hasQualityMeasurement']):
+            return False
+        if 'qualifiedAttribution' in x and not _v652(x['qualifiedAttribution']):
+            return False
+        if 'wasUsedBy' in x and not _v659(x['wasUsedBy']):
+            return False
+    if isinstance(x, dict) and ('contactPoint' not in x or 'endpointURL' not in x or 'publisher' not in x or 'title' not in x):
+        return False
+    return True
+
+
+def _v454(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v455(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v456(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/contactPoint
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v457(item):
+                return False
+    return True
+
+
+def _v457(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/contactPoint/items
+    if not _v341(x):
+        return False
+    return True
+
+
+def _v458(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/endpointDescription
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v459(item):
+                return False
+    return True
+
+
+def _v459(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/endpointDescription/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v460(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/endpointURL
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v461(item):
+                return False
+    return True
+
+
+def _v461(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/endpointURL/items
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v462(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/keyword
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v463(item):
+                return False
+    return True
+
+
+def _v463(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/keyword/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v464(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/servesDataset
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v465(item):
+                return False
+    return True
+
+
+def _v465(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/servesDataset/items
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v466(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/spatialResolutionInMeters
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v467(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/temporalResolution
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v468(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/theme
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v469(item):
+                return False
+    return True
+
+
+def _v469(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/theme/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v470(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/accessRights
+    if not (_v471(x) or _v472(x)):
+        return False
+    return True
+
+
+def _v471(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/accessRights/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v472(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/accessRights/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v473(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/conformsTo
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v474(item):
+                return False
+    return True
+
+
+def _v474(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/conformsTo/items
+    if not _v475(x):
+        return False
+    return True
+
+
+def _v475(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v476(x['@id']):
+            return False
+        if '@type' in x and not _v477(x['@type']):
+            return False
+        if 'created' in x and not _v478(x['created']):
+            return False
+        if 'description' in x and not _v485(x['description']):
+            return False
+        if 'identifier' in x and not _v486(x['identifier']):
+            return False
+        if 'otherIdentifier' in x and not _v489(x['otherIdentifier']):
+            return False
+        if 'issued' in x and not _v491(x['issued']):
+            return False
+        if 'modified' in x and not _v498(x['modified']):
+            return False
+        if 'title' in x and not _v505(x['title']):
+            return False
+        if 'category' in x and not _v506(x['category']):
+            return False
+        if 'inScheme' in x and not _v508(x['inScheme']):
+            return False
+    return True
+
+
+def _v476(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v477(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v478(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/created
+    if not (_v479(x) or _v480(x)):
+        return False
+    return True
+
+
+def _v479(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/created/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v480(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/created/anyOf/1
+    if not (_v481(x) or _v482(x) or _v483(x) or _v484(x)):
+        return False
+    return True
+
+
+def _v481(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/created/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v482(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/created/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v483(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/created/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v484(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/created/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v485(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/description
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v486(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/identifier
+    if not (_v487(x) or _v488(x)):
+        return False
+    return True
+
+
+def _v487(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/identifier/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v488(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/identifier/anyOf/1
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v489(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/otherIdentifier
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v490(item):
+                return False
+    return True
+
+
+def _v490(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/otherIdentifier/items
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v491(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/issued
+    if not (_v492(x) or _v493(x)):
+        return False
+    return True
+
+
+def _v492(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/issued/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v493(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/issued/anyOf/1
+    if not (_v494(x) or _v495(x) or _v496(x) or _v497(x)):
+        return False
+    return True
+
+
+def _v494(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/issued/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v495(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/issued/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v496(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/issued/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v497(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/issued/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v498(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/modified
+    if not (_v499(x) or _v500(x)):
+        return False
+    return True
+
+
+def _v499(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/modified/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v500(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/modified/anyOf/1
+    if not (_v501(x) or _v502(x) or _v503(x) or _v504(x)):
+        return False
+    return True
+
+
+def _v501(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/modified/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v502(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/modified/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v503(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/modified/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v504(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/modified/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v505(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/title
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v506(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/category
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v507(item):
+                return False
+    return True
+
+
+def _v507(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/category/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v508(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/inScheme
+    if not (_v509(x) or _v510(x)):
+        return False
+    return True
+
+
+def _v509(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/inScheme/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v510(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/standard#/properties/inScheme/anyOf/1
+    if not _v412(x):
+        return False
+    return True
+
+
+def _v511(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/created
+    if not (_v512(x) or _v513(x)):
+        return False
+    return True
+
+
+def _v512(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/created/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v513(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/created/anyOf/1
+    if not (_v514(x) or _v515(x) or _v516(x) or _v517(x)):
+        return False
+    return True
+
+
+def _v514(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/created/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v515(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/created/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v516(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/created/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v517(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/created/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v518(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/creator
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v519(item):
+                return False
+    return True
+
+
+def _v519(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/creator/items
+    if not _v520(x):
+        return False
+    return True
+
+
+def _v520(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/agent#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v521(x['@id']):
+            return False
+        if '@type' in x and not _v522(x['@type']):
+            return False
+        if 'category' in x and not _v523(x['category']):
+            return False
+        if 'name' in x and not _v525(x['name']):
+            return False
+    if isinstance(x, dict) and ('name' not in x):
+        return False
+    return True
+
+
+def _v521(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/agent#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v522(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/agent#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v523(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/agent#/properties/category
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v524(item):
+                return False
+    return True
+
+
+def _v524(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/agent#/properties/category/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v525(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/agent#/properties/name
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v526(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/description
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v527(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/identifier
+    if not (_v528(x) or _v529(x)):
+        return False
+    return True
+
+
+def _v528(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/identifier/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v529(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/identifier/anyOf/1
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v530(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/otherIdentifier
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v531(item):
+                return False
+    return True
+
+
+def _v531(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/otherIdentifier/items
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v532(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/language
+    if not (_v533(x) or _v534(x) or _v535(x)):
+        return False
+    return True
+
+
+def _v533(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/language/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v534(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/language/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v535(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/language/anyOf/2
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v536(item):
+                return False
+    return True
+
+
+def _v536(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/language/anyOf/2/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v537(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/license
+    if not (_v538(x) or _v539(x)):
+        return False
+    return True
+
+
+def _v538(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/license/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v539(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/license/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v540(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/modified
+    if not (_v541(x) or _v542(x)):
+        return False
+    return True
+
+
+def _v541(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/modified/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v542(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/modified/anyOf/1
+    if not (_v543(x) or _v544(x) or _v545(x) or _v546(x)):
+        return False
+    return True
+
+
+def _v543(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/modified/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v544(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/modified/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v545(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/modified/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v546(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/modified/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v547(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/publisher
+    if not _v520(x):
+        return False
+    return True
+
+
+def _v548(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/accessRestriction
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v549(item):
+                return False
+    return True
+
+
+def _v549(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/accessRestriction/items
+    if not _v550(x):
+        return False
+    return True
+
+
+def _v550(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/accessrestriction#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v551(x['@id']):
+            return False
+        if '@type' in x and not _v552(x['@type']):
+            return False
+        if 'restrictionNote' in x and not _v553(x['restrictionNote']):
+            return False
+        if 'restrictionStatus' in x and not _v554(x['restrictionStatus']):
+            return False
+        if 'specificRestriction' in x and not _v555(x['specificRestriction']):
+            return False
+    if isinstance(x, dict) and ('restrictionStatus' not in x):
+        return False
+    return True
+
+
+def _v551(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/accessrestriction#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v552(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/accessrestriction#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v553(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/accessrestriction#/properties/restrictionNote
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v554(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/accessrestriction#/properties/restrictionStatus
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v555(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/accessrestriction#/properties/specificRestriction
+    if not (_v556(x) or _v557(x)):
+        return False
+    return True
+
+
+def _v556(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/accessrestriction#/properties/specificRestriction/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v557(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/accessrestriction#/properties/specificRestriction/anyOf/1
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v558(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/cuiRestriction
+    if not (_v559(x) or _v560(x)):
+        return False
+    return True
+
+
+def _v559(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/cuiRestriction/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v560(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/cuiRestriction/anyOf/1
+    if not _v561(x):
+        return False
+    return True
+
+
+def _v561(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/cuirestriction#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v562(x['@id']):
+            return False
+        if '@type' in x and not _v563(x['@type']):
+            return False
+        if 'cuiBannerMarking' in x and not _v564(x['cuiBannerMarking']):
+            return False
+        if 'designationIndicator' in x and not _v565(x['designationIndicator']):
+            return False
+        if 'requiredIndicatorPerAuthority' in x and not _v566(x['requiredIndicatorPerAuthority']):
+            return False
+    if isinstance(x, dict) and ('cuiBannerMarking' not in x or 'designationIndicator' not in x):
+        return False
+    return True
+
+
+def _v562(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/cuirestriction#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v563(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/cuirestriction#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v564(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/cuirestriction#/properties/cuiBannerMarking
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v565(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/cuirestriction#/properties/designationIndicator
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v566(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/cuirestriction#/properties/requiredIndicatorPerAuthority
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v567(item):
+                return False
+    return True
+
+
+def _v567(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/cuirestriction#/properties/requiredIndicatorPerAuthority/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v568(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/useRestriction
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v569(item):
+                return False
+    return True
+
+
+def _v569(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/useRestriction/items
+    if not _v570(x):
+        return False
+    return True
+
+
+def _v570(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/userestriction#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v571(x['@id']):
+            return False
+        if '@type' in x and not _v572(x['@type']):
+            return False
+        if 'restrictionNote' in x and not _v573(x['restrictionNote']):
+            return False
+        if 'restrictionStatus' in x and not _v574(x['restrictionStatus']):
+            return False
+        if 'specificRestriction' in x and not _v575(x['specificRestriction']):
+            return False
+    if isinstance(x, dict) and ('restrictionStatus' not in x):
+        return False
+    return True
+
+
+def _v571(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/userestriction#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v572(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/userestriction#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v573(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/userestriction#/properties/restrictionNote
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v574(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/userestriction#/properties/restrictionStatus
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v575(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/userestriction#/properties/specificRestriction
+    if not (_v576(x) or _v577(x)):
+        return False
+    return True
+
+
+def _v576(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/userestriction#/properties/specificRestriction/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v577(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/userestriction#/properties/specificRestriction/anyOf/1
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v578(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/rights
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v579(item):
+                return False
+    return True
+
+
+def _v579(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/rights/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v580(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/rightsHolder
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v581(item):
+                return False
+    return True
+
+
+def _v581(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/rightsHolder/items
+    if not _v377(x):
+        return False
+    return True
+
+
+def _v582(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/spatial
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v583(item):
+                return False
+    return True
+
+
+def _v583(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/spatial/items
+    if not _v584(x):
+        return False
+    return True
+
+
+def _v584(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v585(x['@id']):
+            return False
+        if '@type' in x and not _v586(x['@type']):
+            return False
+        if 'bbox' in x and not _v587(x['bbox']):
+            return False
+        if 'centroid' in x and not _v593(x['centroid']):
+            return False
+        if 'identifier' in x and not _v600(x['identifier']):
+            return False
+        if 'otherIdentifier' in x and not _v603(x['otherIdentifier']):
+            return False
+        if 'geometry' in x and not _v605(x['geometry']):
+            return False
+        if 'inScheme' in x and not _v609(x['inScheme']):
+            return False
+        if 'altLabel' in x and not _v612(x['altLabel']):
+            return False
+        if 'prefLabel' in x and not _v613(x['prefLabel']):
+            return False
+    return True
+
+
+def _v585(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v586(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v587(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/bbox
+    if not (_v588(x) or _v589(x) or _v590(x)):
+        return False
+    return True
+
+
+def _v588(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/bbox/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v589(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/bbox/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v590(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/bbox/anyOf/2
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'coordinates' in x and not _v591(x['coordinates']):
+            return False
+        if 'type' in x and not _v592(x['type']):
+            return False
+    if isinstance(x, dict) and ('type' not in x or 'coordinates' not in x):
+        return False
+    return True
+
+
+def _v591(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/bbox/anyOf/2/properties/coordinates
+    if not (isinstance(x, list)):
+        return False
+    return True
+
+
+def _v592(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/bbox/anyOf/2/properties/type
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x == 'Polygon'):
+        return False
+    return True
+
+
+def _v593(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/centroid
+    if not (_v594(x) or _v595(x) or _v596(x)):
+        return False
+    return True
+
+
+def _v594(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/centroid/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v595(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/centroid/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v596(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/centroid/anyOf/2
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'coordinates' in x and not _v597(x['coordinates']):
+            return False
+        if 'type' in x and not _v599(x['type']):
+            return False
+    if isinstance(x, dict) and ('type' not in x or 'coordinates' not in x):
+        return False
+    return True
+
+
+def _v597(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/centroid/anyOf/2/properties/coordinates
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v598(item):
+                return False
+    if isinstance(x, list) and len(x) < 2:
+        return False
+    if isinstance(x, list) and len(x) > 2:
+        return False
+    return True
+
+
+def _v598(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/centroid/anyOf/2/properties/coordinates/items
+    if not ((isinstance(x, numbers.Number) and not isinstance(x, bool))):
+        return False
+    return True
+
+
+def _v599(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/centroid/anyOf/2/properties/type
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x == 'Point'):
+        return False
+    return True
+
+
+def _v600(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/identifier
+    if not (_v601(x) or _v602(x)):
+        return False
+    return True
+
+
+def _v601(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/identifier/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v602(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/identifier/anyOf/1
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v603(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/otherIdentifier
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v604(item):
+                return False
+    return True
+
+
+def _v604(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/otherIdentifier/items
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v605(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/geometry
+    if not (_v606(x) or _v607(x) or _v608(x)):
+        return False
+    return True
+
+
+def _v606(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/geometry/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v607(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/geometry/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v608(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/geometry/anyOf/2
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict) and ('type' not in x or 'coordinates' not in x):
+        return False
+    return True
+
+
+def _v609(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/inScheme
+    if not (_v610(x) or _v611(x)):
+        return False
+    return True
+
+
+def _v610(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/inScheme/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v611(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/inScheme/anyOf/1
+    if not _v412(x):
+        return False
+    return True
+
+
+def _v612(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/altLabel
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v613(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/location#/properties/prefLabel
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v614(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/temporal
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v615(item):
+                return False
+    return True
+
+
+def _v615(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/temporal/items
+    if not _v616(x):
+        return False
+    return True
+
+
+def _v616(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v617(x['@id']):
+            return False
+        if '@type' in x and not _v618(x['@type']):
+            return False
+        if 'endDate' in x and not _v619(x['endDate']):
+            return False
+        if 'startDate' in x and not _v626(x['startDate']):
+            return False
+    if not (_v633(x) or _v634(x)):
+        return False
+    return True
+
+
+def _v617(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v618(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v619(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/endDate
+    if not (_v620(x) or _v621(x)):
+        return False
+    return True
+
+
+def _v620(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/endDate/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v621(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/endDate/anyOf/1
+    if not (_v622(x) or _v623(x) or _v624(x) or _v625(x)):
+        return False
+    return True
+
+
+def _v622(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/endDate/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v623(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/endDate/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v624(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/endDate/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v625(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/endDate/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v626(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/startDate
+    if not (_v627(x) or _v628(x)):
+        return False
+    return True
+
+
+def _v627(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/startDate/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v628(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/startDate/anyOf/1
+    if not (_v629(x) or _v630(x) or _v631(x) or _v632(x)):
+        return False
+    return True
+
+
+def _v629(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/startDate/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v630(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/startDate/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v631(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/startDate/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v632(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/properties/startDate/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v633(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/anyOf/0
+    if isinstance(x, dict) and ('startDate' not in x):
+        return False
+    return True
+
+
+def _v634(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/periodoftime#/anyOf/1
+    if isinstance(x, dict) and ('endDate' not in x):
+        return False
+    return True
+
+
+def _v635(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/title
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v636(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/category
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v637(item):
+                return False
+    return True
+
+
+def _v637(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/category/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v638(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/hasQualityMeasurement
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v639(item):
+                return False
+    return True
+
+
+def _v639(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/hasQualityMeasurement/items
+    if not _v640(x):
+        return False
+    return True
+
+
+def _v640(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/qualitymeasurement#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v641(x['@id']):
+            return False
+        if '@type' in x and not _v642(x['@type']):
+            return False
+        if 'isMeasurementOf' in x and not _v643(x['isMeasurementOf']):
+            return False
+        if 'value' in x and not _v650(x['value']):
+            return False
+        if 'unitMeasure' in x and not _v651(x['unitMeasure']):
+            return False
+    if isinstance(x, dict) and ('isMeasurementOf' not in x or 'value' not in x):
+        return False
+    return True
+
+
+def _v641(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/qualitymeasurement#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v642(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/qualitymeasurement#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v643(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/qualitymeasurement#/properties/isMeasurementOf
+    if not _v644(x):
+        return False
+    return True
+
+
+def _v644(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/metric#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v645(x['@id']):
+            return False
+        if '@type' in x and not _v646(x['@type']):
+            return False
+        if 'expectedDataType' in x and not _v647(x['expectedDataType']):
+            return False
+        if 'inDimension' in x and not _v648(x['inDimension']):
+            return False
+        if 'definition' in x and not _v649(x['definition']):
+            return False
+    if isinstance(x, dict) and ('expectedDataType' not in x or 'inDimension' not in x):
+        return False
+    return True
+
+
+def _v645(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/metric#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v646(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/metric#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v647(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/metric#/properties/expectedDataType
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v648(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/metric#/properties/inDimension
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v649(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/metric#/properties/definition
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v650(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/qualitymeasurement#/properties/value
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v651(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/qualitymeasurement#/properties/unitMeasure
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v652(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/qualifiedAttribution
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v653(item):
+                return False
+    return True
+
+
+def _v653(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/qualifiedAttribution/items
+    if not _v654(x):
+        return False
+    return True
+
+
+def _v654(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/attribution#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v655(x['@id']):
+            return False
+        if '@type' in x and not _v656(x['@type']):
+            return False
+        if 'hadRole' in x and not _v657(x['hadRole']):
+            return False
+        if 'agent' in x and not _v658(x['agent']):
+            return False
+    if isinstance(x, dict) and ('hadRole' not in x or 'agent' not in x):
+        return False
+    return True
+
+
+def _v655(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/attribution#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v656(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/attribution#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v657(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/attribution#/properties/hadRole
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v658(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/attribution#/properties/agent
+    if not _v520(x):
+        return False
+    return True
+
+
+def _v659(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/wasUsedBy
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v660(item):
+                return False
+    return True
+
+
+def _v660(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataservice#/properties/wasUsedBy/items
+    if not _v661(x):
+        return False
+    return True
+
+
+def _v661(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/activity#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v662(x['@id']):
+            return False
+        if '@type' in x and not _v663(x['@type']):
+            return False
+        if 'category' in x and not _v664(x['category']):
+            return False
+        if 'label' in x and not _v666(x['label']):
+            return False
+    if isinstance(x, dict) and ('label' not in x):
+        return False
+    return True
+
+
+def _v662(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/activity#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v663(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/activity#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v664(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/activity#/properties/category
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v665(item):
+                return False
+    return True
+
+
+def _v665(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/activity#/properties/category/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v666(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/activity#/properties/label
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v667(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessURL
+    if not (_v668(x) or _v669(x)):
+        return False
+    return True
+
+
+def _v668(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessURL/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v669(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessURL/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v670(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/byteSize
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v671(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/compressFormat
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v672(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/downloadURL
+    if not (_v673(x) or _v674(x)):
+        return False
+    return True
+
+
+def _v673(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/downloadURL/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v674(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/downloadURL/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v675(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/mediaType
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v676(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/packageFormat
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v677(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/spatialResolutionInMeters
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v678(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/temporalResolution
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v679(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/availability
+    if not (_v680(x) or _v681(x)):
+        return False
+    return True
+
+
+def _v680(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/availability/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v681(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/availability/anyOf/1
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v682(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessRestriction
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v683(item):
+                return False
+    return True
+
+
+def _v683(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessRestriction/items
+    if not _v550(x):
+        return False
+    return True
+
+
+def _v684(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/cuiRestriction
+    if not (_v685(x) or _v686(x)):
+        return False
+    return True
+
+
+def _v685(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/cuiRestriction/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v686(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/cuiRestriction/anyOf/1
+    if not _v561(x):
+        return False
+    return True
+
+
+def _v687(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/describedBy
+    if not (_v688(x) or _v689(x)):
+        return False
+    return True
+
+
+def _v688(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/describedBy/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v689(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/describedBy/anyOf/1
+    if not _v398(x):
+        return False
+    return True
+
+
+def _v690(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/useRestriction
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v691(item):
+                return False
+    return True
+
+
+def _v691(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/useRestriction/items
+    if not _v570(x):
+        return False
+    return True
+
+
+def _v692(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessRights
+    if not (_v693(x) or _v694(x)):
+        return False
+    return True
+
+
+def _v693(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessRights/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v694(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/accessRights/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v695(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/conformsTo
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v696(item):
+                return False
+    return True
+
+
+def _v696(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/conformsTo/items
+    if not _v475(x):
+        return False
+    return True
+
+
+def _v697(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/description
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v698(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/format
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v699(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/identifier
+    if not (_v700(x) or _v701(x)):
+        return False
+    return True
+
+
+def _v700(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/identifier/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v701(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/identifier/anyOf/1
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v702(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/otherIdentifier
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v703(item):
+                return False
+    return True
+
+
+def _v703(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/otherIdentifier/items
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v704(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/issued
+    if not (_v705(x) or _v706(x)):
+        return False
+    return True
+
+
+def _v705(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/issued/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v706(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/issued/anyOf/1
+    if not (_v707(x) or _v708(x) or _v709(x) or _v710(x)):
+        return False
+    return True
+
+
+def _v707(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/issued/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v708(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/issued/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v709(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/issued/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v710(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/issued/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v711(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/language
+    if not (_v712(x) or _v713(x) or _v714(x)):
+        return False
+    return True
+
+
+def _v712(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/language/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v713(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/language/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v714(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/language/anyOf/2
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v715(item):
+                return False
+    return True
+
+
+def _v715(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/language/anyOf/2/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v716(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/license
+    if not (_v717(x) or _v718(x)):
+        return False
+    return True
+
+
+def _v717(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/license/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v718(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/license/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v719(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/modified
+    if not (_v720(x) or _v721(x)):
+        return False
+    return True
+
+
+def _v720(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/modified/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v721(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/modified/anyOf/1
+    if not (_v722(x) or _v723(x) or _v724(x) or _v725(x)):
+        return False
+    return True
+
+
+def _v722(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/modified/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v723(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/modified/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v724(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/modified/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v725(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/modified/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v726(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/rights
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v727(item):
+                return False
+    return True
+
+
+def _v727(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/rights/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v728(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/title
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v729(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/hasQualityMeasurement
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v730(item):
+                return False
+    return True
+
+
+def _v730(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/hasQualityMeasurement/items
+    if not _v640(x):
+        return False
+    return True
+
+
+def _v731(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/page
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v732(item):
+                return False
+    return True
+
+
+def _v732(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/page/items
+    if not _v733(x):
+        return False
+    return True
+
+
+def _v733(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v734(x['@id']):
+            return False
+        if '@type' in x and not _v735(x['@type']):
+            return False
+        if 'accessURL' in x and not _v736(x['accessURL']):
+            return False
+        if 'downloadURL' in x and not _v739(x['downloadURL']):
+            return False
+        if 'creator' in x and not _v742(x['creator']):
+            return False
+        if 'mediaType' in x and not _v744(x['mediaType']):
+            return False
+        if 'abstract' in x and not _v745(x['abstract']):
+            return False
+        if 'bibliographicCitation' in x and not _v746(x['bibliographicCitation']):
+            return False
+        if 'conformsTo' in x and not _v747(x['conformsTo']):
+            return False
+        if 'corporateCreator' in x and not _v749(x['corporateCreator']):
+            return False
+        if 'description' in x and not _v751(x['description']):
+            return False
+        if 'identifier' in x and not _v752(x['identifier']):
+            return False
+        if 'otherIdentifier' in x and not _v755(x['otherIdentifier']):
+            return False
+        if 'issued' in x and not _v757(x['issued']):
+            return False
+        if 'publisher' in x and not _v764(x['publisher']):
+            return False
+        if 'title' in x and not _v766(x['title']):
+            return False
+        if 'category' in x and not _v767(x['category']):
+            return False
+    if isinstance(x, dict) and ('title' not in x):
+        return False
+    return True
+
+
+def _v734(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v735(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v736(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/accessURL
+    if not (_v737(x) or _v738(x)):
+        return False
+    return True
+
+
+def _v737(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/accessURL/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v738(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/accessURL/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v739(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/downloadURL
+    if not (_v740(x) or _v741(x)):
+        return False
+    return True
+
+
+def _v740(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/downloadURL/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v741(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/downloadURL/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v742(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/creator
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v743(item):
+                return False
+    return True
+
+
+def _v743(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/creator/items
+    if not _v341(x):
+        return False
+    return True
+
+
+def _v744(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/mediaType
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v745(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/abstract
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v746(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/bibliographicCitation
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v747(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/conformsTo
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v748(item):
+                return False
+    return True
+
+
+def _v748(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/conformsTo/items
+    if not _v475(x):
+        return False
+    return True
+
+
+def _v749(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/corporateCreator
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v750(item):
+                return False
+    return True
+
+
+def _v750(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/corporateCreator/items
+    if not _v377(x):
+        return False
+    return True
+
+
+def _v751(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/description
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v752(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/identifier
+    if not (_v753(x) or _v754(x)):
+        return False
+    return True
+
+
+def _v753(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/identifier/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v754(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/identifier/anyOf/1
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v755(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/otherIdentifier
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v756(item):
+                return False
+    return True
+
+
+def _v756(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/otherIdentifier/items
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v757(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/issued
+    if not (_v758(x) or _v759(x)):
+        return False
+    return True
+
+
+def _v758(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/issued/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v759(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/issued/anyOf/1
+    if not (_v760(x) or _v761(x) or _v762(x) or _v763(x)):
+        return False
+    return True
+
+
+def _v760(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/issued/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v761(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/issued/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v762(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/issued/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v763(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/issued/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v764(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/publisher
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v765(item):
+                return False
+    return True
+
+
+def _v765(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/publisher/items
+    if not _v377(x):
+        return False
+    return True
+
+
+def _v766(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/title
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v767(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/category
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v768(item):
+                return False
+    return True
+
+
+def _v768(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/document#/properties/category/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v769(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/image
+    if not (_v770(x) or _v771(x)):
+        return False
+    return True
+
+
+def _v770(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/image/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v771(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/image/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v772(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/checksum
+    if not (_v773(x) or _v774(x)):
+        return False
+    return True
+
+
+def _v773(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/checksum/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v774(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/distribution#/properties/checksum/anyOf/1
+    if not _v775(x):
+        return False
+    return True
+
+
+def _v775(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/checksum#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v776(x['@id']):
+            return False
+        if '@type' in x and not _v777(x['@type']):
+            return False
+        if 'algorithm' in x and not _v778(x['algorithm']):
+            return False
+        if 'checksumValue' in x and not _v779(x['checksumValue']):
+            return False
+    if isinstance(x, dict) and ('algorithm' not in x or 'checksumValue' not in x):
+        return False
+    return True
+
+
+def _v776(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/checksum#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v777(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/checksum#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v778(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/checksum#/properties/algorithm
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v779(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/checksum#/properties/checksumValue
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v780(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/status
+    if not (_v781(x) or _v782(x)):
+        return False
+    return True
+
+
+def _v781(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/status/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v782(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/status/anyOf/1
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v783(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/supportedSchema
+    if not (_v784(x) or _v785(x)):
+        return False
+    return True
+
+
+def _v784(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/supportedSchema/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v785(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/supportedSchema/anyOf/1
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v786(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/versionNotes
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v787(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/contactPoint
+    if not (_v788(x) or _v789(x)):
+        return False
+    return True
+
+
+def _v788(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/contactPoint/anyOf/0
+    if not _v341(x):
+        return False
+    return True
+
+
+def _v789(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/contactPoint/anyOf/1
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v790(item):
+                return False
+    return True
+
+
+def _v790(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/contactPoint/anyOf/1/items
+    if not _v341(x):
+        return False
+    return True
+
+
+def _v791(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/distribution
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v792(item):
+                return False
+    return True
+
+
+def _v792(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/distribution/items
+    if not _v398(x):
+        return False
+    return True
+
+
+def _v793(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/first
+    if not (_v794(x) or _v795(x)):
+        return False
+    return True
+
+
+def _v794(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/first/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v795(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/first/anyOf/1
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v796(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/hasCurrentVersion
+    if not (_v797(x) or _v798(x)):
+        return False
+    return True
+
+
+def _v797(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/hasCurrentVersion/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v798(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/hasCurrentVersion/anyOf/1
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v799(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/hasVersion
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v800(item):
+                return False
+    return True
+
+
+def _v800(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/hasVersion/items
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v801(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/inSeries
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v802(item):
+                return False
+    return True
+
+
+def _v802(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/inSeries/items
+    if not _v803(x):
+        return False
+    return True
+
+
+def _v803(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v804(x['@id']):
+            return False
+        if '@type' in x and not _v805(x['@type']):
+            return False
+        if 'contactPoint' in x and not _v806(x['contactPoint']):
+            return False
+        if 'first' in x and not _v808(x['first']):
+            return False
+        if 'last' in x and not _v811(x['last']):
+            return False
+        if 'seriesMember' in x and not _v814(x['seriesMember']):
+            return False
+        if 'accrualPeriodicity' in x and not _v816(x['accrualPeriodicity']):
+            return False
+        if 'description' in x and not _v821(x['description']):
+            return False
+        if 'issued' in x and not _v822(x['issued']):
+            return False
+        if 'modified' in x and not _v829(x['modified']):
+            return False
+        if 'publisher' in x and not _v836(x['publisher']):
+            return False
+        if 'spatial' in x and not _v839(x['spatial']):
+            return False
+        if 'temporal' in x and not _v841(x['temporal']):
+            return False
+        if 'title' in x and not _v843(x['title']):
+            return False
+    if isinstance(x, dict) and ('description' not in x or 'title' not in x):
+        return False
+    return True
+
+
+def _v804(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v805(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v806(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/contactPoint
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v807(item):
+                return False
+    return True
+
+
+def _v807(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/contactPoint/items
+    if not _v341(x):
+        return False
+    return True
+
+
+def _v808(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/first
+    if not (_v809(x) or _v810(x)):
+        return False
+    return True
+
+
+def _v809(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/first/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v810(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/first/anyOf/1
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v811(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/last
+    if not (_v812(x) or _v813(x)):
+        return False
+    return True
+
+
+def _v812(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/last/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v813(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/last/anyOf/1
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v814(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/seriesMember
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v815(item):
+                return False
+    return True
+
+
+def _v815(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/seriesMember/items
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v816(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/accrualPeriodicity
+    if not (_v817(x) or _v818(x) or _v819(x) or _v820(x)):
+        return False
+    return True
+
+
+def _v817(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/accrualPeriodicity/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v818(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/accrualPeriodicity/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _C19):
+        return False
+    return True
+
+
+def _v819(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/accrualPeriodicity/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C20.search(x):
+        return False
+    return True
+
+
+def _v820(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/accrualPeriodicity/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _C21):
+        return False
+    return True
+
+
+def _v821(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/description
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v822(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/issued
+    if not (_v823(x) or _v824(x)):
+        return False
+    return True
+
+
+def _v823(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/issued/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v824(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/issued/anyOf/1
+    if not (_v825(x) or _v826(x) or _v827(x) or _v828(x)):
+        return False
+    return True
+
+
+def _v825(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/issued/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v826(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/issued/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v827(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/issued/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v828(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/issued/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v829(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/modified
+    if not (_v830(x) or _v831(x)):
+        return False
+    return True
+
+
+def _v830(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/modified/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v831(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/modified/anyOf/1
+    if not (_v832(x) or _v833(x) or _v834(x) or _v835(x)):
+        return False
+    return True
+
+
+def _v832(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/modified/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v833(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/modified/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v834(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/modified/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v835(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/modified/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v836(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/publisher
+    if not (_v837(x) or _v838(x)):
+        return False
+    return True
+
+
+def _v837(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/publisher/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v838(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/publisher/anyOf/1
+    if not _v520(x):
+        return False
+    return True
+
+
+def _v839(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/spatial
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v840(item):
+                return False
+    return True
+
+
+def _v840(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/spatial/items
+    if not _v584(x):
+        return False
+    return True
+
+
+def _v841(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/temporal
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v842(item):
+                return False
+    return True
+
+
+def _v842(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/temporal/items
+    if not _v616(x):
+        return False
+    return True
+
+
+def _v843(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/datasetseries#/properties/title
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v844(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/keyword
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v845(item):
+                return False
+    return True
+
+
+def _v845(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/keyword/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v846(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/landingPage
+    if not (_v847(x) or _v848(x)):
+        return False
+    return True
+
+
+def _v847(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/landingPage/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v848(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/landingPage/anyOf/1
+    if not _v733(x):
+        return False
+    return True
+
+
+def _v849(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/previousVersion
+    if not (_v850(x) or _v851(x)):
+        return False
+    return True
+
+
+def _v850(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/previousVersion/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v851(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/previousVersion/anyOf/1
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v852(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/qualifiedRelation
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v853(item):
+                return False
+    return True
+
+
+def _v853(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/qualifiedRelation/items
+    if not _v854(x):
+        return False
+    return True
+
+
+def _v854(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/relationship#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v855(x['@id']):
+            return False
+        if '@type' in x and not _v856(x['@type']):
+            return False
+        if 'hadRole' in x and not _v857(x['hadRole']):
+            return False
+        if 'relation' in x and not _v858(x['relation']):
+            return False
+    if isinstance(x, dict) and ('hadRole' not in x or 'relation' not in x):
+        return False
+    return True
+
+
+def _v855(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/relationship#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v856(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/relationship#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v857(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/relationship#/properties/hadRole
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v858(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/relationship#/properties/relation
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v859(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/spatialResolutionInMeters
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v860(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/temporalResolution
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v861(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/theme
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v862(item):
+                return False
+    return True
+
+
+def _v862(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/theme/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v863(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/version
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v864(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/describedBy
+    if not (_v865(x) or _v866(x)):
+        return False
+    return True
+
+
+def _v865(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/describedBy/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v866(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/describedBy/anyOf/1
+    if not _v398(x):
+        return False
+    return True
+
+
+def _v867(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/liabilityStatement
+    if not (_v868(x) or _v869(x)):
+        return False
+    return True
+
+
+def _v868(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/liabilityStatement/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v869(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/liabilityStatement/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v870(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/metadataDistribution
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v871(item):
+                return False
+    return True
+
+
+def _v871(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/metadataDistribution/items
+    if not _v398(x):
+        return False
+    return True
+
+
+def _v872(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/purpose
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v873(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accessRights
+    if not (_v874(x) or _v875(x)):
+        return False
+    return True
+
+
+def _v874(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accessRights/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v875(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accessRights/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v876(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accrualPeriodicity
+    if not (_v877(x) or _v878(x) or _v879(x) or _v880(x)):
+        return False
+    return True
+
+
+def _v877(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accrualPeriodicity/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v878(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accrualPeriodicity/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _C19):
+        return False
+    return True
+
+
+def _v879(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accrualPeriodicity/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C20.search(x):
+        return False
+    return True
+
+
+def _v880(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accrualPeriodicity/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _C21):
+        return False
+    return True
+
+
+def _v881(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/conformsTo
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v882(item):
+                return False
+    return True
+
+
+def _v882(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/conformsTo/items
+    if not _v475(x):
+        return False
+    return True
+
+
+def _v883(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/contributor
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v884(item):
+                return False
+    return True
+
+
+def _v884(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/contributor/items
+    if not _v520(x):
+        return False
+    return True
+
+
+def _v885(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/created
+    if not (_v886(x) or _v887(x)):
+        return False
+    return True
+
+
+def _v886(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/created/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v887(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/created/anyOf/1
+    if not (_v888(x) or _v889(x) or _v890(x) or _v891(x)):
+        return False
+    return True
+
+
+def _v888(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/created/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v889(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/created/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v890(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/created/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v891(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/created/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v892(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/creator
+    if not (_v893(x) or _v894(x)):
+        return False
+    return True
+
+
+def _v893(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/creator/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v894(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/creator/anyOf/1
+    if not _v520(x):
+        return False
+    return True
+
+
+def _v895(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/description
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v896(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/hasPart
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v897(item):
+                return False
+    return True
+
+
+def _v897(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/hasPart/items
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v898(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/identifier
+    if not (_v899(x) or _v900(x)):
+        return False
+    return True
+
+
+def _v899(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/identifier/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v900(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/identifier/anyOf/1
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v901(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/isReferencedBy
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v902(item):
+                return False
+    return True
+
+
+def _v902(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/isReferencedBy/items
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v903(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/issued
+    if not (_v904(x) or _v905(x)):
+        return False
+    return True
+
+
+def _v904(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/issued/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v905(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/issued/anyOf/1
+    if not (_v906(x) or _v907(x) or _v908(x) or _v909(x)):
+        return False
+    return True
+
+
+def _v906(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/issued/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v907(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/issued/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v908(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/issued/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v909(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/issued/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v910(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/language
+    if not (_v911(x) or _v912(x) or _v913(x)):
+        return False
+    return True
+
+
+def _v911(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/language/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v912(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/language/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v913(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/language/anyOf/2
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v914(item):
+                return False
+    return True
+
+
+def _v914(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/language/anyOf/2/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v915(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/modified
+    if not (_v916(x) or _v917(x)):
+        return False
+    return True
+
+
+def _v916(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/modified/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v917(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/modified/anyOf/1
+    if not (_v918(x) or _v919(x) or _v920(x) or _v921(x)):
+        return False
+    return True
+
+
+def _v918(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/modified/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v919(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/modified/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v920(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/modified/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v921(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/modified/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v922(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/provenance
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v923(item):
+                return False
+    return True
+
+
+def _v923(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/provenance/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v924(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/publisher
+    if not (_v925(x) or _v926(x)):
+        return False
+    return True
+
+
+def _v925(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/publisher/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v926(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/publisher/anyOf/1
+    if not _v377(x):
+        return False
+    return True
+
+
+def _v927(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/relation
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v928(item):
+                return False
+    return True
+
+
+def _v928(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/relation/items
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v929(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/replaces
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v930(item):
+                return False
+    return True
+
+
+def _v930(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/replaces/items
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v931(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/license
+    if not (_v932(x) or _v933(x)):
+        return False
+    return True
+
+
+def _v932(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/license/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v933(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/license/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v934(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accessRestriction
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v935(item):
+                return False
+    return True
+
+
+def _v935(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/accessRestriction/items
+    if not _v550(x):
+        return False
+    return True
+
+
+def _v936(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/cuiRestriction
+    if not (_v937(x) or _v938(x)):
+        return False
+    return True
+
+
+def _v937(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/cuiRestriction/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v938(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/cuiRestriction/anyOf/1
+    if not _v561(x):
+        return False
+    return True
+
+
+def _v939(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/useRestriction
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v940(item):
+                return False
+    return True
+
+
+def _v940(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/useRestriction/items
+    if not _v570(x):
+        return False
+    return True
+
+
+def _v941(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/rights
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v942(item):
+                return False
+    return True
+
+
+def _v942(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/rights/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v943(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/rightsHolder
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v944(item):
+                return False
+    return True
+
+
+def _v944(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/rightsHolder/items
+    if not _v377(x):
+        return False
+    return True
+
+
+def _v945(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/source
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v946(item):
+                return False
+    return True
+
+
+def _v946(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/source/items
+    if not _v363(x):
+        return False
+    return True
+
+
+def _v947(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/spatial
+    if not (_v948(x) or _v949(x) or _v950(x)):
+        return False
+    return True
+
+
+def _v948(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/spatial/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v949(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/spatial/anyOf/1
+    if not _v584(x):
+        return False
+    return True
+
+
+def _v950(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/spatial/anyOf/2
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v951(item):
+                return False
+    return True
+
+
+def _v951(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/spatial/anyOf/2/items
+    if not _v584(x):
+        return False
+    return True
+
+
+def _v952(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/subject
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v953(item):
+                return False
+    return True
+
+
+def _v953(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/subject/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v954(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/temporal
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v955(item):
+                return False
+    return True
+
+
+def _v955(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/temporal/items
+    if not _v616(x):
+        return False
+    return True
+
+
+def _v956(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/title
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v957(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/category
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v958(item):
+                return False
+    return True
+
+
+def _v958(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/category/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v959(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/hasQualityMeasurement
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v960(item):
+                return False
+    return True
+
+
+def _v960(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/hasQualityMeasurement/items
+    if not _v640(x):
+        return False
+    return True
+
+
+def _v961(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/page
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v962(item):
+                return False
+    return True
+
+
+def _v962(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/page/items
+    if not _v733(x):
+        return False
+    return True
+
+
+def _v963(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/qualifiedAttribution
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v964(item):
+                return False
+    return True
+
+
+def _v964(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/qualifiedAttribution/items
+    if not _v654(x):
+        return False
+    return True
+
+
+def _v965(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/wasAttributedTo
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v966(item):
+                return False
+    return True
+
+
+def _v966(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/wasAttributedTo/items
+    if not _v520(x):
+        return False
+    return True
+
+
+def _v967(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/wasGeneratedBy
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v968(item):
+                return False
+    return True
+
+
+def _v968(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/wasGeneratedBy/items
+    if not _v661(x):
+        return False
+    return True
+
+
+def _v969(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/wasUsedBy
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v970(item):
+                return False
+    return True
+
+
+def _v970(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/wasUsedBy/items
+    if not _v661(x):
+        return False
+    return True
+
+
+def _v971(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/image
+    if not (_v972(x) or _v973(x)):
+        return False
+    return True
+
+
+def _v972(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/image/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v973(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/image/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v974(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/dataset#/properties/scopeNote
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v975(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/keyword
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v976(item):
+                return False
+    return True
+
+
+def _v976(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/keyword/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) < 1:
+        return False
+    return True
+
+
+def _v977(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/record
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v978(item):
+                return False
+    return True
+
+
+def _v978(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/record/items
+    if not _v979(x):
+        return False
+    return True
+
+
+def _v979(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if '@id' in x and not _v980(x['@id']):
+            return False
+        if '@type' in x and not _v981(x['@type']):
+            return False
+        if 'status' in x and not _v982(x['status']):
+            return False
+        if 'conformsTo' in x and not _v985(x['conformsTo']):
+            return False
+        if 'description' in x and not _v988(x['description']):
+            return False
+        if 'issued' in x and not _v990(x['issued']):
+            return False
+        if 'language' in x and not _v996(x['language']):
+            return False
+        if 'modified' in x and not _v1001(x['modified']):
+            return False
+        if 'source' in x and not _v1006(x['source']):
+            return False
+        if 'title' in x and not _v1007(x['title']):
+            return False
+        if 'primaryTopic' in x and not _v1008(x['primaryTopic']):
+            return False
+    if isinstance(x, dict) and ('modified' not in x or 'primaryTopic' not in x):
+        return False
+    return True
+
+
+def _v980(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/@id
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'iri'):
+        return False
+    return True
+
+
+def _v981(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/@type
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v982(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/status
+    if not (_v983(x) or _v984(x)):
+        return False
+    return True
+
+
+def _v983(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/status/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v984(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/status/anyOf/1
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v985(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/conformsTo
+    if not (_v986(x) or _v987(x)):
+        return False
+    return True
+
+
+def _v986(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/conformsTo/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v987(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/conformsTo/anyOf/1
+    if not _v475(x):
+        return False
+    return True
+
+
+def _v988(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/description
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v989(item):
+                return False
+    return True
+
+
+def _v989(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/description/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v990(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/issued
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v991(item):
+                return False
+    return True
+
+
+def _v991(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/issued/items
+    if not (_v992(x) or _v993(x) or _v994(x) or _v995(x)):
+        return False
+    return True
+
+
+def _v992(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/issued/items/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v993(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/issued/items/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v994(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/issued/items/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v995(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/issued/items/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v996(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/language
+    if not (_v997(x) or _v998(x) or _v999(x)):
+        return False
+    return True
+
+
+def _v997(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/language/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v998(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/language/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v999(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/language/anyOf/2
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1000(item):
+                return False
+    return True
+
+
+def _v1000(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/language/anyOf/2/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v1001(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/modified
+    if not (_v1002(x) or _v1003(x) or _v1004(x) or _v1005(x)):
+        return False
+    return True
+
+
+def _v1002(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/modified/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v1003(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/modified/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v1004(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/modified/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v1005(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/modified/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v1006(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/source
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v1007(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/title
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v1008(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalogrecord#/properties/primaryTopic
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v1009(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/service
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1010(item):
+                return False
+    return True
+
+
+def _v1010(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/service/items
+    if not _v453(x):
+        return False
+    return True
+
+
+def _v1011(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/theme
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1012(item):
+                return False
+    return True
+
+
+def _v1012(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/theme/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v1013(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/themeTaxonomy
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1014(item):
+                return False
+    return True
+
+
+def _v1014(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/themeTaxonomy/items
+    if not _v412(x):
+        return False
+    return True
+
+
+def _v1015(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/accessRights
+    if not (_v1016(x) or _v1017(x)):
+        return False
+    return True
+
+
+def _v1016(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/accessRights/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v1017(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/accessRights/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v1018(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/conformsTo
+    if not (_v1019(x) or _v1020(x)):
+        return False
+    return True
+
+
+def _v1019(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/conformsTo/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v1020(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/conformsTo/anyOf/1
+    if not _v475(x):
+        return False
+    return True
+
+
+def _v1021(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/creator
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1022(item):
+                return False
+    return True
+
+
+def _v1022(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/creator/items
+    if not _v520(x):
+        return False
+    return True
+
+
+def _v1023(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/description
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v1024(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/hasPart
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1025(item):
+                return False
+    return True
+
+
+def _v1025(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/hasPart/items
+    if not _v334(x):
+        return False
+    return True
+
+
+def _v1026(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/identifier
+    if not (_v1027(x) or _v1028(x)):
+        return False
+    return True
+
+
+def _v1027(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/identifier/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v1028(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/identifier/anyOf/1
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v1029(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/otherIdentifier
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1030(item):
+                return False
+    return True
+
+
+def _v1030(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/otherIdentifier/items
+    if not _v368(x):
+        return False
+    return True
+
+
+def _v1031(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/issued
+    if not (_v1032(x) or _v1033(x)):
+        return False
+    return True
+
+
+def _v1032(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/issued/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v1033(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/issued/anyOf/1
+    if not (_v1034(x) or _v1035(x) or _v1036(x) or _v1037(x)):
+        return False
+    return True
+
+
+def _v1034(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/issued/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v1035(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/issued/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v1036(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/issued/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v1037(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/issued/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v1038(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/language
+    if not (_v1039(x) or _v1040(x) or _v1041(x)):
+        return False
+    return True
+
+
+def _v1039(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/language/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v1040(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/language/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v1041(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/language/anyOf/2
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1042(item):
+                return False
+    return True
+
+
+def _v1042(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/language/anyOf/2/items
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and len(x) > 2:
+        return False
+    return True
+
+
+def _v1043(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/license
+    if not (_v1044(x) or _v1045(x)):
+        return False
+    return True
+
+
+def _v1044(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/license/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v1045(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/license/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v1046(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/modified
+    if not (_v1047(x) or _v1048(x)):
+        return False
+    return True
+
+
+def _v1047(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/modified/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v1048(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/modified/anyOf/1
+    if not (_v1049(x) or _v1050(x) or _v1051(x) or _v1052(x)):
+        return False
+    return True
+
+
+def _v1049(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/modified/anyOf/1/anyOf/0
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date-time'):
+        return False
+    return True
+
+
+def _v1050(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/modified/anyOf/1/anyOf/1
+    if not (isinstance(x, str)):
+        return False
+    if not conforms(x, 'date'):
+        return False
+    return True
+
+
+def _v1051(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/modified/anyOf/1/anyOf/2
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C17.search(x):
+        return False
+    return True
+
+
+def _v1052(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/modified/anyOf/1/anyOf/3
+    if not (isinstance(x, str)):
+        return False
+    if isinstance(x, str) and not _C18.search(x):
+        return False
+    return True
+
+
+def _v1053(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/publisher
+    if not (_v1054(x) or _v1055(x)):
+        return False
+    return True
+
+
+def _v1054(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/publisher/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v1055(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/publisher/anyOf/1
+    if not _v520(x):
+        return False
+    return True
+
+
+def _v1056(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/rights
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1057(item):
+                return False
+    return True
+
+
+def _v1057(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/rights/items
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v1058(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/rightsHolder
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1059(item):
+                return False
+    return True
+
+
+def _v1059(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/rightsHolder/items
+    if not _v377(x):
+        return False
+    return True
+
+
+def _v1060(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/spatial
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1061(item):
+                return False
+    return True
+
+
+def _v1061(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/spatial/items
+    if not _v584(x):
+        return False
+    return True
+
+
+def _v1062(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/subject
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1063(item):
+                return False
+    return True
+
+
+def _v1063(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/subject/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v1064(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/temporal
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1065(item):
+                return False
+    return True
+
+
+def _v1065(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/temporal/items
+    if not _v616(x):
+        return False
+    return True
+
+
+def _v1066(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/title
+    if not (x is None or isinstance(x, str)):
+        return False
+    return True
+
+
+def _v1067(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/category
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1068(item):
+                return False
+    return True
+
+
+def _v1068(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/category/items
+    if not _v404(x):
+        return False
+    return True
+
+
+def _v1069(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/homepage
+    if not (_v1070(x) or _v1071(x)):
+        return False
+    return True
+
+
+def _v1070(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/homepage/anyOf/0
+    if not (x is None):
+        return False
+    return True
+
+
+def _v1071(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/homepage/anyOf/1
+    if not _v733(x):
+        return False
+    return True
+
+
+def _v1072(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/qualifiedAttribution
+    if not (x is None or isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v1073(item):
+                return False
+    return True
+
+
+def _v1073(x):
+    # https://resources.data.gov/dcat-us/3.0.0/definitions/catalog#/properties/qualifiedAttribution/items
+    if not _v654(x):
+        return False
+    return True
+
+
+IS_VALID = {
+    'https://project-open-data.cio.gov/v1.1/schema/catalog.json': _v0,
+    'https://project-open-data.cio.gov/v1.1/schema/non-federal_dataset.json': _v173,
+    'https://resources.data.gov/dcat-us/3.0.0/definitions/catalog': _v334,
+    'https://resources.data.gov/dcat-us/3.0.0/definitions/dataset': _v363,
+}
+
+DIGESTS = {
+    'v1.1_definitions': 'f29f1b3e186c2077be987143eee775e16fd6e70031c74b25d9fe312e0c7c1c64',
+    'definitions': '63d164b3c7ac3a9f759f37e5eb4100cf543724c1155d56f3bd17f0c4dde5f66a',
+}
+
+JSONSCHEMA_VERSION = '4.26.0'
@@ -0,0 +1,96 @@
+"""Classify the date and duration strings found in DCAT-US v1.1 `modified`,
+`issued` and `temporal` values.
+
+The shapes that actually occur in catalogs (ISO 8601 dates and date-times,
+durations and repeating intervals) are recognized with precompiled
+patterns. Anything else falls back to `dateutil`, whose fuzzy parser
+decides what counted as a date before this module existed.
+"""
+import functools
+import re
+from datetime import datetime
+
+from dateutil import parser
+
+
+DATE = "date"
+DURATION = "duration"
+REPEATING_INTERVAL = "repeating interval"
+
+# Catalogs reuse a small number of distinct values, so results are cached.
+DATE_CACHE_SIZE = 4096
+
+_DATE_RE = re.compile(r"(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?\Z")
+_DATE_TIME_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ]"
+    r"(\d{2}):(\d{2})(?::(\d{2})(?:\.\d{1,6})?)?"
+    r"(?:Z|[+-](\d{2})(?::?(\d{2}))?)?\Z"
+)
+_NUMBER = r"\d+(?:[.,]\d+)?"
+_DURATION_RE = re.compile(
+    rf"P(?=[\dT])(?:{_NUMBER}Y)?(?:{_NUMBER}M)?(?:{_NUMBER}W)?"
+    rf"(?:{_NUMBER}D)?(?:T(?=\d)(?:{_NUMBER}H)?(?:{_NUMBER}M)?"
+    rf"(?:{_NUMBER}S)?)?\Z"
+)
+_REPEATING_INTERVAL_RE = re.compile(r"R\d*/(P.*)\Z")
+
+
+def classify(value: str) -> str | None:
+    """Return `DATE`, `DURATION` or `REPEATING_INTERVAL` for a value of a
+    recognized shape, or None if the value isn't one of them.
+
+    Only values that are also real calendar dates and times are
+    classified as `DATE`, so "2024-02-30" is None.
+    """
+    match = _DATE_RE.match(value)
+    if match:
+        year, month, day = match.groups()
+        return DATE if _is_valid_date_time(year, month, day) else None
+
+    match = _DATE_TIME_RE.match(value)
+    if match:
+        year, month, day, hour, minute, second, tz_hour, tz_minute = (
+            match.groups()
+        )
+        if (
+            (tz_hour is None or int(tz_hour) < 24)
+            and (tz_minute is None or int(tz_minute) < 60)
+            and _is_valid_date_time(year, month, day, hour, minute, second)
+        ):
+            return DATE
+        return None
+
+    if _DURATION_RE.match(value):
+        return DURATION
+
+    match = _REPEATING_INTERVAL_RE.match(value)
+    if match and _DURATION_RE.match(match.group(1)):
+        return REPEATING_INTERVAL
+
+    return None
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def is_date(value: str) -> bool:
+    """Return whether `dateutil` can parse `value` as a date, only asking
+    it for values `classify` doesn't recognize."""
+    kind = classify(value)
+    if kind is not None:
+        return kind == DATE
+    try:
+        parser.parse(value)
+        return True
+    except (ValueError, OverflowError):
+        return False
+
+
+def _is_valid_date_time(year, month=None, day=None, hour=None, minute=None,
+                        second=None) -> bool:
+    try:
+        datetime(
+            int(year), int(month or 1), int(day or 1),
+            int(hour or 0), int(minute or 0), int(second or 0)
+        )
+    except ValueError:
+        return False
+    return True
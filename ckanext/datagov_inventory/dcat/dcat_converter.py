@@ -1,20 +1,33 @@
 """Convert a valid DCAT-US v1.1 catalog to a valid DCAT-US v3.0 catalog."""
+import codecs
+import contextlib
 import copy
+import io
 import json
+import os
 import sys
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 
 import click
+import ijson
 from curl_cffi import requests
 from curl_cffi.requests.exceptions import RequestException
 
 from . import transforms
 from .validator import (
     CatalogValidationException,
+    MAX_ERRORS_PER_DATASET,
     V1_1_CATALOG_SCHEMA_ID,
+    V1_1_DATASET_SCHEMA_ID,
     V3_0_CATALOG_SCHEMA_ID,
-    load_schema_registry,
+    V3_0_DATASET_SCHEMA_ID,
+    get_is_valid,
+    get_schema_registry,
+    get_validator,
+    iter_catalog_items_json,
     validate_catalog,
     validate_datasets,
 )
@@ -25,6 +38,17 @@ V1_1_DEFINITIONS_DIR = SCRIPT_DIR / "v1.1_definitions"
 V3_0_DEFINITIONS_DIR = SCRIPT_DIR / "definitions"
 
 
+CATALOG_CONFORMS_TO = {
+    "@type": "Standard",
+    "title": "DCAT-US 3.0",
+    "identifier": "https://resources.data.gov/dcat-us/3.0.0",
+}
+CATALOG_DROPPED_KEYS = ("@context", "describedBy")
+
+# bytes read at a time from the catalog in streaming mode
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
 class CatalogFetchException(Exception):
     pass
 
@@ -65,49 +89,66 @@ def fetch_dcat_catalog(url: str) -> dict:
     return parsed
 
 
-def convert_dcat_catalog(old_catalog: dict) -> tuple[dict, list]:
+def convert_dcat_catalog(
+    old_catalog: dict, fused: bool = False, workers: int = 1
+) -> tuple[dict, list]:
     """Convert DCAT-US v1.1 catalog to DCAT-US v3.0 catalog.
 
     Returns a tuple of (catalog, errors) where:
     - catalog: dict with successfully transformed datasets
     - errors: list of dicts with metadata about failed datasets
+
+    With `fused=True` each dataset is run through
+    `transforms.transform_dataset`, which copies it once rather than once
+    per transform, and the catalog itself is only shallow-copied. With
+    `workers` > 1 the datasets are transformed that way in that many
+    processes. The output is identical either way.
     """
-    new_catalog = copy.deepcopy(old_catalog)
+    from . import parallel
+
+    parallel_transforms = workers is not None and workers > 1
+    if fused or parallel_transforms:
+        new_catalog = dict(old_catalog)
+    else:
+        new_catalog = copy.deepcopy(old_catalog)
     errors = []
 
     # conformsTo on the Catalog
-    new_catalog["conformsTo"] = {
-        "@type": "Standard",
-        "title": "DCAT-US 3.0",
-        "identifier": "https://resources.data.gov/dcat-us/3.0.0",
-    }
+    new_catalog["conformsTo"] = copy.deepcopy(CATALOG_CONFORMS_TO)
 
     # remove @context and describedBy from the Catalog
-    new_catalog.pop("@context", None)
-    new_catalog.pop("describedBy", None)
+    for key in CATALOG_DROPPED_KEYS:
+        new_catalog.pop(key, None)
 
     # The catalog may have a `modified` timestamp so we normalize
     # it to a timezone-aware date-time string (v3.0 requires one).
     catalog_modified = new_catalog.get("modified")
     if isinstance(catalog_modified, str):
-        try:
-            parsed = datetime.fromisoformat(catalog_modified)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            new_catalog["modified"] = parsed.astimezone(
-                timezone.utc
-            ).strftime("%Y-%m-%dT%H:%M:%SZ")
-        except ValueError:
+        catalog_modified = _normalize_catalog_modified(catalog_modified)
+        if catalog_modified is None:
             del new_catalog["modified"]
+        else:
+            new_catalog["modified"] = catalog_modified
 
     datasets = new_catalog.get("dataset", [])
     click.echo(f"Transforming {len(datasets)} datasets.")
     transformed_datasets = []
 
+    if fused or parallel_transforms:
+        results = parallel.map_chunks(
+            _transform_chunk, datasets, workers
+        )
+
     for i, dataset in enumerate(datasets):
         identifier = dataset.get("identifier", f"index {i}")
         title = dataset.get("title", "Unknown")
         try:
+            if fused or parallel_transforms:
+                transformed, error = results[i]
+                if error is not None:
+                    raise CatalogConversionException(error)
+                transformed_datasets.append(transformed)
+                continue
             dataset = transforms.transform_modified(dataset)
             dataset = transforms.transform_temporal(dataset)
             dataset = transforms.transform_spatial(dataset)
@@ -134,6 +175,34 @@ def convert_dcat_catalog(old_catalog: dict) -> tuple[dict, list]:
     return new_catalog, errors
 
 
+def _transform_chunk(datasets: list) -> list:
+    """Run each dataset through `transforms.transform_dataset`.
+
+    Returns one `(dataset, None)` or, if its transforms failed,
+    `(None, error message)` per dataset, so that pool workers can hand
+    failures back without pickling the exceptions themselves.
+    """
+    results = []
+    for dataset in datasets:
+        try:
+            results.append((transforms.transform_dataset(dataset), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+def _normalize_catalog_modified(value: str) -> str | None:
+    """Return the catalog `modified` value as a UTC date-time string, or
+    None if it can't be parsed."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def export_converted_catalog(catalog: dict, output_dir: str) -> None:
     """Write the converted DCAT-US v3.0 catalog to disk as JSON."""
     click.echo("Saving converted DCAT-US 3.0 to disk.")
@@ -148,6 +217,308 @@ def export_converted_catalog(catalog: dict, output_dir: str) -> None:
     click.echo(f"Wrote {output_file}")
 
 
+class _ChunkReader(io.RawIOBase):
+    """Binary file object reading from an iterator of byte chunks, with
+    any leading UTF-8 byte order mark removed."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+        self._started = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            if not self._started:
+                if len(chunk) < 3:
+                    # wait for enough bytes to recognise a BOM
+                    extra = next(self._chunks, None)
+                    if extra is not None:
+                        self._chunks = iter([chunk + extra, *self._chunks])
+                        continue
+                self._started = True
+                chunk = chunk.removeprefix(codecs.BOM_UTF8)
+            self._buffer = chunk
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+@contextlib.contextmanager
+def open_dcat_catalog(url: str):
+    """Open a DCAT-US v1.1 catalog at a URL or local path for streaming.
+
+    Yields a binary file object that reads the catalog incrementally
+    rather than loading the whole body into memory.
+    """
+    if url.startswith("file://") or "://" not in url:
+        path = url.removeprefix("file://")
+        try:
+            f = open(path, "rb")
+        except OSError as e:
+            raise CatalogFetchException(
+                f"Could not open {path}: {e}"
+            ) from e
+        with f:
+            yield io.BufferedReader(
+                _ChunkReader(iter(lambda: f.read(STREAM_CHUNK_SIZE), b""))
+            )
+        return
+
+    try:
+        response = requests.get(
+            url, timeout=60, impersonate="safari17_0", stream=True
+        )
+        response.raise_for_status()
+    except RequestException as e:
+        raise CatalogFetchException(
+            f"Request failed: {type(e).__name__}: {e!r}"
+        ) from e
+
+    try:
+        yield io.BufferedReader(_ChunkReader(
+            response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        ))
+    finally:
+        response.close()
+
+
+def iter_catalog_items(fp) -> Iterator[tuple]:
+    """Yield the top-level `(key, value)` pairs of a catalog as it is
+    parsed from `fp`.
+
+    The value of `dataset` is an iterator that parses one dataset at a
+    time; it must be consumed before the next pair is requested (any
+    datasets left over are skipped).
+    """
+    events = ijson.parse(fp, use_float=True)
+    try:
+        _, event, _ = next(events, (None, None, None))
+        if event != "start_map":
+            raise CatalogFetchException(
+                "Expected a JSON object at the catalog root"
+            )
+        for _, event, value in events:
+            if event == "end_map":
+                return
+            key = value
+            _, event, value = next(events)
+            if key == "dataset" and event == "start_array":
+                datasets = _iter_array_items(events)
+                yield key, datasets
+                for _ in datasets:
+                    pass
+            else:
+                yield key, _build_value(event, value, events)
+    except ijson.JSONError as e:
+        raise CatalogFetchException(
+            f"Response was not valid JSON: {e}"
+        ) from e
+
+
+def _iter_array_items(events) -> Iterator:
+    for _, event, value in events:
+        if event == "end_array":
+            return
+        yield _build_value(event, value, events)
+
+
+def _build_value(event, value, events):
+    """Build the JSON value that starts with `event` from `events`."""
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1 if event in ("start_map", "start_array") else 0
+    while depth:
+        _, event, value = next(events)
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+    return builder.value
+
+
+def convert_dcat_catalog_items(items, errors: list) -> Iterator[tuple]:
+    """Streaming version of `convert_dcat_catalog`.
+
+    Takes and yields the top-level `(key, value)` pairs of a catalog, as
+    produced by `iter_catalog_items`, transforming datasets one at a time
+    as the `dataset` iterator is consumed. Datasets that fail to
+    transform are appended to `errors`. The pairs come out in the same
+    order as the keys of the catalog `convert_dcat_catalog` returns.
+    """
+    seen = set()
+    for key, value in items:
+        seen.add(key)
+        if key in CATALOG_DROPPED_KEYS:
+            continue
+        if key == "conformsTo":
+            value = copy.deepcopy(CATALOG_CONFORMS_TO)
+        elif key == "modified" and isinstance(value, str):
+            value = _normalize_catalog_modified(value)
+            if value is None:
+                continue
+        elif key == "dataset":
+            value = _transform_datasets(value, errors)
+        yield key, value
+
+    if "conformsTo" not in seen:
+        yield "conformsTo", copy.deepcopy(CATALOG_CONFORMS_TO)
+    if "dataset" not in seen:
+        yield "dataset", []
+
+
+def _transform_datasets(datasets, errors: list) -> Iterator[dict]:
+    click.echo("Transforming datasets.")
+    for i, dataset in enumerate(datasets):
+        identifier = dataset.get("identifier", f"index {i}")
+        title = dataset.get("title", "Unknown")
+        try:
+            # the parsed dataset isn't shared with anything else, so it
+            # is safe to transform it in place
+            for transform in transforms.DATASET_TRANSFORMS:
+                transform(dataset, in_place=True)
+        except Exception as e:
+            errors.append({
+                "identifier": identifier,
+                "title": title,
+                "error": str(e)
+            })
+            click.echo(f"Error transforming dataset {identifier}: {e}")
+            continue
+        yield dataset
+
+
+def _inspect_datasets(items, header: dict, inspect) -> Iterator[tuple]:
+    """Pass catalog `(key, value)` pairs through, calling `inspect` on
+    each dataset and collecting every other pair into `header`."""
+    for key, value in items:
+        if key == "dataset" and isinstance(value, (list, Iterator)):
+            value = _inspecting(value, inspect)
+        else:
+            header[key] = value
+        yield key, value
+
+
+def _inspecting(datasets, inspect) -> Iterator[dict]:
+    for dataset in datasets:
+        inspect(dataset)
+        yield dataset
+
+
+def _count_validity(schema_id: str, counts: dict, suffix: str):
+    """Return a callable that validates a dataset against `schema_id` and
+    tallies the result into `counts`."""
+    validator = get_validator(schema_id)
+    is_valid = get_is_valid(schema_id)
+
+    def count(dataset):
+        if is_valid is not None and is_valid(dataset):
+            errors = 0
+        else:
+            errors = sum(1 for _ in islice(
+                validator.iter_errors(dataset), MAX_ERRORS_PER_DATASET
+            ))
+        if errors:
+            counts[f"invalid_{suffix}"] += 1
+            counts[f"validation_errors_{suffix}"] += errors
+        else:
+            counts[f"valid_{suffix}"] += 1
+
+    return count
+
+
+def stream_converted_catalog(items, output_dir: str | None) -> None:
+    """Consume catalog `(key, value)` pairs, writing them to
+    `output_dir/catalog.json` as they arrive, or discarding them if
+    `output_dir` is None."""
+    if output_dir is None:
+        for _ in iter_catalog_items_json(items):
+            pass
+        return
+
+    click.echo("Saving converted DCAT-US 3.0 to disk.")
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    output_file = output_path / "catalog.json"
+    partial_file = output_path / "catalog.json.partial"
+    with partial_file.open("w", encoding="utf-8") as f:
+        for text in iter_catalog_items_json(items):
+            f.write(text)
+    os.replace(partial_file, output_file)
+
+    click.echo(f"Wrote {output_file}")
+
+
+def convert_dcat_catalog_streaming(
+    url: str, output_dir: str | None, counts: dict
+) -> list:
+    """Convert the catalog at `url` one dataset at a time.
+
+    Each dataset is read, validated against v1.1, transformed, validated
+    against v3.0 and written out before the next one is read, so memory
+    use is bounded by the largest dataset rather than the whole catalog.
+    The catalog-level schemas are checked against the catalog fields with
+    an empty dataset list. Validation results are tallied into `counts`;
+    returns the list of datasets that failed to transform.
+    """
+    v1_1_header = {}
+    v3_0_header = {}
+    errors = []
+
+    with open_dcat_catalog(url) as fp:
+        items = iter_catalog_items(fp)
+        items = _inspect_datasets(
+            items, v1_1_header,
+            _count_validity(V1_1_DATASET_SCHEMA_ID, counts, "v1_1")
+        )
+        items = convert_dcat_catalog_items(items, errors)
+        items = _inspect_datasets(
+            items, v3_0_header,
+            _count_validity(V3_0_DATASET_SCHEMA_ID, counts, "v3_0")
+        )
+        stream_converted_catalog(items, output_dir)
+
+    try:
+        validate_catalog(
+            V1_1_CATALOG_SCHEMA_ID,
+            get_schema_registry(V1_1_DEFINITIONS_DIR),
+            {**v1_1_header, "dataset": []}
+        )
+        click.echo("Input catalog is valid DCAT-US v1.1.")
+    except CatalogValidationException:
+        click.echo(
+            "Warning: input catalog failed v1.1 validation "
+            "— converting anyway."
+        )
+    try:
+        validate_catalog(
+            V3_0_CATALOG_SCHEMA_ID,
+            get_schema_registry(V3_0_DEFINITIONS_DIR),
+            {**v3_0_header, "dataset": []}
+        )
+    except CatalogValidationException as e:
+        click.echo(f"Invalid DCAT-US data: {e}", err=True)
+
+    counts["datasets"] = counts["valid_v1_1"] + counts["invalid_v1_1"]
+    click.echo(
+        f"Per-dataset v1.1: {counts['valid_v1_1']} valid, "
+        f"{counts['invalid_v1_1']} invalid."
+    )
+    click.echo(
+        f"Per-dataset v3.0: {counts['valid_v3_0']} valid, "
+        f"{counts['invalid_v3_0']} invalid."
+    )
+    return errors
+
+
 @click.command()
 @click.option(
     "-o", "--output-dir",
@@ -165,10 +536,27 @@ def export_converted_catalog(catalog: dict, output_dir: str) -> None:
     is_flag=True,
     default=False
 )
-def main(output_dir, url, dry_run):
+@click.option(
+    "-w", "--workers",
+    help="Number of processes to convert and validate datasets with",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True
+)
+@click.option(
+    "--stream",
+    help=(
+        "Read, convert and write the catalog one dataset at a time "
+        "instead of loading it into memory. --url may also be a local "
+        "file path."
+    ),
+    is_flag=True,
+    default=False
+)
+def main(output_dir, url, dry_run, workers, stream):
     """Convert DCAT catalog."""
-    v1_1_registry = load_schema_registry(V1_1_DEFINITIONS_DIR)
-    v3_0_registry = load_schema_registry(V3_0_DEFINITIONS_DIR)
+    v1_1_registry = get_schema_registry(V1_1_DEFINITIONS_DIR)
+    v3_0_registry = get_schema_registry(V3_0_DEFINITIONS_DIR)
 
     results = {
         "error": False,
@@ -186,82 +574,90 @@ def main(output_dir, url, dry_run):
     }
 
     click.echo(f"Converting DCAT-US v1.1 to DCAT-US v3.0 for {url}")
+    transforms.prewarm_language_cache()
     try:
-        catalog_to_convert = fetch_dcat_catalog(url)
-        datasets = catalog_to_convert.get("dataset", [])
-
-        try:
-            validate_catalog(
-                V1_1_CATALOG_SCHEMA_ID, v1_1_registry, catalog_to_convert
-            )
-            click.echo("Input catalog is valid DCAT-US v1.1.")
-        except CatalogValidationException:
-            click.echo(
-                "Warning: input catalog failed v1.1 validation "
-                "— converting anyway."
+        if stream:
+            conversion_errors = convert_dcat_catalog_streaming(
+                url, None if dry_run else output_dir, counts
             )
-
-        # Per-dataset v1.1 validation
-        # The v1.1 catalog schema validates the catalog wrapper,
-        # not individual datasets directly.
-        V1_1_DATASET_SCHEMA_ID = (
-            "https://project-open-data.cio.gov/v1.1/schema/"
-            "non-federal_dataset.json"
-        )
-        valid_v1_1, invalid_v1_1, validation_errors_v1_1 = (
-            validate_datasets(
-                V1_1_DATASET_SCHEMA_ID, v1_1_registry, datasets
+            if conversion_errors:
+                click.echo(
+                    f"Conversion errors: {len(conversion_errors)} "
+                    "datasets failed transformation"
+                )
+            if dry_run:
+                click.echo("Dry run complete.")
+        else:
+            catalog_to_convert = fetch_dcat_catalog(url)
+            datasets = catalog_to_convert.get("dataset", [])
+
+            try:
+                validate_catalog(
+                    V1_1_CATALOG_SCHEMA_ID, v1_1_registry, catalog_to_convert
+                )
+                click.echo("Input catalog is valid DCAT-US v1.1.")
+            except CatalogValidationException:
+                click.echo(
+                    "Warning: input catalog failed v1.1 validation "
+                    "— converting anyway."
+                )
+
+            # Per-dataset v1.1 validation
+            # The v1.1 catalog schema validates the catalog wrapper,
+            # not individual datasets directly.
+            valid_v1_1, invalid_v1_1, validation_errors_v1_1 = (
+                validate_datasets(
+                    V1_1_DATASET_SCHEMA_ID, v1_1_registry, datasets,
+                    workers=workers
+                )
             )
-        )
-        counts["valid_v1_1"] = valid_v1_1
-        counts["invalid_v1_1"] = invalid_v1_1
-        counts["validation_errors_v1_1"] = validation_errors_v1_1
-        counts["datasets"] = valid_v1_1 + invalid_v1_1
-        click.echo(
-            f"Per-dataset v1.1: {valid_v1_1} valid, "
-            f"{invalid_v1_1} invalid."
-        )
-
-        converted_catalog, conversion_errors = convert_dcat_catalog(
-            catalog_to_convert
-        )
-
-        if conversion_errors:
+            counts["valid_v1_1"] = valid_v1_1
+            counts["invalid_v1_1"] = invalid_v1_1
+            counts["validation_errors_v1_1"] = validation_errors_v1_1
+            counts["datasets"] = valid_v1_1 + invalid_v1_1
             click.echo(
-                f"Conversion errors: {len(conversion_errors)} "
-                "datasets failed transformation"
+                f"Per-dataset v1.1: {valid_v1_1} valid, "
+                f"{invalid_v1_1} invalid."
             )
 
-        try:
-            validate_catalog(
-                V3_0_CATALOG_SCHEMA_ID, v3_0_registry, converted_catalog
+            converted_catalog, conversion_errors = convert_dcat_catalog(
+                catalog_to_convert, fused=True, workers=workers
             )
-        except CatalogValidationException as e:
-            click.echo(f"Invalid DCAT-US data: {e}", err=True)
 
-        converted_datasets = converted_catalog.get("dataset", [])
-        V3_0_DATASET_SCHEMA_ID = (
-            "https://resources.data.gov/dcat-us/3.0.0/definitions/dataset"
-        )
-        valid_v3_0, invalid_v3_0, validation_errors_v3_0 = (
-            validate_datasets(
-                V3_0_DATASET_SCHEMA_ID, v3_0_registry, converted_datasets
+            if conversion_errors:
+                click.echo(
+                    f"Conversion errors: {len(conversion_errors)} "
+                    "datasets failed transformation"
+                )
+
+            try:
+                validate_catalog(
+                    V3_0_CATALOG_SCHEMA_ID, v3_0_registry, converted_catalog
+                )
+            except CatalogValidationException as e:
+                click.echo(f"Invalid DCAT-US data: {e}", err=True)
+
+            converted_datasets = converted_catalog.get("dataset", [])
+            valid_v3_0, invalid_v3_0, validation_errors_v3_0 = (
+                validate_datasets(
+                    V3_0_DATASET_SCHEMA_ID, v3_0_registry, converted_datasets,
+                    workers=workers
+                )
+            )
+            counts["valid_v3_0"] = valid_v3_0
+            counts["invalid_v3_0"] = invalid_v3_0
+            counts["validation_errors_v3_0"] = validation_errors_v3_0
+            click.echo(
+                f"Per-dataset v3.0: {valid_v3_0} valid, "
+                f"{invalid_v3_0} invalid."
             )
-        )
-        counts["valid_v3_0"] = valid_v3_0
-        counts["invalid_v3_0"] = invalid_v3_0
-        counts["validation_errors_v3_0"] = validation_errors_v3_0
-        click.echo(
-            f"Per-dataset v3.0: {valid_v3_0} valid, "
-            f"{invalid_v3_0} invalid."
-        )
 
-        if dry_run:
-            click.echo("Dry run complete.")
-        elif results["error"] is False:
-            click.echo("Could not convert.")
-        else:
-            export_converted_catalog(converted_catalog, output_dir)
+            if dry_run:
+                click.echo("Dry run complete.")
+            elif results["error"] is False:
+                click.echo("Could not convert.")
+            else:
+                export_converted_catalog(converted_catalog, output_dir)
 
     except CatalogFetchException as e:
         results["error"] = True
@@ -0,0 +1,43 @@
+"""Process-pool helpers for spreading per-dataset work across cores."""
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Each worker gets a few chunks so a slow chunk doesn't leave the other
+# workers idle at the end.
+CHUNKS_PER_WORKER = 4
+
+
+def chunked(items: list, size: int) -> list:
+    """Split `items` into consecutive lists of at most `size` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def map_chunks(fn, items: list, workers: int = 1, initializer=None,
+               initargs=()) -> list:
+    """Apply `fn` to chunks of `items` and concatenate the results.
+
+    `fn` takes a list of items and returns a list of results, one per
+    item. With `workers` > 1 the chunks are handed to a pool of that many
+    processes; either way the results come back in the order of `items`.
+
+    `fn` and `initializer` must be importable module-level functions, as
+    the pool uses the "spawn" start method so that workers don't inherit
+    open database or redis connections from a forked CKAN process.
+    """
+    if workers is None or workers <= 1 or len(items) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return fn(items)
+
+    size = max(1, math.ceil(len(items) / (workers * CHUNKS_PER_WORKER)))
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        for chunk_results in executor.map(fn, chunked(items, size)):
+            results.extend(chunk_results)
+    return results
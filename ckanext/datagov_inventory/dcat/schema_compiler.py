@@ -0,0 +1,455 @@
+"""Compile the DCAT-US JSON schemas into plain Python validation functions.
+
+`jsonschema` walks the schema for every instance it validates, resolving
+each `$ref` and trying each `anyOf` alternative as it goes. The functions
+generated here make the same checks with every reference resolved ahead of
+time, and only answer whether an instance is valid. `jsonschema` is still
+what describes the problems with instances that aren't.
+
+    python -m ckanext.datagov_inventory.dcat.schema_compiler
+
+regenerates ``compiled_schemas.py``, and has to be run whenever the schema
+definitions change. Until it is, `validator.get_is_valid` compiles the
+changed definitions in memory instead.
+"""
+import hashlib
+from importlib.metadata import version
+from pathlib import Path
+
+import click
+from jsonschema import _keywords, _legacy_keywords
+from jsonschema.validators import validator_for
+from referencing.jsonschema import specification_with
+
+from . import validator
+
+
+COMPILED_SCHEMAS_PATH = Path(__file__).parent / "compiled_schemas.py"
+COMPILED_SCHEMA_IDS = (
+    validator.V1_1_CATALOG_SCHEMA_ID,
+    validator.V1_1_DATASET_SCHEMA_ID,
+    validator.V3_0_CATALOG_SCHEMA_ID,
+    validator.V3_0_DATASET_SCHEMA_ID,
+)
+
+# `jsonschema` type names and the expressions that check them for `x`
+TYPE_CHECKS = {
+    "array": "isinstance(x, list)",
+    "boolean": "isinstance(x, bool)",
+    "integer": (
+        "(isinstance(x, int) and not isinstance(x, bool)"
+        " or isinstance(x, float) and x.is_integer())"
+    ),
+    "null": "x is None",
+    "number": "(isinstance(x, numbers.Number) and not isinstance(x, bool))",
+    "object": "isinstance(x, dict)",
+    "string": "isinstance(x, str)",
+}
+
+MODULE_HEADER = '''\
+"""DCAT-US schemas compiled to Python by `schema_compiler`.
+
+Generated by ``python -m ckanext.datagov_inventory.dcat.schema_compiler``;
+do not edit.
+"""
+# flake8: noqa
+import numbers
+import re
+
+from jsonschema import Draft202012Validator
+from jsonschema._utils import equal, uniq
+
+conforms = Draft202012Validator.FORMAT_CHECKER.conforms
+'''
+
+
+class SchemaCompileError(Exception):
+    pass
+
+
+def jsonschema_version() -> str:
+    """Return the installed `jsonschema` version.
+
+    The generated functions follow the keyword semantics, and use the
+    helpers, of the `jsonschema` release they were compiled against.
+    """
+    return version("jsonschema")
+
+
+def definitions_digest(definitions_dir: Path) -> str:
+    """Return a digest of the schema files in `definitions_dir`."""
+    digest = hashlib.sha256()
+    for schema_file in sorted(definitions_dir.glob("*.json")):
+        digest.update(schema_file.name.encode("utf-8"))
+        digest.update(schema_file.read_bytes())
+    return digest.hexdigest()
+
+
+def generate_module(schema_ids=COMPILED_SCHEMA_IDS) -> str:
+    """Return the source of a module that defines `IS_VALID`, a compiled
+    `is_valid(instance)` function for each of `schema_ids`, `DIGESTS`,
+    the `definitions_digest` of each definitions directory they were
+    compiled from, and `JSONSCHEMA_VERSION`."""
+    compiler = _Compiler()
+    roots = {}
+    digests = {}
+    for schema_id in schema_ids:
+        definitions_dir = validator._definitions_dir_for(schema_id)
+        registry = validator.get_schema_registry(definitions_dir)
+        resolved = registry.resolver().lookup(schema_id)
+        roots[schema_id] = compiler.function_for(
+            resolved.contents, resolved.resolver
+        )
+        digests[definitions_dir.name] = definitions_digest(definitions_dir)
+
+    lines = [MODULE_HEADER]
+    lines.extend(compiler.constants)
+    lines.append("")
+    for function in compiler.functions:
+        lines.append("")
+        lines.extend(function)
+        lines.append("")
+    lines.append("")
+    lines.append("IS_VALID = {")
+    lines.extend(
+        f"    {schema_id!r}: {name},"
+        for schema_id, name in roots.items()
+    )
+    lines.append("}")
+    lines.append("")
+    lines.append("DIGESTS = {")
+    lines.extend(
+        f"    {name!r}: {digest!r}," for name, digest in digests.items()
+    )
+    lines.append("}")
+    lines.append("")
+    lines.append(f"JSONSCHEMA_VERSION = {jsonschema_version()!r}")
+    return "\n".join(lines) + "\n"
+
+
+def load_module(source: str) -> dict:
+    """Execute generated module source and return its namespace."""
+    namespace = {"__name__": "compiled_schemas"}
+    exec(compile(source, "<compiled DCAT-US schemas>", "exec"), namespace)
+    return namespace
+
+
+class _Compiler(object):
+    """Turns schemas into the source of one function per schema.
+
+    Each schema is compiled with the rules of the validator class
+    `jsonschema` would switch to when it reaches it, so the v1.1 draft-04
+    schemas keep their draft-04 meaning.
+    """
+
+    def __init__(self):
+        self.constants = []
+        self.functions = []
+        self._names = {}
+        self._constant_names = {}
+        self._keywords = {
+            _keywords.ref: self._ref,
+            _keywords.type: self._type,
+            _keywords.anyOf: self._anyOf,
+            _keywords.allOf: self._allOf,
+            _keywords.oneOf: self._oneOf,
+            _keywords.not_: self._not,
+            _keywords.properties: self._properties,
+            _keywords.required: self._required,
+            _keywords.dependentRequired: self._dependentRequired,
+            _keywords.dependentSchemas: self._dependentSchemas,
+            _legacy_keywords.dependencies_draft4_draft6_draft7: (
+                self._dependencies
+            ),
+            _keywords.items: self._items,
+            _legacy_keywords.items_draft3_draft4: self._items_draft4,
+            _keywords.minItems: self._minItems,
+            _keywords.maxItems: self._maxItems,
+            _keywords.uniqueItems: self._uniqueItems,
+            _keywords.minLength: self._minLength,
+            _keywords.maxLength: self._maxLength,
+            _keywords.pattern: self._pattern,
+            _keywords.format: self._format,
+            _keywords.enum: self._enum,
+            _keywords.const: self._const,
+        }
+
+    def function_for(self, schema, resolver, cls=validator.ValidatorClass,
+                     pointer="") -> str:
+        """Return the name of the function that validates `schema`,
+        generating it if it hasn't been already.
+
+        `resolver` resolves the references in `schema` and `cls` is the
+        validator class in use, as they would be when `jsonschema`
+        reaches the schema.
+        """
+        cls = validator_for(schema, default=cls)
+        key = (resolver._base_uri, id(schema), cls)
+        if key in self._names:
+            return self._names[key]
+        name = f"_v{len(self._names)}"
+        self._names[key] = name
+        # keep the functions in the order they're named, although compiling
+        # this one names the ones it calls first
+        index = len(self.functions)
+        self.functions.append(None)
+        self.functions[index] = self._function(
+            name, schema, resolver, cls, f"{resolver._base_uri}#{pointer}"
+        )
+        return name
+
+    def _function(self, name, schema, resolver, cls, location) -> list:
+        lines = [f"def {name}(x):", f"    # {location}"]
+        if schema is True or schema is False:
+            lines.append(f"    return {schema}")
+            return lines
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"{location} is not a schema")
+
+        pointer = location.partition("#")[2]
+        for keyword, value in cls._APPLICABLE_VALIDATORS(schema):
+            implementation = cls.VALIDATORS.get(keyword)
+            if implementation is None:
+                # annotations and keywords `jsonschema` doesn't know, which
+                # it ignores too
+                continue
+            compile_keyword = self._keywords.get(implementation)
+            if compile_keyword is None:
+                raise SchemaCompileError(
+                    f"{location}: {keyword!r} isn't supported"
+                )
+            lines.extend(
+                "    " + line for line in compile_keyword(
+                    value, schema, resolver, cls, f"{pointer}/{keyword}"
+                )
+            )
+        lines.append("    return True")
+        return lines
+
+    def _subschema(self, schema, resolver, cls, pointer) -> str:
+        if isinstance(schema, dict):
+            specification = specification_with(
+                validator_for(schema, default=cls).META_SCHEMA["$schema"]
+            )
+            resolver = resolver.in_subresource(
+                specification.create_resource(schema)
+            )
+        return self.function_for(schema, resolver, cls, pointer)
+
+    def _constant(self, value) -> str:
+        """Return the name of a module constant for the expression
+        `value`."""
+        if value not in self._constant_names:
+            name = f"_C{len(self._constant_names)}"
+            self._constant_names[value] = name
+            self.constants.append(f"{name} = {value}")
+        return self._constant_names[value]
+
+    def _ref(self, ref, schema, resolver, cls, pointer):
+        resolved = resolver.lookup(ref)
+        name = self.function_for(
+            resolved.contents, resolved.resolver, cls, ref.partition("#")[2]
+        )
+        return [f"if not {name}(x):", "    return False"]
+
+    def _type(self, types, schema, resolver, cls, pointer):
+        if isinstance(types, str):
+            types = [types]
+        checks = []
+        for name in types:
+            if name not in TYPE_CHECKS:
+                raise SchemaCompileError(f"{pointer}: unknown type {name!r}")
+            if name == "integer" and not cls.TYPE_CHECKER.is_type(
+                1.0, "integer"
+            ):
+                # before draft 6, 1.0 isn't an integer
+                checks.append("(isinstance(x, int) and not isinstance(x, bool))")
+            else:
+                checks.append(TYPE_CHECKS[name])
+        return [f"if not ({' or '.join(checks)}):", "    return False"]
+
+    def _anyOf(self, schemas, schema, resolver, cls, pointer):
+        calls = self._calls(schemas, resolver, cls, pointer)
+        return [f"if not ({' or '.join(calls)}):", "    return False"]
+
+    def _allOf(self, schemas, schema, resolver, cls, pointer):
+        calls = self._calls(schemas, resolver, cls, pointer)
+        return [f"if not ({' and '.join(calls)}):", "    return False"]
+
+    def _oneOf(self, schemas, schema, resolver, cls, pointer):
+        calls = self._calls(schemas, resolver, cls, pointer)
+        return [f"if ({' + '.join(calls)}) != 1:", "    return False"]
+
+    def _not(self, subschema, schema, resolver, cls, pointer):
+        name = self._subschema(subschema, resolver, cls, pointer)
+        return [f"if {name}(x):", "    return False"]
+
+    def _calls(self, schemas, resolver, cls, pointer) -> list:
+        return [
+            self._subschema(subschema, resolver, cls, f"{pointer}/{i}")
+            + "(x)"
+            for i, subschema in enumerate(schemas)
+        ]
+
+    def _properties(self, properties, schema, resolver, cls, pointer):
+        lines = ["if isinstance(x, dict):"]
+        for name, subschema in properties.items():
+            function = self._subschema(
+                subschema, resolver, cls, f"{pointer}/{_escape(name)}"
+            )
+            lines.extend([
+                f"    if {name!r} in x and not {function}(x[{name!r}]):",
+                "        return False",
+            ])
+        return lines if len(lines) > 1 else []
+
+    def _required(self, required, schema, resolver, cls, pointer):
+        if not required:
+            return []
+        missing = " or ".join(f"{name!r} not in x" for name in required)
+        return [
+            f"if isinstance(x, dict) and ({missing}):", "    return False"
+        ]
+
+    def _dependentRequired(self, dependencies, schema, resolver, cls,
+                           pointer):
+        return self._dependencies(
+            dependencies, schema, resolver, cls, pointer
+        )
+
+    def _dependentSchemas(self, dependencies, schema, resolver, cls,
+                          pointer):
+        return self._dependencies(
+            dependencies, schema, resolver, cls, pointer
+        )
+
+    def _dependencies(self, dependencies, schema, resolver, cls, pointer):
+        """Compile a property's required properties (a list) or its
+        schema (anything else)."""
+        lines = ["if isinstance(x, dict):"]
+        for name, dependency in dependencies.items():
+            if isinstance(dependency, list):
+                if not dependency:
+                    continue
+                check = " or ".join(
+                    f"{other!r} not in x" for other in dependency
+                )
+            else:
+                function = self._subschema(
+                    dependency, resolver, cls, f"{pointer}/{_escape(name)}"
+                )
+                check = f"not {function}(x)"
+            lines.extend([
+                f"    if {name!r} in x and ({check}):",
+                "        return False",
+            ])
+        return lines if len(lines) > 1 else []
+
+    def _items(self, items, schema, resolver, cls, pointer):
+        if "prefixItems" in schema:
+            raise SchemaCompileError(f"{pointer}: prefixItems isn't supported")
+        function = self._subschema(items, resolver, cls, pointer)
+        return [
+            "if isinstance(x, list):",
+            "    for item in x:",
+            f"        if not {function}(item):",
+            "            return False",
+        ]
+
+    def _items_draft4(self, items, schema, resolver, cls, pointer):
+        if isinstance(items, dict):
+            return self._items(items, schema, resolver, cls, pointer)
+        if not isinstance(items, list):
+            raise SchemaCompileError(f"{pointer}: invalid items")
+        functions = self._calls(items, resolver, cls, pointer)
+        lines = ["if isinstance(x, list):"]
+        for i, call in enumerate(functions):
+            function = call[:-len("(x)")]
+            lines.extend([
+                f"    if len(x) > {i} and not {function}(x[{i}]):",
+                "        return False",
+            ])
+        return lines if len(lines) > 1 else []
+
+    def _minItems(self, minimum, schema, resolver, cls, pointer):
+        return [
+            f"if isinstance(x, list) and len(x) < {minimum!r}:",
+            "    return False",
+        ]
+
+    def _maxItems(self, maximum, schema, resolver, cls, pointer):
+        return [
+            f"if isinstance(x, list) and len(x) > {maximum!r}:",
+            "    return False",
+        ]
+
+    def _uniqueItems(self, unique, schema, resolver, cls, pointer):
+        if not unique:
+            return []
+        return ["if isinstance(x, list) and not uniq(x):", "    return False"]
+
+    def _minLength(self, minimum, schema, resolver, cls, pointer):
+        return [
+            f"if isinstance(x, str) and len(x) < {minimum!r}:",
+            "    return False",
+        ]
+
+    def _maxLength(self, maximum, schema, resolver, cls, pointer):
+        return [
+            f"if isinstance(x, str) and len(x) > {maximum!r}:",
+            "    return False",
+        ]
+
+    def _pattern(self, pattern, schema, resolver, cls, pointer):
+        name = self._constant(f"re.compile({pattern!r})")
+        return [
+            f"if isinstance(x, str) and not {name}.search(x):",
+            "    return False",
+        ]
+
+    def _format(self, format_name, schema, resolver, cls, pointer):
+        return [f"if not conforms(x, {format_name!r}):", "    return False"]
+
+    def _enum(self, values, schema, resolver, cls, pointer):
+        if values and all(isinstance(value, str) for value in values):
+            name = self._constant(f"frozenset({sorted(set(values))!r})")
+            return [
+                f"if not (isinstance(x, str) and x in {name}):",
+                "    return False",
+            ]
+        name = self._constant(repr(tuple(values)))
+        return [
+            f"if not any(equal(x, value) for value in {name}):",
+            "    return False",
+        ]
+
+    def _const(self, value, schema, resolver, cls, pointer):
+        if isinstance(value, str):
+            return [
+                f"if not (isinstance(x, str) and x == {value!r}):",
+                "    return False",
+            ]
+        return [f"if not equal(x, {value!r}):", "    return False"]
+
+
+def _escape(name: str) -> str:
+    """Escape a property name for use in a JSON pointer."""
+    return name.replace("~", "~0").replace("/", "~1")
+
+
+@click.command()
+@click.option(
+    "-o", "--output",
+    help="File to write the compiled schemas to",
+    type=click.Path(dir_okay=False),
+    default=str(COMPILED_SCHEMAS_PATH),
+    show_default=True
+)
+def main(output):
+    """Compile the DCAT-US schemas to Python."""
+    Path(output).write_text(generate_module())
+    click.echo(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 """DCAT-US validation utilities for v1.1 and v3.0 schemas."""
 import json
+import logging
+import threading
+from collections.abc import Iterator
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
 try:
@@ -37,6 +42,17 @@ class CatalogValidationException(Exception):
     pass
 
 
+log = logging.getLogger(__name__)
+
+# Most errors an invalid dataset is reported with. `jsonschema` stops
+# looking for more once there are this many, so a badly broken record
+# can't hold up the whole validation.
+MAX_ERRORS_PER_DATASET = 50
+TRUNCATED_ERRORS_MESSAGE = (
+    "More than {} errors; the rest were not collected."
+)
+
+
 def format_path(path):
     """Format a jsonschema path as a readable string."""
     if not path:
@@ -257,11 +273,136 @@ def load_schema_registry(definitions_dir: Path):
         return store
 
 
+# Registries and validators built from the definitions directories are
+# kept for the life of the process and rebuilt only when a schema file
+# is added, removed or modified.
+_schema_cache_lock = threading.Lock()
+_registry_cache = {}
+_validator_cache = {}
+_is_valid_cache = {}
+
+
+def _definitions_signature(definitions_dir: Path) -> tuple:
+    """Return the name and modification time of every schema file."""
+    return tuple(sorted(
+        (schema_file.name, schema_file.stat().st_mtime_ns)
+        for schema_file in definitions_dir.glob("*.json")
+    ))
+
+
+def _definitions_dir_for(schema_id: str) -> Path:
+    if schema_id.startswith("https://project-open-data.cio.gov/v1.1/"):
+        return V1_1_DEFINITIONS_DIR
+    return V3_0_DEFINITIONS_DIR
+
+
+def get_schema_registry(definitions_dir: Path):
+    """Return the cached registry for `definitions_dir`.
+
+    The registry is loaded with `load_schema_registry` on first use and
+    reloaded whenever the schema files in the directory change.
+    """
+    key = str(definitions_dir)
+    signature = _definitions_signature(definitions_dir)
+    with _schema_cache_lock:
+        cached = _registry_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        registry = load_schema_registry(definitions_dir)
+        _registry_cache[key] = (signature, registry)
+        return registry
+
+
+def get_validator(schema_id: str, registry=None):
+    """Return a cached validator for `schema_id`.
+
+    Uses the cached registry for the schema's definitions directory
+    unless `registry` is given. A new validator is only created when the
+    registry it was built against has changed.
+    """
+    if registry is None:
+        registry = get_schema_registry(_definitions_dir_for(schema_id))
+    with _schema_cache_lock:
+        cached = _validator_cache.get(schema_id)
+        if cached is not None and cached[0] is registry:
+            return cached[1]
+        validator = create_validator(schema_id, registry)
+        _validator_cache[schema_id] = (registry, validator)
+        return validator
+
+
+def get_is_valid(schema_id: str, registry=None):
+    """Return a compiled `is_valid(instance)` function for `schema_id`,
+    or None if there is none.
+
+    The functions in `compiled_schemas` are used while the definitions
+    they were compiled from are unchanged; otherwise the definitions are
+    compiled again in memory. Custom registries are never compiled, and
+    nothing is compiled for a `jsonschema` release other than the one
+    `compiled_schemas` was generated with, since the compiler relies on
+    its internals; the interpreted validators are used instead.
+    """
+    if not USE_NEW_API:
+        return None
+    try:
+        from . import compiled_schemas, schema_compiler
+    except ImportError:
+        return None
+
+    if schema_id not in schema_compiler.COMPILED_SCHEMA_IDS:
+        return None
+    definitions_dir = _definitions_dir_for(schema_id)
+    cached_registry = get_schema_registry(definitions_dir)
+    if registry is not None and registry is not cached_registry:
+        return None
+
+    with _schema_cache_lock:
+        cached = _is_valid_cache.get(schema_id)
+        if cached is not None and cached[0] is cached_registry:
+            return cached[1]
+
+    installed_version = schema_compiler.jsonschema_version()
+    digest = schema_compiler.definitions_digest(definitions_dir)
+    if compiled_schemas.JSONSCHEMA_VERSION != installed_version:
+        log.warning(
+            "compiled_schemas.py was generated with jsonschema %s, but "
+            "%s is installed; validating with jsonschema only.",
+            compiled_schemas.JSONSCHEMA_VERSION, installed_version
+        )
+        is_valid = None
+    elif compiled_schemas.DIGESTS.get(definitions_dir.name) == digest:
+        is_valid = compiled_schemas.IS_VALID[schema_id]
+    else:
+        log.warning(
+            "%s changed since the schemas were compiled; compiling them "
+            "in memory. Run `make compile-dcat-schemas` to update "
+            "compiled_schemas.py.", definitions_dir.name
+        )
+        is_valid = schema_compiler.load_module(
+            schema_compiler.generate_module()
+        )["IS_VALID"][schema_id]
+
+    with _schema_cache_lock:
+        _is_valid_cache[schema_id] = (cached_registry, is_valid)
+    return is_valid
+
+
+def clear_schema_cache() -> None:
+    """Drop all cached registries and validators."""
+    with _schema_cache_lock:
+        _registry_cache.clear()
+        _validator_cache.clear()
+        _is_valid_cache.clear()
+
+
 def validate_catalog(
     schema_id: str, registry, catalog: dict
 ) -> None:
     """Validate a DCAT-US v1.1 or v3.0 catalog."""
-    validator = create_validator(schema_id, registry)
+    is_valid = get_is_valid(schema_id, registry)
+    if is_valid is not None and is_valid(catalog):
+        return
+    validator = get_validator(schema_id, registry)
     errors = list(validator.iter_errors(catalog))
     if errors:
         version_number = "v1.1" if "v1.1" in schema_id else "v3.0"
@@ -272,59 +413,132 @@ def validate_catalog(
         )
 
 
-def validate_datasets(
-    schema_id: str, registry, datasets: list
-) -> tuple[int, int, int]:
-    """Validate each dataset individually."""
-    validator = create_validator(schema_id, registry)
-    valid = 0
-    invalid = 0
-    error_count = 0
+def _validate_chunk(schema_id: str, registry, formatted: bool,
+                    datasets: list,
+                    max_errors: int = MAX_ERRORS_PER_DATASET) -> list:
+    """Validate a chunk of datasets against `schema_id`.
+
+    Returns one entry per dataset: None if it is valid, otherwise its
+    formatted error messages, or just the number of errors when
+    `formatted` is False. `jsonschema` only looks at the datasets the
+    compiled schema finds invalid, and stops after `max_errors` errors
+    (None for no limit).
+    """
+    validator = get_validator(schema_id, registry)
+    is_valid = get_is_valid(schema_id, registry)
+    results = []
     for dataset in datasets:
-        errors = list(validator.iter_errors(dataset))
-        if errors:
-            invalid += 1
-            error_count += len(errors)
+        if is_valid is not None and is_valid(dataset):
+            results.append(None)
+            continue
+        validation_errors = validator.iter_errors(dataset)
+        if max_errors is not None:
+            validation_errors = islice(validation_errors, max_errors + 1)
+        validation_errors = list(validation_errors)
+        truncated = (
+            max_errors is not None and len(validation_errors) > max_errors
+        )
+        if truncated:
+            del validation_errors[max_errors:]
+        if not validation_errors:
+            results.append(None)
+        elif formatted:
+            messages = [
+                format_validation_errors([err], indent=0)
+                for err in validation_errors
+            ]
+            if truncated:
+                messages.append(TRUNCATED_ERRORS_MESSAGE.format(max_errors))
+            results.append(messages)
         else:
-            valid += 1
-    return valid, invalid, error_count
+            results.append(len(validation_errors))
+    return results
 
 
-def validate_v1_1_catalog(catalog: dict) -> list:
-    """Validate DCAT-US v1.1 catalog and return errors with dataset context.
+def _warm_validator(schema_id: str) -> None:
+    """Build a pool worker's validator before it receives any datasets."""
+    get_validator(schema_id)
+    get_is_valid(schema_id)
 
-    Returns a list of error objects, one per invalid dataset.
-    Each error object includes:
-    - identifier: dataset identifier
-    - title: dataset title
-    - errors: list of validation error messages
+
+def _validate_all(schema_id: str, registry, datasets: list,
+                  formatted: bool, workers: int = 1,
+                  max_errors: int = MAX_ERRORS_PER_DATASET) -> list:
+    """Run `_validate_chunk` over `datasets`, spread over `workers`
+    processes when more than one is requested.
+
+    Pool workers build their own validator from the cached registry for
+    `schema_id`, so `registry` is only used in-process.
     """
-    v1_1_registry = load_schema_registry(V1_1_DEFINITIONS_DIR)
+    from . import parallel
+
+    if workers is not None and workers > 1:
+        return parallel.map_chunks(
+            partial(
+                _validate_chunk, schema_id, None, formatted,
+                max_errors=max_errors
+            ),
+            datasets,
+            workers,
+            initializer=_warm_validator,
+            initargs=(schema_id,),
+        )
+    return _validate_chunk(
+        schema_id, registry, formatted, datasets, max_errors
+    )
 
-    validator = create_validator(V1_1_DATASET_SCHEMA_ID, v1_1_registry)
 
+def _dataset_errors(datasets: list, results: list) -> list:
+    """Pair formatted validation results with their datasets."""
     errors = []
-    datasets = catalog.get("dataset", [])
-
-    for i, dataset in enumerate(datasets):
-        validation_errors = list(validator.iter_errors(dataset))
-        if validation_errors:
-            identifier = dataset.get("identifier", f"index {i}")
-            title = dataset.get("title", "Unknown")
-            error_messages = [
-                format_validation_errors([err], indent=0)
-                for err in validation_errors
-            ]
+    for i, (dataset, error_messages) in enumerate(zip(datasets, results)):
+        if error_messages is not None:
             errors.append({
-                "identifier": identifier,
-                "title": title,
+                "identifier": dataset.get("identifier", f"index {i}"),
+                "title": dataset.get("title", "Unknown"),
                 "errors": error_messages
             })
-
     return errors
 
 
-def validate_v1_1_catalog_with_counts(catalog: dict) -> tuple[int, int, list]:
+def validate_datasets(
+    schema_id: str, registry, datasets: list, workers: int = 1,
+    max_errors: int = MAX_ERRORS_PER_DATASET
+) -> tuple[int, int, int]:
+    """Validate each dataset individually.
+
+    With `workers` > 1 the datasets are validated in that many processes.
+    At most `max_errors` errors are counted per dataset.
+    """
+    results = _validate_all(
+        schema_id, registry, datasets, formatted=False, workers=workers,
+        max_errors=max_errors
+    )
+    invalid = sum(1 for result in results if result is not None)
+    error_count = sum(result for result in results if result is not None)
+    return len(results) - invalid, invalid, error_count
+
+
+def validate_v1_1_catalog(
+    catalog: dict, workers: int = 1,
+    max_errors: int = MAX_ERRORS_PER_DATASET
+) -> list:
+    """Validate DCAT-US v1.1 catalog and return errors with dataset context.
+
+    Returns a list of error objects, one per invalid dataset.
+    Each error object includes:
+    - identifier: dataset identifier
+    - title: dataset title
+    - errors: list of validation error messages, at most `max_errors`
+      of them followed by a note if there were more
+    """
+    return validate_v1_1_catalog_with_counts(catalog, workers, max_errors)[2]
+
+
+def validate_v1_1_catalog_with_counts(
+    catalog: dict, workers: int = 1,
+    max_errors: int = MAX_ERRORS_PER_DATASET
+) -> tuple[int, int, list]:
     """Validate DCAT-US v1.1 catalog and return counts with errors.
 
     Returns:
@@ -332,71 +546,35 @@ def validate_v1_1_catalog_with_counts(catalog: dict) -> tuple[int, int, list]:
     - invalid: number of invalid datasets
     - errors: list of error objects with dataset context
     """
-    v1_1_registry = load_schema_registry(V1_1_DEFINITIONS_DIR)
-
-    validator = create_validator(V1_1_DATASET_SCHEMA_ID, v1_1_registry)
-
-    valid = 0
-    invalid = 0
-    errors = []
     datasets = catalog.get("dataset", [])
-
-    for i, dataset in enumerate(datasets):
-        validation_errors = list(validator.iter_errors(dataset))
-        if validation_errors:
-            invalid += 1
-            identifier = dataset.get("identifier", f"index {i}")
-            title = dataset.get("title", "Unknown")
-            error_messages = [
-                format_validation_errors([err], indent=0)
-                for err in validation_errors
-            ]
-            errors.append({
-                "identifier": identifier,
-                "title": title,
-                "errors": error_messages
-            })
-        else:
-            valid += 1
-
-    return valid, invalid, errors
+    results = _validate_all(
+        V1_1_DATASET_SCHEMA_ID, None, datasets,
+        formatted=True, workers=workers, max_errors=max_errors
+    )
+    errors = _dataset_errors(datasets, results)
+    return len(datasets) - len(errors), len(errors), errors
 
 
-def validate_v3_0_catalog(catalog: dict) -> list:
+def validate_v3_0_catalog(
+    catalog: dict, workers: int = 1,
+    max_errors: int = MAX_ERRORS_PER_DATASET
+) -> list:
     """Validate DCAT-US v3.0 catalog and return errors with dataset context.
 
     Returns a list of error objects, one per invalid dataset.
     Each error object includes:
     - identifier: dataset identifier
     - title: dataset title
-    - errors: list of validation error messages
+    - errors: list of validation error messages, at most `max_errors`
+      of them followed by a note if there were more
     """
-    v3_0_registry = load_schema_registry(V3_0_DEFINITIONS_DIR)
-
-    validator = create_validator(V3_0_DATASET_SCHEMA_ID, v3_0_registry)
-
-    errors = []
-    datasets = catalog.get("dataset", [])
-
-    for i, dataset in enumerate(datasets):
-        validation_errors = list(validator.iter_errors(dataset))
-        if validation_errors:
-            identifier = dataset.get("identifier", f"index {i}")
-            title = dataset.get("title", "Unknown")
-            error_messages = [
-                format_validation_errors([err], indent=0)
-                for err in validation_errors
-            ]
-            errors.append({
-                "identifier": identifier,
-                "title": title,
-                "errors": error_messages
-            })
-
-    return errors
+    return validate_v3_0_catalog_with_counts(catalog, workers, max_errors)[2]
 
 
-def validate_v3_0_catalog_with_counts(catalog: dict) -> tuple[int, int, list]:
+def validate_v3_0_catalog_with_counts(
+    catalog: dict, workers: int = 1,
+    max_errors: int = MAX_ERRORS_PER_DATASET
+) -> tuple[int, int, list]:
     """Validate DCAT-US v3.0 catalog and return counts with errors.
 
     Returns:
@@ -404,34 +582,13 @@ def validate_v3_0_catalog_with_counts(catalog: dict) -> tuple[int, int, list]:
     - invalid: number of invalid datasets
     - errors: list of error objects with dataset context
     """
-    v3_0_registry = load_schema_registry(V3_0_DEFINITIONS_DIR)
-
-    validator = create_validator(V3_0_DATASET_SCHEMA_ID, v3_0_registry)
-
-    valid = 0
-    invalid = 0
-    errors = []
     datasets = catalog.get("dataset", [])
-
-    for i, dataset in enumerate(datasets):
-        validation_errors = list(validator.iter_errors(dataset))
-        if validation_errors:
-            invalid += 1
-            identifier = dataset.get("identifier", f"index {i}")
-            title = dataset.get("title", "Unknown")
-            error_messages = [
-                format_validation_errors([err], indent=0)
-                for err in validation_errors
-            ]
-            errors.append({
-                "identifier": identifier,
-                "title": title,
-                "errors": error_messages
-            })
-        else:
-            valid += 1
-
-    return valid, invalid, errors
+    results = _validate_all(
+        V3_0_DATASET_SCHEMA_ID, None, datasets,
+        formatted=True, workers=workers, max_errors=max_errors
+    )
+    errors = _dataset_errors(datasets, results)
+    return len(datasets) - len(errors), len(errors), errors
 
 
 def detect_package_conversion_errors(
@@ -501,29 +658,106 @@ def capture_conversion_logs(conversion_function, logger_name):
         stream.close()
 
 
-def write_zip(data, error_log=None, errors_json=None):
-    """Create a ZIP file containing catalog data and optional error files.
+# How much compressed output `iter_zip` buffers before yielding it.
+ZIP_CHUNK_SIZE = 64 * 1024
 
-    Args:
-        data: Dict containing the catalog data, or None
-        error_log: String containing log output, or None
-        errors_json: List of error dicts, or None
 
-    Returns:
-        Binary ZIP file data
+class _ZipStream(object):
+    """Write-only file object that collects what `zipfile` writes to it
+    so `iter_zip` can hand it out in chunks."""
+
+    def __init__(self):
+        self._chunks = []
+        self._size = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def __len__(self):
+        return self._size
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        self._size = 0
+        return data
+
+
+def iter_catalog_json(data):
+    """Yield `data` as JSON text one dataset at a time.
+
+    The concatenated output is identical to
+    `json.dumps(data, indent=2, ensure_ascii=False)`.
+    """
+    import json
+
+    if not isinstance(data, dict) or not data:
+        yield json.dumps(data, indent=2, ensure_ascii=False)
+        return
+
+    yield from iter_catalog_items_json(data.items())
+
+
+def iter_catalog_items_json(items):
+    """Yield a JSON object built from `(key, value)` pairs as text.
+
+    The value of a `dataset` key may be a list or an iterator of
+    datasets, which is consumed lazily. The output is formatted the same
+    way as `json.dumps(..., indent=2, ensure_ascii=False)`.
+    """
+    import json
+
+    def dumps(value, indent):
+        return json.dumps(value, indent=2, ensure_ascii=False).replace(
+            '\n', '\n' + ' ' * indent
+        )
+
+    empty = True
+    for key, value in items:
+        yield '{\n  ' if empty else ',\n  '
+        empty = False
+        yield json.dumps(key, ensure_ascii=False) + ': '
+        if key == 'dataset' and isinstance(value, (list, Iterator)):
+            no_datasets = True
+            for dataset in value:
+                yield '[\n    ' if no_datasets else ',\n    '
+                no_datasets = False
+                yield dumps(dataset, 4)
+            yield '[]' if no_datasets else '\n  ]'
+        else:
+            yield dumps(value, 2)
+    yield '{}' if empty else '\n}'
+
+
+def iter_zip(data, error_log=None, errors_json=None,
+             chunk_size=ZIP_CHUNK_SIZE):
+    """Yield a ZIP file containing catalog data and optional error files.
+
+    Same contents as `write_zip`, but `data.json` is encoded and
+    compressed one dataset at a time and the archive is yielded in
+    chunks of roughly `chunk_size` bytes, so neither the JSON text nor
+    the whole archive is ever held in memory.
     """
     import zipfile
-    import io
     import json
 
-    zip_buffer = io.BytesIO()
+    stream = _ZipStream()
 
-    with zipfile.ZipFile(
-        zip_buffer, 'w', zipfile.ZIP_DEFLATED
-    ) as zip_file:
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as zip_file:
         if data:
-            data_json = json.dumps(data, indent=2, ensure_ascii=False)
-            zip_file.writestr('data.json', data_json.encode('utf-8'))
+            # the size isn't known up front, so allow for over 2 GiB
+            with zip_file.open(
+                'data.json', 'w', force_zip64=True
+            ) as data_json:
+                for text in iter_catalog_json(data):
+                    data_json.write(text.encode('utf-8'))
+                    if len(stream) >= chunk_size:
+                        yield stream.drain()
         else:
             zip_file.writestr('empty.json', '')
 
@@ -537,11 +771,26 @@ def write_zip(data, error_log=None, errors_json=None):
             error_log_normalized = error_log.replace("\n", "\r\n")
             zip_file.writestr('errorlog.txt', error_log_normalized)
 
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+    remaining = stream.drain()
+    if remaining:
+        yield remaining
+
+
+def write_zip(data, error_log=None, errors_json=None):
+    """Create a ZIP file containing catalog data and optional error files.
+
+    Args:
+        data: Dict containing the catalog data, or None
+        error_log: String containing log output, or None
+        errors_json: List of error dicts, or None
+
+    Returns:
+        Binary ZIP file data
+    """
+    return b''.join(iter_zip(data, error_log, errors_json))
 
 
-def process_export_with_error_tracking(v1_1_catalog):
+def process_export_with_error_tracking(v1_1_catalog, workers=1):
     """Process complete export with comprehensive error tracking.
 
     This orchestrates the full export pipeline:
@@ -552,6 +801,7 @@ def process_export_with_error_tracking(v1_1_catalog):
 
     Args:
         v1_1_catalog: Dict containing DCAT-US v1.1 catalog
+        workers: Number of processes to convert and validate datasets with
 
     Returns:
         Binary ZIP file data
@@ -560,26 +810,43 @@ def process_export_with_error_tracking(v1_1_catalog):
     Validating v1.1 would report false positives for fields required in v1.1
     but not in v3.0 (like 'keyword', 'modified', 'publisher', 'accessLevel').
     """
-    import logging
+    return b''.join(iter_export_with_error_tracking(v1_1_catalog, workers))
+
+
+def iter_export_with_error_tracking(v1_1_catalog, workers=1):
+    """Streaming version of `process_export_with_error_tracking`.
+
+    Yields the ZIP file in chunks as it is compressed.
+    """
     from . import dcat_converter
 
+    catalog_v3_0, conversion_errors = dcat_converter.convert_dcat_catalog(
+        v1_1_catalog, fused=True, workers=workers
+    )
+    v3_0_validation_errors = validate_v3_0_catalog(catalog_v3_0, workers)
+
+    yield from iter_export_zip(
+        catalog_v3_0, conversion_errors, v3_0_validation_errors
+    )
+
+
+def iter_export_zip(catalog_v3_0, conversion_errors, validation_errors):
+    """Yield the export ZIP for a converted and validated v3.0 catalog."""
+    import logging
+
     logger = logging.getLogger(__name__)
     all_errors = []
 
-    catalog_v3_0, conversion_errors = dcat_converter.convert_dcat_catalog(
-        v1_1_catalog
-    )
     if conversion_errors:
         all_errors.extend(conversion_errors)
         logger.warning(
             f"Transformation: {len(conversion_errors)} datasets failed"
         )
 
-    v3_0_validation_errors = validate_v3_0_catalog(catalog_v3_0)
-    if v3_0_validation_errors:
-        all_errors.extend(v3_0_validation_errors)
+    if validation_errors:
+        all_errors.extend(validation_errors)
         logger.warning(
-            f"v3.0 validation: {len(v3_0_validation_errors)} "
+            f"v3.0 validation: {len(validation_errors)} "
             "invalid datasets"
         )
 
@@ -591,10 +858,90 @@ def process_export_with_error_tracking(v1_1_catalog):
         logger_name=__name__
     )
 
-    zip_binary = write_zip(
+    yield from iter_zip(
         data=result,
         error_log=log_output if log_output else None,
         errors_json=all_errors if all_errors else None
     )
 
-    return zip_binary
+
+def convert_and_validate_dataset(dataset: dict) -> dict:
+    """Convert a single v1.1 dataset to v3.0 and validate the result.
+
+    Returns a JSON-serializable record for `assemble_v3_0_export`:
+    `{"dataset": ..., "errors": ...}` with the converted dataset and its
+    validation error messages (None if it is valid), or, if the
+    transforms failed, `{"error": ...}` with the dataset's identifier and
+    title when it has them.
+    """
+    from . import transforms
+
+    try:
+        converted = transforms.transform_dataset(dataset)
+    except Exception as e:
+        result = {
+            key: dataset[key] for key in ("identifier", "title")
+            if key in dataset
+        }
+        result["error"] = str(e)
+        return result
+
+    errors = _validate_chunk(V3_0_DATASET_SCHEMA_ID, None, True, [converted])
+    return {"dataset": converted, "errors": errors[0]}
+
+
+def convert_and_validate_datasets(datasets: list, workers: int = 1) -> list:
+    """Return a `convert_and_validate_dataset` record for each dataset,
+    in order, spread over `workers` processes when more than one is
+    requested."""
+    from . import parallel
+
+    return parallel.map_chunks(
+        _convert_and_validate_chunk, datasets, workers,
+        initializer=_warm_validator,
+        initargs=(V3_0_DATASET_SCHEMA_ID,),
+    )
+
+
+def _convert_and_validate_chunk(datasets: list) -> list:
+    return [convert_and_validate_dataset(dataset) for dataset in datasets]
+
+
+def assemble_v3_0_export(v1_1_catalog: dict, results: list) -> tuple:
+    """Put together a v3.0 export from per-dataset records.
+
+    `v1_1_catalog` supplies the catalog-level fields and `results` holds
+    one `convert_and_validate_dataset` record per v1.1 dataset, in
+    order. Returns `(catalog_v3_0, conversion_errors, validation_errors)`
+    exactly as converting and validating the whole catalog would.
+    """
+    from . import dcat_converter
+
+    catalog_v3_0, _ = dcat_converter.convert_dcat_catalog(
+        {**v1_1_catalog, "dataset": []}, fused=True
+    )
+
+    datasets = []
+    conversion_errors = []
+    validation_errors = []
+    for i, result in enumerate(results):
+        if "error" in result:
+            conversion_errors.append({
+                "identifier": result.get("identifier", f"index {i}"),
+                "title": result.get("title", "Unknown"),
+                "error": result["error"]
+            })
+            continue
+        dataset = result["dataset"]
+        if result["errors"] is not None:
+            validation_errors.append({
+                "identifier": dataset.get(
+                    "identifier", f"index {len(datasets)}"
+                ),
+                "title": dataset.get("title", "Unknown"),
+                "errors": result["errors"]
+            })
+        datasets.append(dataset)
+
+    catalog_v3_0["dataset"] = datasets
+    return catalog_v3_0, conversion_errors, validation_errors
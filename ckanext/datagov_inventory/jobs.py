@@ -0,0 +1,323 @@
+"""Background jobs run by the ``ckan jobs worker`` process."""
+import hashlib
+import json
+import logging
+from importlib.metadata import version
+from pathlib import Path
+
+import ckan.lib.redis as redis
+import ckan.lib.search as search
+import ckan.plugins.toolkit as toolkit
+from ckan.plugins.toolkit import config
+from ckanext.datajson.blueprint import get_packages
+from ckanext.datajson.package2pod import Package2Pod
+from ckanext.datajson.helpers import get_export_map_json
+from redis.exceptions import WatchError
+from rq import get_current_job
+
+log = logging.getLogger(__name__)
+
+DCAT_V3_EXPORT_KEY = 'datagov_inventory:dcat_v3_export:{}'
+DCAT_V3_EXPORT_TIMEOUT = 3600
+DCAT_V3_EXPORT_TTL = 3600
+
+# the id of the organization's queued or running export job
+DCAT_V3_EXPORT_JOB_KEY = 'datagov_inventory:dcat_v3_export_job:{}'
+
+# converted v3.0 datasets, by cache fingerprint, package id,
+# metadata_modified and organization digest. Organization edits don't
+# bump the packages' metadata_modified, but the organization is part of
+# the package dict the conversion sees (e.g. as the fallback publisher).
+DCAT_V3_DATASET_KEY = 'datagov_inventory:dcat_v3_dataset:{}:{}:{}:{}'
+DCAT_V3_DATASET_CACHE_TTL = 7 * 24 * 3600
+
+# how often (in packages) the export job reports its progress
+PROGRESS_INTERVAL = 100
+
+# size of the pieces the export is appended to and read back from redis
+EXPORT_CHUNK_SIZE = 1024 * 1024
+
+# processes the export converts and validates datasets in
+DCAT_V3_EXPORT_WORKERS = 1
+
+
+def dcat_v3_export_timeout():
+    return toolkit.asint(config.get(
+        'ckanext.datagov_inventory.dcat_export.timeout',
+        DCAT_V3_EXPORT_TIMEOUT
+    ))
+
+
+def dcat_v3_export_ttl():
+    return toolkit.asint(config.get(
+        'ckanext.datagov_inventory.dcat_export.ttl',
+        DCAT_V3_EXPORT_TTL
+    ))
+
+
+def dcat_v3_dataset_cache_ttl():
+    """How long converted datasets are cached for; 0 disables the cache."""
+    return toolkit.asint(config.get(
+        'ckanext.datagov_inventory.dcat_export.dataset_cache_ttl',
+        DCAT_V3_DATASET_CACHE_TTL
+    ))
+
+
+def dcat_v3_export_workers():
+    return toolkit.asint(config.get(
+        'ckanext.datagov_inventory.dcat_export.workers',
+        DCAT_V3_EXPORT_WORKERS
+    ))
+
+
+def claim_dcat_v3_export(org_id, job_id):
+    """Claim the organization's export for `job_id`, unless another job
+    already holds the claim; returns the id of the job that holds it.
+
+    The claim is taken with SET NX, so of concurrent requests only one
+    queues an export, and expires with the export's timeout.
+    """
+    conn = redis.connect_to_redis()
+    key = DCAT_V3_EXPORT_JOB_KEY.format(org_id)
+    while not conn.set(key, job_id, nx=True, ex=dcat_v3_export_timeout()):
+        claimed = conn.get(key)
+        # otherwise the claim expired since, so try again
+        if claimed is not None:
+            return claimed.decode('utf-8')
+    return job_id
+
+
+def release_dcat_v3_export(org_id, job_id):
+    """Drop the organization's export claim if `job_id` still holds it."""
+    conn = redis.connect_to_redis()
+    key = DCAT_V3_EXPORT_JOB_KEY.format(org_id)
+    with conn.pipeline() as pipe:
+        try:
+            pipe.watch(key)
+            if pipe.get(key) == job_id.encode('utf-8'):
+                pipe.multi()
+                pipe.delete(key)
+                pipe.execute()
+        except WatchError:
+            # claimed again in the meantime
+            pass
+
+
+def reindex_package(package_id):
+    """Update the search index for a package changed outside of
+    package_update."""
+    search.rebuild(package_id)
+
+
+def export_dcat_v3(org_id):
+    """Build the DCAT-US v3.0 export for an organization.
+
+    The zip is streamed into redis as it is compressed and stored under
+    the id of the running job once it is complete, where the download
+    view picks it up. However the job ends, it releases the
+    organization's export claim.
+    """
+    job = get_current_job()
+    log.info('Generating DCAT-US v3.0 export for org: %s', org_id)
+    try:
+        _export_dcat_v3(org_id, job)
+    finally:
+        release_dcat_v3_export(org_id, job.id)
+
+
+def _export_dcat_v3(org_id, job):
+    from ckanext.datagov_inventory.dcat.validator import (
+        iter_export_with_error_tracking, iter_export_zip
+    )
+
+    if dcat_v3_dataset_cache_ttl():
+        chunks = iter_export_zip(*build_v3_0_export(org_id, job))
+    else:
+        catalog_v1_1 = build_v1_1_catalog(org_id, job)
+        _update_progress(job, 'converting')
+        chunks = iter_export_with_error_tracking(
+            catalog_v1_1, dcat_v3_export_workers()
+        )
+
+    conn = redis.connect_to_redis()
+    key = DCAT_V3_EXPORT_KEY.format(job.id)
+    partial_key = key + ':partial'
+    ttl = dcat_v3_export_ttl()
+
+    conn.delete(partial_key)
+    buffered = []
+    buffered_size = 0
+    for chunk in chunks:
+        if buffered_size == 0:
+            # the first chunk only arrives once conversion and validation
+            # are done and the zip is being written
+            _update_progress(job, 'saving')
+        buffered.append(chunk)
+        buffered_size += len(chunk)
+        if buffered_size >= EXPORT_CHUNK_SIZE:
+            conn.append(partial_key, b''.join(buffered))
+            conn.expire(partial_key, ttl)
+            buffered = []
+            buffered_size = 0
+    if buffered:
+        conn.append(partial_key, b''.join(buffered))
+    conn.rename(partial_key, key)
+    conn.expire(key, ttl)
+
+    _update_progress(job, 'finished')
+    log.info('Finished DCAT-US v3.0 export for org: %s', org_id)
+
+
+def build_v1_1_catalog(org_id, job=None):
+    """Return the organization's packages as a DCAT-US v1.1 catalog."""
+    _update_progress(job, 'collecting')
+    packages = get_packages(owner_org=org_id, with_private=True)
+
+    json_export_map = get_export_map_json()
+    output = []
+    Package2Pod.seen_identifiers = set()
+
+    total = len(packages)
+    for i, pkg in enumerate(packages):
+        if i % PROGRESS_INTERVAL == 0:
+            _update_progress(job, 'collecting', i, total)
+        datajson_entry = Package2Pod.convert_package(
+            pkg, json_export_map, redaction_enabled=False
+        )
+        if datajson_entry:
+            output.append(datajson_entry)
+
+    _update_progress(job, 'collecting', total, total)
+    return Package2Pod.wrap_json_catalog(output, json_export_map)
+
+
+def build_v3_0_export(org_id, job=None):
+    """Convert and validate the organization's packages for a DCAT-US
+    v3.0 export, reusing cached results for unchanged packages.
+
+    Each package's converted and validated entry is cached in redis
+    under its id, `metadata_modified` and organization, so only packages
+    that changed
+    since the last export are converted again, in as many processes as
+    `dcat_v3_export_workers` allows. Returns
+    `(catalog_v3_0, conversion_errors, validation_errors)`.
+    """
+    from ckanext.datagov_inventory.dcat import validator
+
+    _update_progress(job, 'collecting')
+    packages = get_packages(owner_org=org_id, with_private=True)
+
+    json_export_map = get_export_map_json()
+    Package2Pod.seen_identifiers = set()
+    fingerprint = _dcat_v3_cache_fingerprint(json_export_map)
+    ttl = dcat_v3_dataset_cache_ttl()
+    conn = redis.connect_to_redis()
+
+    results = []
+    # datasets that weren't cached: (position in results, key, v1.1 entry)
+    uncached = []
+    total = len(packages)
+    pipe = conn.pipeline()
+    for start in range(0, total, PROGRESS_INTERVAL):
+        _update_progress(job, 'collecting', start, total)
+        batch = packages[start:start + PROGRESS_INTERVAL]
+        keys = [_dcat_v3_dataset_key(fingerprint, pkg) for pkg in batch]
+        cached = conn.mget([key for key in keys if key]) if any(keys) else []
+        cached = iter(cached)
+
+        for pkg, key in zip(batch, keys):
+            value = next(cached) if key else None
+            if value is not None:
+                results.append(json.loads(value))
+                continue
+            datajson_entry = Package2Pod.convert_package(
+                pkg, json_export_map, redaction_enabled=False
+            )
+            if datajson_entry:
+                uncached.append((len(results), key, datajson_entry))
+            elif key:
+                # remember that the package isn't exported
+                pipe.set(key, json.dumps(None), ex=ttl)
+            results.append(None)
+
+    _update_progress(job, 'converting', total - len(uncached), total)
+    converted = validator.convert_and_validate_datasets(
+        [datajson_entry for _, _, datajson_entry in uncached],
+        dcat_v3_export_workers()
+    )
+    for (i, key, _), result in zip(uncached, converted):
+        results[i] = result
+        if key:
+            pipe.set(key, json.dumps(result), ex=ttl)
+    pipe.execute()
+
+    _update_progress(job, 'converting', total, total)
+    log.info(
+        'Converted %s of %s packages for org %s, the rest were cached',
+        len(uncached), total, org_id
+    )
+    return validator.assemble_v3_0_export(
+        Package2Pod.wrap_json_catalog([], json_export_map),
+        [result for result in results if result is not None]
+    )
+
+
+def _dcat_v3_dataset_key(fingerprint, pkg):
+    if not pkg.get('id') or not pkg.get('metadata_modified'):
+        return None
+    organization = hashlib.sha256(json.dumps(
+        pkg.get('organization'), sort_keys=True, default=str
+    ).encode('utf-8')).hexdigest()[:16]
+    return DCAT_V3_DATASET_KEY.format(
+        fingerprint, pkg['id'], pkg['metadata_modified'], organization
+    )
+
+
+def _dcat_v3_cache_fingerprint(json_export_map):
+    """Identify everything besides the package and its organization that
+    a cached dataset depends on: the export map, the ckanext-datajson and
+    jsonschema releases, the transforms, the validation code and the
+    v3.0 schemas. Changing any of them invalidates the whole cache."""
+    from ckanext.datagov_inventory.dcat import (
+        compiled_schemas, dates, parallel, transforms, validator
+    )
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps(
+        json_export_map, sort_keys=True, default=str
+    ).encode('utf-8'))
+    for distribution in ('ckanext-datajson', 'jsonschema'):
+        digest.update(version(distribution).encode('utf-8'))
+    for module in (transforms, dates, validator, parallel, compiled_schemas):
+        digest.update(Path(module.__file__).read_bytes())
+    for schema_file in sorted(validator.V3_0_DEFINITIONS_DIR.glob('*.json')):
+        digest.update(schema_file.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def get_dcat_v3_export_size(job_id):
+    """Return the size of the stored export zip for a job, or 0 if there
+    is none."""
+    return redis.connect_to_redis().strlen(DCAT_V3_EXPORT_KEY.format(job_id))
+
+
+def iter_dcat_v3_export(job_id, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the stored export zip for a job in chunks."""
+    conn = redis.connect_to_redis()
+    key = DCAT_V3_EXPORT_KEY.format(job_id)
+    start = 0
+    while True:
+        chunk = conn.getrange(key, start, start + chunk_size - 1)
+        if not chunk:
+            return
+        yield chunk
+        start += len(chunk)
+
+
+def _update_progress(job, stage, processed=None, total=None):
+    if job is None:
+        return
+    job.meta['stage'] = stage
+    job.meta['processed'] = processed
+    job.meta['total'] = total
+    job.save_meta()
@@ -5,24 +5,60 @@ import ckan.model as model
 from ckan.model import User
 from ckan.common import _, g, current_user, request as ckan_request
 import ckan.lib.base as base
+from ckan.lib.jobs import job_from_id
 from ckan.logic.auth import get_resource_object
 from ckan.logic.auth.get import package_show
 from ckan.plugins.toolkit import config
 import ckan.authz as authz
-from ckanext.datagov_inventory import action
-from ckanext.datajson.blueprint import get_packages
-from ckanext.datajson.package2pod import Package2Pod
-from ckanext.datajson.helpers import get_export_map_json
+from ckanext.datagov_inventory import action, jobs
+from sqlalchemy import event, inspect, or_
 
-from flask import Blueprint, redirect, session, Response
+from flask import (
+    Blueprint, Response, current_app, has_request_context, jsonify,
+    redirect, session
+)
 from datetime import datetime, timezone
+import csv
+import json
 import logging
 import re
-from urllib.parse import quote
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from urllib.parse import quote, urlencode
 
 log = logging.getLogger(__name__)
 pusher = Blueprint('datagov_inventory', __name__)
 
+# the only urls anonymous users may see packages from, see
+# _is_public_download
+DOWNLOAD_URL_RE = re.compile(
+    r"^/dataset/[0-9a-f-]{36}/resource/[0-9a-f-]{36}/download/.*"
+)
+
+# how long and for how many packages their private flag is cached for
+# anonymous requests. The cache is per process: a change is forgotten by
+# the process that made it, but other web workers can keep serving the
+# old flag, and so anonymous downloads of a dataset just made private,
+# for up to the TTL.
+PACKAGE_PRIVATE_CACHE_TTL = 60
+PACKAGE_PRIVATE_CACHE_SIZE = 10000
+
+# actions that change packages without the IPackageController hooks
+PACKAGE_PRIVATE_CHANGING_BULK_ACTIONS = (
+    'bulk_update_private', 'bulk_update_public', 'bulk_update_delete',
+)
+
+# how many failed rows of a users CSV upload are reported
+USERS_UPLOAD_ERROR_LIMIT = 20
+
+# when refresh_session last saved the session, in epoch seconds
+SESSION_REFRESHED_KEY = '_datagov_inventory_refreshed'
+
+# static files and webassets, which don't keep a session alive
+SESSION_REFRESH_SKIPPED_ENDPOINTS = frozenset(['static', 'webassets.index'])
+
 
 @toolkit.auth_allow_anonymous_access
 @toolkit.chained_auth_function
@@ -41,24 +77,31 @@ def restrict_anon_access(next_auth, context, data_dict):
 @toolkit.auth_allow_anonymous_access
 def inventory_resource_show(context, data_dict):
     model = context['model']
-    user = User.by_name(context.get('user'))
-    resource = get_resource_object(context, data_dict)
+    user = _get_user(context['user']) if context.get('user') else None
+    resource = _memoize(
+        'resource', data_dict.get('id'),
+        lambda: get_resource_object(context, data_dict)
+    )
+
+    if user is None:
+        # only the package's private flag matters, which is usually cached
+        private = _package_is_private(model, resource.package_id)
+        if private is None:
+            raise logic.NotFound(_('No package found for this resource,'
+                                   ' cannot check auth.'))
+        return {'success': not private}
 
     # check authentication against package
-    pkg = model.Package.get(resource.package_id)
+    pkg = _get_package(model, resource.package_id)
     if not pkg:
         raise logic.NotFound(_('No package found for this resource,'
                                ' cannot check auth.'))
-
-    if user is None:
-        if pkg.private:
-            return {'success': False}
-        else:
-            return {'success': True}
     else:
         pkg_dict = {'id': pkg.id}
-        authorized = authz.is_authorized('package_show', context, pkg_dict) \
-            .get('success')
+        authorized = _memoize(
+            'is_authorized', ('package_show', user.name, pkg.id),
+            lambda: authz.is_authorized('package_show', context, pkg_dict)
+        ).get('success')
 
         if not authorized:
             return {'success': False,
@@ -71,25 +114,153 @@ def inventory_resource_show(context, data_dict):
 @toolkit.auth_allow_anonymous_access
 def inventory_package_show(context, data_dict):
     model = context['model']
-    user = User.by_name(context.get('user'))
-    pkg = model.Package.get(data_dict.get('id', None))
-
-    # package_show appears to be needed to download package resources.
-    # but we dont want direct package_show call open to anonymous user.
-    # only for download url matching /dataset/*/resource/*/download/*
-    url_pattern = r"^/dataset/[0-9a-f-]{36}/resource/[0-9a-f-]{36}/download/.*"
-    re_pattern = re.compile(url_pattern)
+    # anonymous requests need no user or package objects, see below
+    if not context.get('user'):
+        return {'success': _is_public_download(model, data_dict.get('id'))}
+
+    user = _get_user(context.get('user'))
     if user is None:
-        if not pkg.private and re_pattern.match(ckan_request.full_path):
-            return {'success': True}
-        else:
-            return {'success': False}
-    else:
+        return {'success': _is_public_download(model, data_dict.get('id'))}
+
+    pkg = _get_package(model, data_dict.get('id', None))
+    if pkg is None:
         return package_show(context, data_dict)
+    else:
+        return _memoize(
+            'package_show', (user.name, pkg.id),
+            lambda: package_show(context, data_dict)
+        )
+
+
+def _is_public_download(model, package_id):
+    """Whether an anonymous user may see the package: package_show
+    appears to be needed to download package resources, but we dont want
+    direct package_show calls open to anonymous users, so only for
+    public packages and download urls matching
+    /dataset/*/resource/*/download/*."""
+    return bool(
+        DOWNLOAD_URL_RE.match(ckan_request.full_path)
+        and _package_is_private(model, package_id) is False
+    )
+
+
+def _package_is_private(model, package_id):
+    """Return the package's `private` flag, or None if there is no such
+    package, cached for `PACKAGE_PRIVATE_CACHE_TTL` seconds."""
+    private = _package_private_cache.get(package_id)
+    if private is None and package_id:
+        private = model.Session.query(model.Package.private).filter(
+            or_(model.Package.id == package_id,
+                model.Package.name == package_id)
+        ).order_by(
+            # an id match wins over a name match, as in Package.get
+            (model.Package.id == package_id).desc()
+        ).limit(1).scalar()
+        if private is not None:
+            _package_private_cache.set(package_id, private)
+    return private
+
+
+def _forget_package_private(pkg_dict):
+    """Drop a changed package's cached private flag. Other processes
+    keep theirs until it expires."""
+    for key in (pkg_dict.get('id'), pkg_dict.get('name')):
+        if key:
+            _package_private_cache.pop(key)
+
+
+def _forget_bulk_updated_private(sender, data_dict=None, **kwargs):
+    """Signal receiver dropping the cached private flags of packages
+    changed by the bulk_update_* actions, which don't call the
+    IPackageController hooks. Flags are cached by id and by name, and
+    the actions are only given ids, so the names are looked up."""
+    package_ids = list((data_dict or {}).get('datasets') or [])
+    if not package_ids:
+        return
+    names = [
+        name for (name,) in model.Session.query(model.Package.name).filter(
+            model.Package.id.in_(package_ids)
+        )
+    ]
+    for key in package_ids + names:
+        _package_private_cache.pop(key)
+
+
+class _TTLCache(object):
+    """A thread-safe cache of at most `maxsize` items, dropping the least
+    recently used first, whose items expire `ttl` seconds after being
+    set."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+            value, expires = item
+            if expires <= time.monotonic():
+                del self._items[key]
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = (value, time.monotonic() + self.ttl)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_package_private_cache = _TTLCache(
+    PACKAGE_PRIVATE_CACHE_SIZE, PACKAGE_PRIVATE_CACHE_TTL
+)
+
+
+def _memoize(kind, key, load):
+    """Return `load()`, remembered on flask.g for the rest of the request.
+
+    A page with many resources runs the same auth checks over and over,
+    each loading the same user and package; this lets them share the
+    lookups. Outside a request nothing is cached.
+    """
+    if not has_request_context():
+        return load()
+    memo = g.setdefault('datagov_inventory_auth_memo', {})
+    if (kind, key) not in memo:
+        memo[(kind, key)] = load()
+    return memo[(kind, key)]
+
+
+def _get_user(name):
+    return _memoize('user', name, lambda: User.by_name(name))
+
+
+def _get_package(model, id_or_name):
+    return _memoize(
+        'package', id_or_name, lambda: model.Package.get(id_or_name)
+    )
+
+
+def _is_sysadmin(user):
+    return _memoize('sysadmin', user, lambda: authz.is_sysadmin(user))
 
 
 def user_org_roles(context, data_dict):
-    if authz.is_sysadmin(context.get('user')):
+    if _is_sysadmin(context.get('user')):
         return {'success': True}
     return {'success': False}
 
@@ -104,7 +275,25 @@ def create_inventory_user(context, data_dict):
                 'an authenticated user'
             )
         }
-    if authz.is_sysadmin(user):
+    if _is_sysadmin(user):
+        return {'success': True}
+    return {
+        'success': False,
+        'msg': 'Only sysadmins can create inventory users'
+    }
+
+
+def create_inventory_users_bulk(context, data_dict):
+    user = context.get('user')
+    if not user:
+        return {
+            'success': False,
+            'msg': (
+                'Action create_inventory_users_bulk requires '
+                'an authenticated user'
+            )
+        }
+    if _is_sysadmin(user):
         return {'success': True}
     return {
         'success': False,
@@ -119,7 +308,25 @@ def reactivate_user(context, data_dict):
             'success': False,
             'msg': 'Action reactivate_user requires an authenticated user'
         }
-    if authz.is_sysadmin(user):
+    if _is_sysadmin(user):
+        return {'success': True}
+    return {
+        'success': False,
+        'msg': 'Only sysadmins can reactivate users'
+    }
+
+
+def reactivate_users_bulk(context, data_dict):
+    user = context.get('user')
+    if not user:
+        return {
+            'success': False,
+            'msg': (
+                'Action reactivate_users_bulk requires '
+                'an authenticated user'
+            )
+        }
+    if _is_sysadmin(user):
         return {'success': True}
     return {
         'success': False,
@@ -127,12 +334,32 @@ def reactivate_user(context, data_dict):
     }
 
 
+def deactivate_users_bulk(context, data_dict):
+    user = context.get('user')
+    if not user:
+        return {
+            'success': False,
+            'msg': (
+                'Action deactivate_users_bulk requires '
+                'an authenticated user'
+            )
+        }
+    if _is_sysadmin(user):
+        return {'success': True}
+    return {
+        'success': False,
+        'msg': 'Only sysadmins can deactivate users'
+    }
+
+
 class Datagov_IauthfunctionsPlugin(plugins.SingletonPlugin):
     plugins.implements(plugins.IAuthFunctions)
     plugins.implements(plugins.IActions)
     plugins.implements(plugins.IConfigurer)
     plugins.implements(plugins.IBlueprint)
     plugins.implements(plugins.IResourceController, inherit=True)
+    plugins.implements(plugins.IPackageController, inherit=True)
+    plugins.implements(plugins.ISignal)
 
     def get_auth_functions(self):
         return {'format_autocomplete': restrict_anon_access,
@@ -150,7 +377,10 @@ class Datagov_IauthfunctionsPlugin(plugins.SingletonPlugin):
                 'user_list': restrict_anon_access,
                 'user_org_roles': user_org_roles,
                 'create_inventory_user': create_inventory_user,
+                'create_inventory_users_bulk': create_inventory_users_bulk,
                 'reactivate_user': reactivate_user,
+                'reactivate_users_bulk': reactivate_users_bulk,
+                'deactivate_users_bulk': deactivate_users_bulk,
                 'user_show': restrict_anon_access,
                 'vocabulary_list': restrict_anon_access,
                 'vocabulary_show': restrict_anon_access,
@@ -160,7 +390,28 @@ class Datagov_IauthfunctionsPlugin(plugins.SingletonPlugin):
         return {
             'user_org_roles': action.user_org_roles,
             'create_inventory_user': action.create_inventory_user,
+            'create_inventory_users_bulk': action.create_inventory_users_bulk,
             'reactivate_user': action.reactivate_user,
+            'reactivate_users_bulk': action.reactivate_users_bulk,
+            'deactivate_users_bulk': action.deactivate_users_bulk,
+        }
+
+    # ISignal
+    def get_signal_subscriptions(self):
+        return {
+            toolkit.signals.action_succeeded: [
+                {
+                    'sender': action_name,
+                    'receiver': action.invalidate_user_org_roles_cache,
+                }
+                for action_name in action.USER_ORG_ROLES_CHANGING_ACTIONS
+            ] + [
+                {
+                    'sender': action_name,
+                    'receiver': _forget_bulk_updated_private,
+                }
+                for action_name in PACKAGE_PRIVATE_CHANGING_BULK_ACTIONS
+            ],
         }
 
     # render our custom 403 template
@@ -172,6 +423,13 @@ class Datagov_IauthfunctionsPlugin(plugins.SingletonPlugin):
     def get_blueprint(self):
         return pusher
 
+    # IPackageController
+    def after_dataset_update(self, context, pkg_dict):
+        _forget_package_private(pkg_dict)
+
+    def after_dataset_delete(self, context, pkg_dict):
+        _forget_package_private(pkg_dict)
+
     def after_resource_create(self, context, resource):
         _touch_dataset_modified(context, resource['package_id'])
 
@@ -194,14 +452,140 @@ class Datagov_IauthfunctionsPlugin(plugins.SingletonPlugin):
 
 
 def _touch_dataset_modified(context, package_id):
-    """update dataset exported modified date (for any resource change)."""
+    """update dataset exported modified date (for any resource change).
+
+    Within a web request the update is deferred until the response is
+    sent, so a dataset whose resources change many times in one request
+    is only patched (and reindexed) once.
+    """
     modified = datetime.now(timezone.utc).isoformat(
         timespec='milliseconds'
     ).replace('+00:00', 'Z')
-    toolkit.get_action('package_patch')(
-        context,
-        {'id': package_id, 'modified': modified}
+    if has_request_context():
+        touched = g.setdefault('datagov_inventory_touched_packages', {})
+        touched[package_id] = (context, modified)
+        return
+    _patch_dataset_modified(context, package_id, modified)
+
+
+def _patch_dataset_modified(context, package_id, modified):
+    """Set the dataset's `modified` extra and bump its metadata_modified.
+
+    Only those two values change, so rather than a full package_patch
+    (which revalidates and rewrites the whole package and reindexes it
+    synchronously) they are written directly and the search index update
+    is left to a background job. For the same reason the
+    IPackageController `after_dataset_update` hooks are not called; the
+    private flag they would forget is unchanged, but it is forgotten here
+    anyway.
+
+    As with package_patch, the change is committed unless
+    `context['defer_commit']` is set, in which case the caller commits.
+    Either way the reindex job is only queued once the change is
+    committed.
+    """
+    if not context.get('ignore_auth'):
+        toolkit.check_access('package_patch', context, {'id': package_id})
+
+    # write the caller's pending changes before the rows change under them
+    model.Session.flush()
+    extra_table = model.package_extra_table
+    package_table = model.package_table
+    updated = model.Session.execute(
+        extra_table.update()
+        .where(extra_table.c.package_id == package_id)
+        .where(extra_table.c.key == 'modified')
+        .values(value=modified, state='active')
+    )
+    if not updated.rowcount:
+        model.Session.execute(extra_table.insert().values(
+            id=str(uuid.uuid4()),
+            package_id=package_id,
+            key='modified',
+            value=modified,
+            state='active',
+        ))
+    model.Session.execute(
+        package_table.update()
+        .where(package_table.c.id == package_id)
+        .values(metadata_modified=datetime.utcnow())
     )
+    _expire_package(package_id)
+    _forget_package_private({'id': package_id})
+    if toolkit.asbool(config.get('ckan.search.automatic_indexing', True)):
+        _reindex_after_commit(package_id)
+    if not context.get('defer_commit'):
+        model.Session.commit()
+
+
+# session.info key of the packages to reindex once the session commits
+REINDEX_AFTER_COMMIT_KEY = 'datagov_inventory_reindex'
+
+
+def _reindex_after_commit(package_id):
+    """Queue a search index update of the package once the current
+    transaction commits, so the job never sees the row before the change
+    or after a rollback."""
+    session = model.Session()
+    pending = session.info.get(REINDEX_AFTER_COMMIT_KEY)
+    if pending is None:
+        pending = session.info[REINDEX_AFTER_COMMIT_KEY] = {}
+        event.listen(session, 'after_commit', _enqueue_pending_reindex)
+        event.listen(session, 'after_rollback', _drop_pending_reindex)
+    pending[package_id] = None
+
+
+def _enqueue_pending_reindex(session):
+    pending = session.info.get(REINDEX_AFTER_COMMIT_KEY) or {}
+    package_ids = list(pending)
+    pending.clear()
+    for package_id in package_ids:
+        toolkit.enqueue_job(
+            jobs.reindex_package, [package_id],
+            title='Reindex dataset {}'.format(package_id)
+        )
+
+
+def _drop_pending_reindex(session):
+    (session.info.get(REINDEX_AFTER_COMMIT_KEY) or {}).clear()
+
+
+def _expire_package(package_id):
+    """Expire the package and its extras, if loaded, so that they see
+    changes made with plain SQL. Nothing else the session holds is
+    touched."""
+    for obj in list(model.Session.identity_map.values()):
+        # read loaded values only, so expired objects aren't refreshed
+        loaded = inspect(obj).dict
+        if (
+            isinstance(obj, model.Package)
+            and loaded.get('id') == package_id
+            or isinstance(obj, model.PackageExtra)
+            and loaded.get('package_id') == package_id
+        ):
+            model.Session.expire(obj)
+
+
+@pusher.after_app_request
+def flush_dataset_modified(response):
+    """Apply the dataset modified dates deferred during this request."""
+    touched = g.pop('datagov_inventory_touched_packages', None)
+    for package_id, (context, modified) in (touched or {}).items():
+        flush_context = {
+            'model': model,
+            'session': model.Session,
+            'user': context.get('user'),
+            'ignore_auth': context.get('ignore_auth', False),
+        }
+        try:
+            _patch_dataset_modified(flush_context, package_id, modified)
+        except Exception:
+            # leave the session usable for the packages that remain
+            model.Session.rollback()
+            log.exception(
+                'Could not update modified date of dataset %s', package_id
+            )
+    return response
 
 
 def redirect_homepage():
@@ -221,14 +605,28 @@ def user_org_roles_table():
         'ignore_auth': False,
         'user': g.user,
     }
+    args = ckan_request.args
     try:
-        users = toolkit.get_action('user_org_roles')(context, {})
+        sections = user_org_roles_table_sections(context, args)
     except logic.NotAuthorized:
         toolkit.abort(403, _('Not authorized to list user organization roles'))
+    except logic.ValidationError as e:
+        toolkit.abort(400, str(e.error_summary))
 
     return base.render(
         u'user_org_roles_table.html',
-        {'sections': user_org_roles_table_sections(users)}
+        {
+            'sections': sections,
+            'q': args.get('q', ''),
+            'sort': args.get('sort', ''),
+            'export_urls': {
+                export_format: _user_org_roles_url(
+                    {'q': args.get('q'), 'sort': args.get('sort')},
+                    path='/user/user-org-roles.' + export_format
+                )
+                for export_format in ('csv', 'jsonl')
+            },
+        }
     )
 
 
@@ -239,6 +637,48 @@ pusher.add_url_rule(
 )
 
 
+def user_org_roles_export(export_format):
+    """Stream the whole user org roles report as CSV or JSON lines."""
+    context = {
+        'model': model,
+        'ignore_auth': False,
+        'user': g.user,
+    }
+    args = ckan_request.args
+    try:
+        toolkit.check_access('user_org_roles', context, {})
+        rows = user_org_roles_export_rows(args.get('q'), args.get('sort'))
+    except logic.NotAuthorized:
+        toolkit.abort(403, _('Not authorized to list user organization roles'))
+    except logic.ValidationError as e:
+        toolkit.abort(400, str(e.error_summary))
+
+    if export_format == 'csv':
+        lines = _user_org_roles_csv_lines(rows)
+        mimetype = 'text/csv'
+    else:
+        lines = _user_org_roles_jsonl_lines(rows)
+        mimetype = 'application/x-ndjson'
+
+    return Response(
+        _join_lines(lines, USER_ORG_ROLES_EXPORT_LINES_PER_CHUNK),
+        mimetype=mimetype,
+        headers={
+            'Content-Disposition':
+                'attachment; filename="user-org-roles.{}"'.format(
+                    export_format
+                ),
+        },
+    )
+
+
+pusher.add_url_rule(
+    '/user/user-org-roles.<any(csv, jsonl):export_format>',
+    view_func=user_org_roles_export,
+    methods=['GET']
+)
+
+
 def create_user_form():
     from flask import request as flask_request
     import ckan.lib.helpers as h
@@ -297,6 +737,97 @@ pusher.add_url_rule(
 )
 
 
+def create_users_upload_form():
+    from flask import request as flask_request
+    import ckan.lib.helpers as h
+
+    context = {
+        'model': model,
+        'user': g.user,
+    }
+
+    try:
+        users = _parse_users_csv(flask_request.files.get('users_csv'))
+        result = toolkit.get_action('create_inventory_users_bulk')(
+            context,
+            {'users': users}
+        )
+        if result['created']:
+            h.flash_success(
+                _('Created {0} users').format(result['created'])
+            )
+        if result['failed']:
+            h.flash_error(_users_upload_errors(result['results']))
+    except logic.ValidationError as e:
+        error_messages = []
+        for field, errors in e.error_dict.items():
+            for error in errors:
+                error_messages.append('{0}: {1}'.format(field, error))
+        h.flash_error('; '.join(error_messages))
+    except logic.NotAuthorized:
+        h.flash_error(_('Not authorized to create users'))
+    except Exception as e:
+        log.error('Error creating users: %s', str(e))
+        h.flash_error(_('Error creating users: {0}').format(str(e)))
+
+    return redirect('/user/user-org-roles')
+
+
+pusher.add_url_rule(
+    '/user/create-users',
+    'create_users_upload_form',
+    view_func=create_users_upload_form,
+    methods=['POST']
+)
+
+
+def _parse_users_csv(upload):
+    """Read the name and email of each user from an uploaded CSV file,
+    which may start with a header row."""
+    if not upload or not upload.filename:
+        raise logic.ValidationError({'users_csv': ['Missing value']})
+    try:
+        text = upload.read().decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise logic.ValidationError({'users_csv': ['Must be UTF-8 encoded']})
+
+    rows = [
+        row for row in csv.reader(text.splitlines())
+        if any(value.strip() for value in row)
+    ]
+    if rows and [value.strip().lower() for value in rows[0][:2]] in (
+        ['name', 'email'], ['username', 'email']
+    ):
+        rows = rows[1:]
+    return [
+        {'name': row[0], 'email': row[1] if len(row) > 1 else ''}
+        for row in rows
+    ]
+
+
+def _users_upload_errors(results, limit=USERS_UPLOAD_ERROR_LIMIT):
+    messages = []
+    for result in results:
+        if result['success']:
+            continue
+        messages.append('Row {0} ({1}): {2}'.format(
+            result['row'],
+            result['name'],
+            ', '.join(
+                '{0}: {1}'.format(field, error)
+                for field, errors in result['errors'].items()
+                for error in errors
+            )
+        ))
+    if len(messages) > limit:
+        messages = messages[:limit] + [
+            'and {0} more'.format(len(messages) - limit)
+        ]
+    return '{0}: {1}'.format(
+        _('Some users could not be created'), '; '.join(messages)
+    )
+
+
 def reactivate_user_form(user_id):
     import ckan.lib.helpers as h
 
@@ -342,20 +873,158 @@ pusher.add_url_rule(
 )
 
 
+def reactivate_users_form():
+    from flask import request as flask_request
+    import ckan.lib.helpers as h
+
+    context = {
+        'model': model,
+        'user': g.user,
+    }
+
+    try:
+        result = toolkit.get_action('reactivate_users_bulk')(
+            context,
+            {'ids': flask_request.form.getlist('ids')}
+        )
+        if result['updated']:
+            h.flash_success(
+                _('Reactivated {0} users').format(result['updated'])
+            )
+        if result['not_updated']:
+            h.flash_error(
+                _('Not reactivated, as they are unknown or not deleted: '
+                  '{0}').format(', '.join(result['not_updated']))
+            )
+    except logic.ValidationError:
+        h.flash_error(_('Select the users to reactivate'))
+    except logic.NotAuthorized:
+        h.flash_error(_('Not authorized to reactivate users'))
+    except Exception as e:
+        log.error('Error reactivating users: %s', str(e))
+        h.flash_error(_('Error reactivating users: {0}').format(str(e)))
+
+    return redirect('/user/user-org-roles#deleted-users')
+
+
+pusher.add_url_rule(
+    '/user/reactivate-users',
+    'reactivate_users_form',
+    view_func=reactivate_users_form,
+    methods=['POST']
+)
+
+
 def generate_dcat_v3(org_id):
+    """Queue a DCAT-US v3.0 export for the organization.
+
+    The export runs on the background jobs worker; the response points
+    at the status and download urls for the queued job. While an export
+    for the organization is already queued or running, that one is
+    returned instead of queueing another.
+    """
+    log.debug(f'Queueing DCAT-US v3.0 export for org: {org_id}')
+
+    if not _can_export_dcat_v3(org_id):
+        return jsonify({'error': 'Not Authorized'}), 403
+
+    try:
+        job_id, job = _queue_dcat_v3_export(org_id)
+    except Exception:
+        log.exception('Error queueing DCAT v3.0 export for org %s', org_id)
+        return jsonify({'error': 'Error generating export'}), 500
+
+    return jsonify(_dcat_v3_job_status(org_id, job_id, job)), 202
+
+
+def _queue_dcat_v3_export(org_id):
+    """Queue an export for the organization, unless one is already
+    queued or running. Returns the export's job id and job; the job is
+    None while the request that claimed the export is still queueing
+    it."""
+    job_id = str(uuid.uuid4())
+    while True:
+        claimed = jobs.claim_dcat_v3_export(org_id, job_id)
+        if claimed == job_id:
+            break
+        job = _dcat_v3_job(org_id, claimed)
+        if job is None or _job_status(job) in ('queued', 'started'):
+            return claimed, job
+        # the job holding the claim died without releasing it
+        jobs.release_dcat_v3_export(org_id, claimed)
+
     try:
-        from ckanext.datagov_inventory.dcat.validator import (
-            process_export_with_error_tracking
+        job = toolkit.enqueue_job(
+            jobs.export_dcat_v3,
+            [org_id],
+            title='DCAT-US v3.0 export for {}'.format(org_id),
+            rq_kwargs={
+                'job_id': job_id,
+                'timeout': jobs.dcat_v3_export_timeout(),
+                'result_ttl': jobs.dcat_v3_export_ttl(),
+                'failure_ttl': jobs.dcat_v3_export_ttl(),
+                'meta': {'org_id': org_id, 'stage': 'queued'},
+            }
         )
-    except ImportError:
-        log.exception('Failed to import validator module')
-        return "Error generating export", 500
+    except Exception:
+        jobs.release_dcat_v3_export(org_id, job_id)
+        raise
+    return job_id, job
+
+
+pusher.add_url_rule(
+    '/organization/<org_id>/dcat-v3.json',
+    view_func=generate_dcat_v3,
+    methods=['POST']
+)
+
+
+def dcat_v3_export_status(org_id, job_id):
+    if not _can_export_dcat_v3(org_id):
+        return jsonify({'error': 'Not Authorized'}), 403
+
+    job = _dcat_v3_job(org_id, job_id)
+    if job is None:
+        return jsonify({'error': 'Export not found'}), 404
+
+    return jsonify(_dcat_v3_job_status(org_id, job_id, job))
 
-    log.debug(f'Generating DCAT-US v3.0 export for org: {org_id}')
 
-    if org_id is None:
-        return "Invalid organization id"
+pusher.add_url_rule(
+    '/organization/<org_id>/dcat-v3/<job_id>',
+    view_func=dcat_v3_export_status
+)
+
+
+def dcat_v3_export_download(org_id, job_id):
+    if not _can_export_dcat_v3(org_id):
+        return jsonify({'error': 'Not Authorized'}), 403
+
+    size = 0
+    if _dcat_v3_job(org_id, job_id) is not None:
+        size = jobs.get_dcat_v3_export_size(job_id)
+    if not size:
+        return jsonify({'error': 'Export not found'}), 404
+
+    resp = Response(
+        jobs.iter_dcat_v3_export(job_id),
+        mimetype='application/octet-stream'
+    )
+    resp.headers['Content-Length'] = str(size)
+    resp.headers['Content-Disposition'] = (
+        'attachment; filename="dcat-v3.zip"'
+    )
 
+    return resp
+
+
+pusher.add_url_rule(
+    '/organization/<org_id>/dcat-v3/<job_id>/download',
+    view_func=dcat_v3_export_download
+)
+
+
+def _can_export_dcat_v3(org_id):
     try:
         toolkit.check_access(
             'package_create',
@@ -367,89 +1036,245 @@ def generate_dcat_v3(org_id):
             'NotAuthorized to generate DCAT v3.0 for org %s (user: %s)',
             org_id, g.user
         )
-        return "Not Authorized"
+        return False
+    return True
 
+
+def _dcat_v3_job(org_id, job_id):
+    """Return the export job, or None if it is unknown or belongs to
+    another organization."""
     try:
-        packages = get_packages(owner_org=org_id, with_private=True)
+        job = job_from_id(job_id)
+    except KeyError:
+        return None
+    if (job.meta or {}).get('org_id') != org_id:
+        return None
+    return job
 
-        json_export_map = get_export_map_json()
-        output = []
-        Package2Pod.seen_identifiers = set()
 
-        for pkg in packages:
-            datajson_entry = Package2Pod.convert_package(
-                pkg, json_export_map, redaction_enabled=False
-            )
-            if datajson_entry:
-                output.append(datajson_entry)
+def _job_status(job):
+    status = job.get_status()
+    return getattr(status, 'value', status)
 
-        catalog_v1_1 = Package2Pod.wrap_json_catalog(output, json_export_map)
 
-        zip_binary = process_export_with_error_tracking(catalog_v1_1)
+def _dcat_v3_job_status(org_id, job_id, job=None):
+    """Describe the export job; one that isn't in the queue yet is
+    described as queued."""
+    if job is None:
+        status, meta = 'queued', {}
+    else:
+        status, meta = _job_status(job), job.meta or {}
+    return {
+        'job_id': job_id,
+        'status': status,
+        'stage': meta.get('stage'),
+        'processed': meta.get('processed'),
+        'total': meta.get('total'),
+        'status_url': toolkit.url_for(
+            'datagov_inventory.dcat_v3_export_status',
+            org_id=org_id, job_id=job_id
+        ),
+        'download_url': toolkit.url_for(
+            'datagov_inventory.dcat_v3_export_download',
+            org_id=org_id, job_id=job_id
+        ),
+    }
 
-        resp = Response(
-            zip_binary, mimetype='application/octet-stream'
-        )
-        resp.headers['Content-Disposition'] = (
-            'attachment; filename="dcat-v3.zip"'
+
+# users shown per page in each section of the user org roles page
+USER_ORG_ROLES_PAGE_SIZE = 50
+
+USER_ORG_ROLES_SECTIONS = [
+    ('Sysadmins', 'sysadmins',
+     ['user', 'email', 'last_active', 'organization', 'role'], False),
+    ('Users with organizations', 'users-with-organizations',
+     ['user', 'email', 'last_active', 'organization', 'role'], True),
+    ('Users without organizations', 'users-without-organizations',
+     ['user', 'email', 'last_active'], True),
+    ('Deleted Users', 'deleted-users',
+     ['user', 'email', 'last_active'], True),
+]
+
+# the columns of the CSV and JSON lines exports of the report
+USER_ORG_ROLES_EXPORT_COLUMNS = [
+    'user', 'email', 'last_active', 'sysadmin', 'organization', 'role'
+]
+USER_ORG_ROLES_EXPORT_LINES_PER_CHUNK = 500
+
+# the user_org_roles sort field for each sortable column
+USER_ORG_ROLES_SORT_COLUMNS = {
+    'user': 'name',
+    'email': 'email',
+    'last_active': 'last_active',
+    'organization': 'organization',
+}
+
+
+def user_org_roles_table_sections(context, args):
+    """Fetch the requested page of each section of the user org roles
+    page. `args` holds the `q` and `sort` to apply and a `<section>-page`
+    number per section."""
+    q = args.get('q', '')
+    sort = args.get('sort') or 'name asc'
+    user_org_roles = toolkit.get_action('user_org_roles')
+
+    sections = []
+    counts = None
+    for title, section_id, columns, sortable in USER_ORG_ROLES_SECTIONS:
+        page = max(toolkit.asint(args.get(section_id + '-page') or 1), 1)
+        users = user_org_roles(context, {
+            'section': section_id,
+            'q': q,
+            'sort': sort if sortable else None,
+            'limit': USER_ORG_ROLES_PAGE_SIZE,
+            'offset': (page - 1) * USER_ORG_ROLES_PAGE_SIZE,
+        })
+        if counts is None:
+            # user_org_roles has checked access by now
+            counts = action.user_org_roles_counts(q)
+
+        section = _user_org_roles_section(
+            title, section_id, users, columns, sortable
         )
+        section['count'] = counts[section_id]['rows']
+        section.update(_user_org_roles_pagination(
+            args, section_id, page, counts[section_id]['users']
+        ))
+        section['sort_links'] = [
+            _user_org_roles_sort_link(args, column, sort) if sortable else None
+            for column in columns
+        ]
+        sections.append(section)
+    return sections
+
+
+def user_org_roles_export_rows(q=None, sort=None):
+    """Return an iterator over `(section_id, values)` for every row of the
+    user org roles report, where `values` maps each of
+    `USER_ORG_ROLES_EXPORT_COLUMNS` to its formatted value.
+
+    Users are read in batches as the iterator is consumed. That happens
+    after CKAN has removed the request's database session, so the session
+    the rows are read with is removed once they have all been read.
+    """
+    sections = [
+        (section_id, action.iter_user_org_roles(
+            section=section_id, q=q, sort=sort if sortable else None
+        ))
+        for _title, section_id, _columns, sortable in USER_ORG_ROLES_SECTIONS
+    ]
+    return _iter_user_org_roles_export_rows(sections)
 
-        return resp
 
-    except Exception:
-        log.exception('Error generating DCAT v3.0 export for org %s', org_id)
-        return "Error generating export", 500
+def _iter_user_org_roles_export_rows(sections):
+    try:
+        for section_id, users in sections:
+            for user in users:
+                for organization in _user_organizations(user):
+                    row = _user_org_roles_row_values(
+                        user, organization, USER_ORG_ROLES_EXPORT_COLUMNS
+                    )
+                    yield section_id, {
+                        column: cell['value'] for column, cell in zip(
+                            USER_ORG_ROLES_EXPORT_COLUMNS, row
+                        )
+                    }
+    finally:
+        model.Session.remove()
 
 
-pusher.add_url_rule(
-    '/organization/<org_id>/dcat-v3.json',
-    view_func=generate_dcat_v3
-)
+class _Echo(object):
+    """A file-like object csv.writer can write single rows to."""
 
+    def write(self, value):
+        return value
 
-def user_org_roles_table_sections(users):
-    active_users = [user for user in users if user['state'] == 'active']
-    deleted_users = [user for user in users if user['state'] == 'deleted']
-    sysadmins = [user for user in active_users if user['sysadmin']]
-    users_with_orgs = [
-        user for user in active_users
-        if not user['sysadmin'] and user['organizations']
-    ]
-    users_without_orgs = [
-        user for user in active_users
-        if not user['sysadmin'] and not user['organizations']
-    ]
 
-    return [
-        _user_org_roles_section('Sysadmins', 'sysadmins', sysadmins,
-                                ['user', 'email', 'last_active',
-                                 'organization', 'role']),
-        _user_org_roles_section('Users with organizations',
-                                'users-with-organizations', users_with_orgs,
-                                ['user', 'email', 'last_active',
-                                 'organization', 'role'],
-                                sortable=True),
-        _user_org_roles_section('Users without organizations',
-                                'users-without-organizations',
-                                users_without_orgs,
-                                ['user', 'email', 'last_active'],
-                                sortable=True),
-        _user_org_roles_section('Deleted Users', 'deleted-users',
-                                deleted_users,
-                                ['user', 'email', 'last_active'],
-                                sortable=True),
-    ]
+def _user_org_roles_csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(
+        ['Section'] + _user_org_roles_column_labels(
+            USER_ORG_ROLES_EXPORT_COLUMNS
+        )
+    )
+    for section_id, values in rows:
+        yield writer.writerow([section_id] + [
+            values[column] for column in USER_ORG_ROLES_EXPORT_COLUMNS
+        ])
+
+
+def _user_org_roles_jsonl_lines(rows):
+    for section_id, values in rows:
+        record = {'section': section_id}
+        record.update(values)
+        yield json.dumps(record) + '\n'
+
+
+def _join_lines(lines, lines_per_chunk):
+    """Group lines into larger chunks to keep the number of writes to the
+    client down."""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= lines_per_chunk:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+def _user_org_roles_pagination(args, section_id, page, user_count):
+    page_count = max(
+        (user_count + USER_ORG_ROLES_PAGE_SIZE - 1)
+        // USER_ORG_ROLES_PAGE_SIZE,
+        1
+    )
+    key = section_id + '-page'
+    return {
+        'page': page,
+        'page_count': page_count,
+        'previous_url': _user_org_roles_url(
+            args, **{key: page - 1}
+        ) if page > 1 else None,
+        'next_url': _user_org_roles_url(
+            args, **{key: page + 1}
+        ) if page < page_count else None,
+    }
+
+
+def _user_org_roles_sort_link(args, column, sort):
+    field = USER_ORG_ROLES_SORT_COLUMNS.get(column)
+    if field is None:
+        return None
+    indicator = ''
+    direction = 'asc'
+    if sort == field + ' asc':
+        indicator = u' \u25B2'
+        direction = 'desc'
+    elif sort == field + ' desc':
+        indicator = u' \u25BC'
+    # a new order starts every section from its first page again
+    return {
+        'url': _user_org_roles_url(
+            {'q': args.get('q', '')}, sort='{} {}'.format(field, direction)
+        ),
+        'indicator': indicator,
+    }
+
+
+def _user_org_roles_url(args, path='/user/user-org-roles', **changes):
+    params = dict(args.items())
+    params.update(changes)
+    params = {key: value for key, value in params.items() if value}
+    if not params:
+        return path
+    return path + '?' + urlencode(params)
 
 
 def _user_org_roles_section(title, section_id, users, columns, sortable=False):
     rows = []
     for user in users:
-        organizations = user['organizations'] or [{
-            'name': '',
-            'title': '',
-            'role': '',
-        }]
-        for organization in organizations:
+        for organization in _user_organizations(user):
             rows.append(
                 _user_org_roles_row_values(user, organization, columns)
             )
@@ -465,6 +1290,16 @@ def _user_org_roles_section(title, section_id, users, columns, sortable=False):
     }
 
 
+def _user_organizations(user):
+    """A user's organizations, or a blank one for a user without any, as
+    each makes a row of the report."""
+    return user['organizations'] or [{
+        'name': '',
+        'title': '',
+        'role': '',
+    }]
+
+
 def _user_org_roles_column_labels(columns):
     labels = {
         'user': 'User',
@@ -519,14 +1354,83 @@ def _organization_manage_members_url(organization):
     return '/organization/manage_members/{}'.format(quote(name))
 
 
-@pusher.before_app_request
 def check_dataset_access():
     if toolkit.request.path in ('/dataset/', '/dataset'):
         if not current_user.is_authenticated and not g.user:
             return base.render(u'error/anonymous.html'), 403
 
 
-@pusher.before_app_request
 def refresh_session():
-    """ Refresh session expiration time on each request """
-    session.modified = True
+    """ Refresh session expiration time as the user keeps using the site.
+
+    Saving the session pushes its expiry back by PERMANENT_SESSION_LIFETIME
+    but costs a session store write and a Set-Cookie header, so it is only
+    saved again once less than `session_refresh_threshold` of its lifetime
+    is left. Requests for assets or authenticated with an API token don't
+    keep a session alive.
+    """
+    if not session or _is_asset_or_api_token_request():
+        return
+
+    now = int(time.time())
+    lifetime = current_app.permanent_session_lifetime.total_seconds()
+    refreshed = session.get(SESSION_REFRESHED_KEY)
+    if (not isinstance(refreshed, int)
+            or lifetime - (now - refreshed) < session_refresh_threshold()):
+        # changing the session is what makes it saved
+        session[SESSION_REFRESHED_KEY] = now
+
+
+def session_refresh_threshold():
+    """Seconds of session lifetime left below which a request refreshes
+    the session, half of PERMANENT_SESSION_LIFETIME by default."""
+    threshold = config.get(
+        'ckanext.datagov_inventory.session_refresh_threshold'
+    )
+    if threshold in (None, ''):
+        return current_app.permanent_session_lifetime.total_seconds() / 2
+    return toolkit.asint(threshold)
+
+
+def _is_asset_or_api_token_request():
+    return (
+        ckan_request.endpoint in SESSION_REFRESH_SKIPPED_ENDPOINTS
+        or bool(ckan_request.headers.get(
+            config.get('apitoken_header_name') or 'Authorization'
+        ))
+    )
+
+
+# The before-request hooks that apply to a path: by the exact path, or
+# else by its first segment, or else the default ones. API calls and
+# static files get none, so they never load the session or the user.
+REQUEST_HOOKS_BY_PATH = {
+    '/dataset': (check_dataset_access, refresh_session),
+    '/dataset/': (check_dataset_access, refresh_session),
+}
+REQUEST_HOOKS_BY_FIRST_SEGMENT = {
+    'api': (),
+    'base': (),
+    'favicon.ico': (),
+    'images': (),
+    'webassets': (),
+}
+DEFAULT_REQUEST_HOOKS = (refresh_session,)
+
+
+def request_hooks_for_path(path):
+    hooks = REQUEST_HOOKS_BY_PATH.get(path)
+    if hooks is not None:
+        return hooks
+    first_segment = path[1:].partition('/')[0]
+    return REQUEST_HOOKS_BY_FIRST_SEGMENT.get(
+        first_segment, DEFAULT_REQUEST_HOOKS
+    )
+
+
+@pusher.before_app_request
+def run_request_hooks():
+    for hook in request_hooks_for_path(ckan_request.path):
+        response = hook()
+        if response is not None:
+            return response
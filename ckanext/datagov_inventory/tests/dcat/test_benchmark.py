@@ -0,0 +1,116 @@
+import json
+
+from click.testing import CliRunner
+
+from ckanext.datagov_inventory.dcat import benchmark
+
+
+def test_generate_catalog_is_deterministic():
+    first = benchmark.generate_catalog(50, seed=3)
+    assert first == benchmark.generate_catalog(50, seed=3)
+    assert first != benchmark.generate_catalog(50, seed=4)
+    assert len(first["dataset"]) == 50
+    assert len({d["identifier"] for d in first["dataset"]}) == 50
+
+
+def test_run_size_reports_every_step():
+    result = benchmark.run_size(40)
+
+    assert result["size"] == result["datasets"] == 40
+    assert set(result["seconds"]["transforms"]) == {
+        transform.__name__
+        for transform in benchmark.transforms.DATASET_TRANSFORMS
+    }
+    for key in ("convert", "validate", "zip", "export", "generate"):
+        assert result["seconds"][key] >= 0
+    # every INVALID_EVERY-th dataset is missing its title
+    assert result["validation_errors"] == 40 // benchmark.INVALID_EVERY
+    assert result["zip_bytes"] > 0
+    assert result["datasets_per_second"] > 0
+    assert result["peak_rss_mb"] > 0
+
+
+def test_compare_results_matches_sizes():
+    def results(size, export_seconds):
+        return {
+            "results": [{
+                "size": size,
+                "seconds": {
+                    "convert": 1.0, "validate": 1.0, "zip": 1.0,
+                    "export": export_seconds,
+                    "transforms": {"transform_modified": 0.5},
+                },
+                "peak_rss_mb": 100.0,
+                "datasets_per_second": 10.0,
+            }]
+        }
+
+    rows = benchmark.compare_results(results(10, 4.0), results(10, 2.0))
+
+    assert (10, "export_seconds", 4.0, 2.0, 0.5) in rows
+    assert (10, "transform_modified_seconds", 0.5, 0.5, 1.0) in rows
+    assert benchmark.compare_results(results(10, 4.0), results(20, 2.0)) == []
+
+
+def test_comparison_shows_missing_metrics_as_n_a(capsys):
+    rows = [
+        (10, "export_seconds", 4.0, 2.0, 0.5),
+        (10, "datasets_per_second", 2.5, None, None),
+    ]
+
+    benchmark._echo_comparison(rows)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split() == [
+        "10", "export_seconds", "4.000", "2.000", "0.50x"
+    ]
+    assert lines[1].split() == [
+        "10", "datasets_per_second", "2.500", "n/a", "n/a"
+    ]
+
+
+def test_main_writes_results(tmp_path, monkeypatch):
+    # run in-process rather than in a spawned process per size
+    monkeypatch.setattr(
+        benchmark, "ProcessPoolExecutor", _InlineExecutor
+    )
+    output = tmp_path / "results.json"
+
+    result = CliRunner().invoke(
+        benchmark.main, ["-s", "5,10", "-o", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    saved = json.loads(output.read_text())
+    assert [r["size"] for r in saved["results"]] == [5, 10]
+    assert saved["seed"] == 0
+
+    result = CliRunner().invoke(
+        benchmark.main, ["-s", "5", "-o", str(output), "-c", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "export_seconds" in result.output
+
+
+class _InlineExecutor(object):
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        return _Done(fn(*args))
+
+
+class _Done(object):
+
+    def __init__(self, value):
+        self.value = value
+
+    def result(self):
+        return self.value
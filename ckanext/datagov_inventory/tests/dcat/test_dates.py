@@ -0,0 +1,70 @@
+import pytest
+from dateutil import parser
+
+from ckanext.datagov_inventory.dcat import dates
+
+
+def _dateutil_is_date(value):
+    try:
+        parser.parse(value)
+        return True
+    except (ValueError, OverflowError):
+        return False
+
+
+@pytest.mark.parametrize("value, kind", [
+    ("2024", dates.DATE),
+    ("2024-01", dates.DATE),
+    ("2024-01-15", dates.DATE),
+    ("2024-02-29T10:30:00Z", dates.DATE),
+    ("2021-06-01 12:30:00.123-05:00", dates.DATE),
+    ("2024-01-15T10:30+0530", dates.DATE),
+    ("P1M", dates.DURATION),
+    ("P1Y2M3DT4H5M6.5S", dates.DURATION),
+    ("PT1S", dates.DURATION),
+    ("R/P1Y", dates.REPEATING_INTERVAL),
+    ("R5/P1W", dates.REPEATING_INTERVAL),
+    # not real dates and times, left to dateutil
+    ("2023-02-29", None),
+    ("2024-13-01", None),
+    ("2024-01-15T24:00:00", None),
+    ("2024-01-15T10:30:00+25:00", None),
+    # other shapes, left to dateutil
+    ("P", None),
+    ("PT", None),
+    ("R/P", None),
+    ("2024-1-5", None),
+    ("2020-01-01/2021-01-01", None),
+    ("irregular", None),
+    ("", None),
+])
+def test_classify(value, kind):
+    assert dates.classify(value) == kind
+
+
+@pytest.mark.parametrize("value", [
+    "2024", "2024-01-15", "2024-02-29T10:30:00Z", "2023-02-29",
+    "2024-13-01", "2024-01-15T24:00:00", "P1M", "R/P1Y", "R/P",
+    "2024-1-5", "1/2/2024", "2019-03-01/..", "2018-01-01/P2Y",
+    "irregular", "",
+])
+def test_is_date_agrees_with_dateutil(value):
+    assert dates.is_date(value) == _dateutil_is_date(value)
+
+
+def test_is_date_only_parses_unrecognized_values(monkeypatch):
+    parsed = []
+
+    def parse(value):
+        parsed.append(value)
+        raise ValueError(value)
+
+    monkeypatch.setattr(dates.parser, "parse", parse)
+    dates.is_date.cache_clear()
+
+    assert dates.is_date("2024-01-15")
+    assert not dates.is_date("R/P1M")
+    assert not dates.is_date("sometime")
+    assert not dates.is_date("sometime")
+    assert parsed == ["sometime"]
+    dates.is_date.cache_clear()
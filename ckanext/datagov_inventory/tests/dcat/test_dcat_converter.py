@@ -408,3 +408,102 @@ class TestDCATConverter:
         assert catalog["dataset"][1]["identifier"] == "valid-002"
         assert len(errors) == 1
         assert errors[0]["identifier"] == "error-001"
+
+
+class TestStreamingConversion:
+
+    @pytest.fixture
+    def v1_1_catalog(self):
+        return {
+            "@context": "https://project-open-data.cio.gov/v1.1/schema",
+            "conformsTo": "https://project-open-data.cio.gov/v1.1/schema",
+            "dataset": [
+                {
+                    "title": "Données",
+                    "identifier": "test-001",
+                    "modified": "R/P1Y",
+                    "temporal": "2020-01-01/2025-12-31",
+                    "spatial": "-77.1,38.8,-76.9,39.0",
+                    "license": "https://example.gov/license",
+                    "distribution": [{"accessURL": "https://example.gov/a"}],
+                    "bytes": 1.5,
+                },
+                {
+                    "title": "Broken",
+                    "identifier": "error-001",
+                    "license": "https://example.gov/license",
+                    "distribution": 5,
+                },
+            ],
+            "modified": "2024-01-15T10:00:00",
+        }
+
+    def convert_streaming(self, path):
+        errors = []
+        with dcat_converter.open_dcat_catalog(str(path)) as fp:
+            items = dcat_converter.convert_dcat_catalog_items(
+                dcat_converter.iter_catalog_items(fp), errors
+            )
+            text = "".join(validator.iter_catalog_items_json(items))
+        return text, errors
+
+    def test_streaming_conversion_matches_convert_dcat_catalog(
+        self, tmp_path, v1_1_catalog
+    ):
+        import codecs
+        import json
+
+        path = tmp_path / "data.json"
+        path.write_bytes(
+            codecs.BOM_UTF8 + json.dumps(v1_1_catalog).encode("utf-8")
+        )
+
+        text, errors = self.convert_streaming(path)
+        catalog, expected_errors = dcat_converter.convert_dcat_catalog(
+            v1_1_catalog
+        )
+
+        assert text == json.dumps(catalog, indent=2, ensure_ascii=False)
+        assert errors == expected_errors
+
+    def test_streaming_conversion_adds_missing_catalog_fields(
+        self, tmp_path
+    ):
+        import json
+
+        path = tmp_path / "data.json"
+        path.write_text('{"title": "Empty"}')
+
+        text, errors = self.convert_streaming(path)
+        catalog, _ = dcat_converter.convert_dcat_catalog({"title": "Empty"})
+
+        assert json.loads(text) == catalog
+        assert list(json.loads(text)) == ["title", "conformsTo", "dataset"]
+
+    def test_streaming_rejects_non_object_catalog(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text("[]")
+
+        with pytest.raises(dcat_converter.CatalogFetchException):
+            self.convert_streaming(path)
+
+    def test_cli_stream_writes_catalog(self, tmp_path, v1_1_catalog):
+        import json
+
+        from click.testing import CliRunner
+
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(v1_1_catalog))
+        output_dir = tmp_path / "out"
+
+        result = CliRunner().invoke(dcat_converter.main, [
+            "--url", str(path), "--output-dir", str(output_dir), "--stream"
+        ])
+
+        assert result.exit_code == 0, result.output
+        catalog, _ = dcat_converter.convert_dcat_catalog(v1_1_catalog)
+        assert json.loads((output_dir / "catalog.json").read_text()) == (
+            catalog
+        )
+        assert not (output_dir / "catalog.json.partial").exists()
+        assert '"datasets": 2' in result.output
@@ -0,0 +1,191 @@
+import copy
+import random
+
+import pytest
+from referencing import Registry
+
+from ckanext.datagov_inventory.dcat import (
+    benchmark,
+    compiled_schemas,
+    dcat_converter,
+    schema_compiler,
+    validator,
+)
+
+
+MUTATION_VALUES = [
+    None, "", "x", 5, 1.5, True, [], [None], ["a"], {}, {"@type": "x"},
+    "2024-01-15", "2024-13-45", "R/P1Y", "mailto:jane@example.gov",
+    "https://example.gov/a", "http://not a uri", "[[REDACTED-EX B3]]",
+    "015:11", ["015:11"], "text/csv", "en",
+]
+
+
+def _mutate(rng, obj, depth=0):
+    if isinstance(obj, dict) and obj:
+        key = rng.choice(list(obj))
+        chance = rng.random()
+        if chance < 0.3:
+            del obj[key]
+        elif chance < 0.7 or depth > 3:
+            obj[key] = copy.deepcopy(rng.choice(MUTATION_VALUES))
+        else:
+            _mutate(rng, obj[key], depth + 1)
+    elif isinstance(obj, list) and obj:
+        i = rng.randrange(len(obj))
+        if rng.random() < 0.5:
+            obj[i] = copy.deepcopy(rng.choice(MUTATION_VALUES))
+        else:
+            _mutate(rng, obj[i], depth + 1)
+
+
+def _mutations(datasets, count, seed=0):
+    rng = random.Random(seed)
+    mutations = []
+    for _ in range(count):
+        dataset = copy.deepcopy(rng.choice(datasets))
+        for _ in range(rng.randint(1, 3)):
+            _mutate(rng, dataset)
+        mutations.append(dataset)
+    return mutations
+
+
+@pytest.fixture(scope="module")
+def catalogs():
+    v1_1_catalog = benchmark.generate_catalog(100, seed=1)
+    v3_0_catalog, _ = dcat_converter.convert_dcat_catalog(
+        v1_1_catalog, fused=True
+    )
+    return v1_1_catalog, v3_0_catalog
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    validator.clear_schema_cache()
+    yield
+    validator.clear_schema_cache()
+
+
+def test_compiled_schemas_are_up_to_date():
+    # run `make compile-dcat-schemas` if this fails
+    assert schema_compiler.generate_module() == (
+        schema_compiler.COMPILED_SCHEMAS_PATH.read_text()
+    )
+
+
+@pytest.mark.parametrize("schema_id, version", [
+    (validator.V1_1_DATASET_SCHEMA_ID, 0),
+    (validator.V3_0_DATASET_SCHEMA_ID, 1),
+])
+def test_compiled_dataset_schemas_agree_with_jsonschema(
+    catalogs, schema_id, version
+):
+    datasets = catalogs[version]["dataset"]
+    jsonschema_validator = validator.get_validator(schema_id)
+    is_valid = validator.get_is_valid(schema_id)
+
+    results = [
+        (is_valid(dataset), jsonschema_validator.is_valid(dataset))
+        for dataset in datasets + _mutations(datasets, 300)
+    ]
+
+    assert all(compiled == expected for compiled, expected in results)
+    # both valid and invalid datasets were tried
+    assert {expected for _, expected in results} == {True, False}
+
+
+@pytest.mark.parametrize("schema_id, version", [
+    (validator.V1_1_CATALOG_SCHEMA_ID, 0),
+    (validator.V3_0_CATALOG_SCHEMA_ID, 1),
+])
+def test_compiled_catalog_schemas_agree_with_jsonschema(
+    catalogs, schema_id, version
+):
+    jsonschema_validator = validator.get_validator(schema_id)
+    is_valid = validator.get_is_valid(schema_id)
+    dataset_validator = validator.get_validator(
+        validator.V1_1_DATASET_SCHEMA_ID if version == 0
+        else validator.V3_0_DATASET_SCHEMA_ID
+    )
+    catalog = dict(catalogs[version])
+    catalog["dataset"] = [
+        dataset for dataset in catalog["dataset"]
+        if dataset_validator.is_valid(dataset)
+    ]
+
+    results = [
+        (is_valid(instance), jsonschema_validator.is_valid(instance))
+        for instance in [catalog] + _mutations([catalog], 40)
+    ]
+
+    assert all(compiled == expected for compiled, expected in results)
+    assert {expected for _, expected in results} == {True, False}
+
+
+def test_stale_compiled_schemas_are_compiled_in_memory(
+    monkeypatch, catalogs
+):
+    monkeypatch.setitem(compiled_schemas.DIGESTS, "definitions", "stale")
+    dataset = catalogs[1]["dataset"][0]
+
+    is_valid = validator.get_is_valid(validator.V3_0_DATASET_SCHEMA_ID)
+
+    assert is_valid is not compiled_schemas.IS_VALID[
+        validator.V3_0_DATASET_SCHEMA_ID
+    ]
+    assert is_valid(dataset)
+    assert not is_valid({**dataset, "title": 5})
+
+
+def test_other_jsonschema_releases_are_not_compiled(monkeypatch):
+    monkeypatch.setattr(compiled_schemas, "JSONSCHEMA_VERSION", "0.0.0")
+
+    assert validator.get_is_valid(validator.V3_0_DATASET_SCHEMA_ID) is None
+
+
+def test_old_jsonschema_api_is_not_compiled(monkeypatch):
+    monkeypatch.setattr(validator, "USE_NEW_API", False)
+
+    assert validator.get_is_valid(validator.V3_0_DATASET_SCHEMA_ID) is None
+
+
+def test_custom_registries_are_not_compiled():
+    registry = validator.load_schema_registry(validator.V3_0_DEFINITIONS_DIR)
+
+    assert validator.get_is_valid(
+        validator.V3_0_DATASET_SCHEMA_ID, registry
+    ) is None
+
+
+def test_jsonschema_only_describes_invalid_datasets(monkeypatch, catalogs):
+    datasets = catalogs[1]["dataset"]
+    jsonschema_validator = validator.get_validator(
+        validator.V3_0_DATASET_SCHEMA_ID
+    )
+    checked = []
+
+    class CountingValidator(object):
+
+        def iter_errors(self, instance):
+            checked.append(instance)
+            return jsonschema_validator.iter_errors(instance)
+
+    monkeypatch.setattr(
+        validator, "get_validator",
+        lambda schema_id, registry=None: CountingValidator()
+    )
+
+    errors = validator.validate_v3_0_catalog({"dataset": datasets})
+
+    assert len(checked) == len(errors) > 0
+    assert checked == [
+        dataset for dataset in datasets
+        if not jsonschema_validator.is_valid(dataset)
+    ]
+
+
+def test_unsupported_keywords_fail_to_compile():
+    resolver = Registry().resolver()
+
+    with pytest.raises(schema_compiler.SchemaCompileError):
+        schema_compiler._Compiler().function_for({"minimum": 1}, resolver)
@@ -0,0 +1,172 @@
+import copy
+import json
+
+import pytest
+
+from ckanext.datagov_inventory.dcat import dcat_converter, transforms
+
+
+DATASETS = [
+    {
+        "title": "Test Dataset",
+        "identifier": "test-001",
+        "description": "A test dataset",
+        "modified": "2024-01-15",
+        "temporal": "2020-01-01/2025-12-31",
+        "spatial": "United States",
+        "language": ["en-US"],
+        "accessLevel": "public",
+        "license": "https://creativecommons.org/publicdomain/zero/1.0/",
+        "rights": "This data is in the public domain.",
+        "describedBy": "https://example.gov/schema.json",
+        "describedByType": "application/schema+json",
+        "conformsTo": "https://www.iso.org/standard/53798.html",
+        "landingPage": "https://example.gov/test-dataset",
+        "issued": "2020-01-01",
+        "publisher": {
+            "@type": "Organization",
+            "name": "Test Agency",
+            "subOrganizationOf": {
+                "@type": "Organization",
+                "name": "Parent Agency",
+                "subOrganizationOf": [{"name": "Department"}],
+            },
+        },
+        "distribution": [
+            {
+                "accessURL": "https://example.gov/data.csv",
+                "format": "CSV",
+                "describedBy": "https://example.gov/dict.csv",
+                "conformsTo": "https://example.gov/standard",
+            },
+            {
+                "downloadURL": "https://example.gov/data.zip",
+                "license": "https://example.gov/other-license",
+            },
+        ],
+    },
+    {
+        "title": "Périodique données",
+        "identifier": "test-002",
+        "modified": "R/P1M",
+        "temporal": "R/2020-01-01/P1Y",
+        "spatial": "-77.1,38.8,-76.9,39.0",
+        "language": ["English", "es", 42],
+        "accessLevel": "restricted public",
+        "rights": ["already", "a list"],
+        "issued": "2020-01-01T00:00:00",
+        "landingPage": 12,
+        "publisher": {"name": "Agency"},
+    },
+    {
+        "title": "Odd values",
+        "identifier": "test-003",
+        "modified": "not a date",
+        "temporal": "2020-01-01T10:00:00Z/..",
+        "spatial": {"type": "Point"},
+        "accessLevel": "non-public",
+        "accessRights": "kept",
+        "rights": 7,
+        "issued": "2021-06-01T12:30:00-05:00",
+        "conformsTo": ["https://example.gov/a"],
+        "describedBy": None,
+        "publisher": "Not an organization",
+    },
+    {
+        "identifier": "test-004",
+        "modified": "2023-05-05T08:00:00Z",
+        "temporal": "garbage/also-garbage",
+        "issued": 2020,
+        "license": "https://example.gov/license",
+        "distribution": [],
+    },
+    {},
+]
+
+
+def chained(dataset):
+    dataset = transforms.transform_modified(dataset)
+    dataset = transforms.transform_temporal(dataset)
+    dataset = transforms.transform_spatial(dataset)
+    dataset = transforms.transform_language(dataset)
+    dataset = transforms.transform_access_rights(dataset)
+    dataset = transforms.propagate_license(dataset)
+    dataset = transforms.transform_rights(dataset)
+    dataset = transforms.transform_described_by(dataset)
+    dataset = transforms.transform_sub_organization_of(dataset)
+    dataset = transforms.transform_conforms_to(dataset)
+    dataset = transforms.transform_landing_page(dataset)
+    dataset = transforms.transform_issued(dataset)
+    return dataset
+
+
+def dump(obj):
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+class TestTransformPipeline:
+
+    @pytest.mark.parametrize(
+        "dataset", DATASETS, ids=lambda d: d.get("identifier", "empty")
+    )
+    def test_transform_dataset_matches_chained_transforms(self, dataset):
+        assert dump(transforms.transform_dataset(dataset)) == dump(
+            chained(dataset)
+        )
+
+    @pytest.mark.parametrize(
+        "dataset", DATASETS, ids=lambda d: d.get("identifier", "empty")
+    )
+    def test_transform_dataset_does_not_modify_input(self, dataset):
+        original = copy.deepcopy(dataset)
+        transforms.transform_dataset(dataset)
+        assert dataset == original
+
+    def test_in_place_returns_same_object(self):
+        dataset = copy.deepcopy(DATASETS[0])
+        result = transforms.transform_spatial(dataset, in_place=True)
+        assert result is dataset
+        assert result["spatial"][0]["prefLabel"] == "United States"
+
+    def test_convert_dcat_catalog_fused_output_is_identical(self):
+        catalog = {
+            "@context": "https://project-open-data.cio.gov/v1.1/schema",
+            "describedBy": "https://project-open-data.cio.gov/v1.1/schema",
+            "modified": "2024-01-15T10:00:00",
+            "dataset": copy.deepcopy(DATASETS) + [
+                {"identifier": "bad", "title": "Bad",
+                 "license": "x", "distribution": 5},
+            ],
+        }
+        original = copy.deepcopy(catalog)
+
+        chained_catalog, chained_errors = (
+            dcat_converter.convert_dcat_catalog(catalog)
+        )
+        fused_catalog, fused_errors = dcat_converter.convert_dcat_catalog(
+            catalog, fused=True
+        )
+
+        assert dump(fused_catalog) == dump(chained_catalog)
+        assert fused_errors == chained_errors
+        assert [e["identifier"] for e in fused_errors] == ["bad"]
+        assert catalog == original
+
+    def test_convert_dcat_catalog_with_workers_keeps_order(self):
+        datasets = copy.deepcopy(DATASETS) * 3
+        datasets.insert(
+            4, {"identifier": "bad", "title": "Bad",
+                "license": "x", "distribution": 5}
+        )
+        catalog = {"dataset": datasets}
+
+        fused_catalog, fused_errors = dcat_converter.convert_dcat_catalog(
+            catalog, fused=True
+        )
+        parallel_catalog, parallel_errors = (
+            dcat_converter.convert_dcat_catalog(catalog, workers=2)
+        )
+
+        assert dump(parallel_catalog) == dump(fused_catalog)
+        assert parallel_errors == fused_errors
+        assert [e["identifier"] for e in parallel_errors] == ["bad"]
@@ -90,6 +90,31 @@ class TestDCATv3Transforms:
         result = transforms.transform_language(dataset)
         assert result["language"] == ["en", "es"]
 
+    @pytest.mark.parametrize("tag, code", [
+        ("en-US", "en"),
+        ("English", "en"),
+        ("Spanish", "es"),
+        ("spa", "es"),
+        ("zh-Hant-TW", "zh"),
+        ("not a language", None),
+        ("", None),
+    ])
+    def test_transform_language_codes(self, tag, code):
+        dataset = {"language": [tag], "distribution": [{"language": [tag]}]}
+        result = transforms.transform_language(dataset)
+        expected = [code] if code else []
+        assert result["language"] == expected
+        assert result["distribution"][0]["language"] == expected
+
+    def test_transform_language_caches_codes(self):
+        transforms._language_code.cache_clear()
+        transforms.prewarm_language_cache(["en-US"])
+
+        transforms.transform_language({"language": ["en-US", "en-US", 5]})
+
+        info = transforms._language_code.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
     def test_transform_access_rights(self):
         dataset = {"accessLevel": "public"}
         result = transforms.transform_access_rights(dataset)
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from ckanext.datagov_inventory.dcat import validator
@@ -189,6 +191,38 @@ class TestV3ValidationTracking:
         assert invalid == 1
         assert len(errors) == 1
 
+    def test_validate_v3_0_catalog_caps_errors_per_dataset(self):
+        dataset = {
+            "title": "Broken", "description": "", "keyword": list(range(20))
+        }
+
+        errors = validator.validate_v3_0_catalog(
+            {"dataset": [dataset]}, max_errors=3
+        )
+
+        assert errors[0]["errors"] == [
+            "keyword[0]: expected type 'string'",
+            "keyword[1]: expected type 'string'",
+            "keyword[2]: expected type 'string'",
+            validator.TRUNCATED_ERRORS_MESSAGE.format(3),
+        ]
+        all_errors = validator.get_validator(
+            validator.V3_0_DATASET_SCHEMA_ID
+        ).iter_errors(dataset)
+        assert len(validator.validate_v3_0_catalog(
+            {"dataset": [dataset]}, max_errors=None
+        )[0]["errors"]) == len(list(all_errors)) > 20
+
+    def test_validate_datasets_caps_error_count(self, invalid_v3_0_catalog):
+        datasets = [
+            {"title": "Broken", "description": "", "keyword": [1, 2, 3, 4]},
+            invalid_v3_0_catalog["dataset"][1],
+        ]
+
+        assert validator.validate_datasets(
+            validator.V3_0_DATASET_SCHEMA_ID, None, datasets, max_errors=2
+        ) == (1, 1, 2)
+
 
 class TestPackage2PodErrorTracking:
 
@@ -362,6 +396,114 @@ class TestErrorLogCapture:
         assert "Line 3" in log_output
 
 
+class TestParallelValidation:
+
+    @pytest.fixture
+    def mixed_v1_1_catalog(self):
+        valid = {
+            "description": "A valid dataset",
+            "modified": "2024-01-15",
+            "keyword": ["valid", "test"],
+            "accessLevel": "public",
+            "publisher": {"name": "Test Agency"},
+            "contactPoint": {
+                "fn": "Jane Doe",
+                "hasEmail": "mailto:jane@example.gov"
+            }
+        }
+        datasets = []
+        for i in range(12):
+            if i % 3 == 0:
+                datasets.append({"title": f"Invalid {i}"})
+            else:
+                datasets.append(
+                    dict(valid, title=f"Valid {i}", identifier=f"valid-{i}")
+                )
+        return {"dataset": datasets}
+
+    def test_parallel_v1_1_validation_matches_serial(
+        self, mixed_v1_1_catalog
+    ):
+        serial = validator.validate_v1_1_catalog_with_counts(
+            mixed_v1_1_catalog
+        )
+        parallel = validator.validate_v1_1_catalog_with_counts(
+            mixed_v1_1_catalog, workers=2
+        )
+
+        assert parallel == serial
+        assert serial[:2] == (8, 4)
+        assert [e["identifier"] for e in parallel[2]] == [
+            "index 0", "index 3", "index 6", "index 9"
+        ]
+
+    def test_parallel_validate_datasets_matches_serial(
+        self, mixed_v1_1_catalog
+    ):
+        datasets = mixed_v1_1_catalog["dataset"]
+        registry = validator.get_schema_registry(
+            validator.V1_1_DEFINITIONS_DIR
+        )
+
+        assert validator.validate_datasets(
+            validator.V1_1_DATASET_SCHEMA_ID, registry, datasets, workers=2
+        ) == validator.validate_datasets(
+            validator.V1_1_DATASET_SCHEMA_ID, registry, datasets
+        )
+
+
+class TestSchemaCache:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        validator.clear_schema_cache()
+        yield
+        validator.clear_schema_cache()
+
+    def test_get_schema_registry_is_cached(self, monkeypatch):
+        calls = []
+        load = validator.load_schema_registry
+
+        def counting_load(definitions_dir):
+            calls.append(definitions_dir)
+            return load(definitions_dir)
+
+        monkeypatch.setattr(validator, "load_schema_registry", counting_load)
+
+        first = validator.get_schema_registry(validator.V3_0_DEFINITIONS_DIR)
+        second = validator.get_schema_registry(
+            validator.V3_0_DEFINITIONS_DIR
+        )
+
+        assert first is second
+        assert calls == [validator.V3_0_DEFINITIONS_DIR]
+
+    def test_get_validator_is_cached_per_schema_id(self):
+        v1_1 = validator.get_validator(validator.V1_1_DATASET_SCHEMA_ID)
+        v3_0 = validator.get_validator(validator.V3_0_DATASET_SCHEMA_ID)
+
+        assert v1_1 is validator.get_validator(
+            validator.V1_1_DATASET_SCHEMA_ID
+        )
+        assert v3_0 is validator.get_validator(
+            validator.V3_0_DATASET_SCHEMA_ID
+        )
+        assert v1_1 is not v3_0
+
+    def test_schema_change_invalidates_cache(self, tmp_path):
+        for schema_file in validator.V1_1_DEFINITIONS_DIR.glob("*.json"):
+            (tmp_path / schema_file.name).write_bytes(
+                schema_file.read_bytes()
+            )
+        first = validator.get_schema_registry(tmp_path)
+
+        catalog = tmp_path / "catalog.json"
+        mtime = catalog.stat().st_mtime_ns + 1_000_000_000
+        os.utime(catalog, ns=(mtime, mtime))
+
+        assert validator.get_schema_registry(tmp_path) is not first
+
+
 class TestWriteZip:
 
     def test_write_zip_creates_zip_with_data_json(self):
@@ -463,6 +605,59 @@ class TestWriteZip:
         assert parsed["dataset"] == []
 
 
+class TestStreamingZip:
+
+    def test_iter_catalog_json_matches_json_dumps(self):
+        import json
+
+        data = {
+            "conformsTo": "https://resources.data.gov/dcat-us/3.0.0",
+            "dataset": [
+                {"title": "Données", "keyword": ["a", "b"]},
+                {"title": "Line\nbreak", "distribution": []},
+            ],
+            "publisher": {"name": "Agency"},
+        }
+
+        assert "".join(validator.iter_catalog_json(data)) == json.dumps(
+            data, indent=2, ensure_ascii=False
+        )
+
+    def test_iter_zip_yields_chunks_of_same_archive(self):
+        import hashlib
+        import io
+        import json
+        import zipfile
+
+        data = {"dataset": [
+            {"identifier": hashlib.sha256(str(i).encode()).hexdigest()}
+            for i in range(5000)
+        ]}
+
+        chunks = list(validator.iter_zip(
+            data, error_log="warning", errors_json=[{"e": 1}],
+            chunk_size=1024
+        ))
+
+        assert len(chunks) > 1
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zip_file:
+            assert zip_file.read("data.json").decode("utf-8") == (
+                json.dumps(data, indent=2, ensure_ascii=False)
+            )
+            assert json.loads(zip_file.read("errors.json")) == [{"e": 1}]
+            assert zip_file.read("errorlog.txt") == b"warning"
+
+    def test_iter_zip_allows_data_json_over_2_gib(self):
+        import io
+        import zipfile
+
+        archive = b"".join(validator.iter_zip({"dataset": []}))
+
+        with zipfile.ZipFile(io.BytesIO(archive)) as zip_file:
+            info = zip_file.getinfo("data.json")
+        assert info.extract_version >= zipfile.ZIP64_VERSION
+
+
 class TestEndToEndErrorHandling:
 
     def test_full_export_flow_with_mixed_valid_and_invalid_datasets(self):
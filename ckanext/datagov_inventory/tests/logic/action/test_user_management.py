@@ -1,5 +1,7 @@
 """Tests for user management actions."""
 
+import io
+
 import pytest
 from pytest import raises as assert_raises
 
@@ -8,6 +10,10 @@ import ckan.model as model
 from ckan.tests.helpers import FunctionalTestBase
 import ckan.tests.factories as factories
 import ckan.tests.helpers as helpers
+from werkzeug.datastructures import FileStorage
+
+from ckanext.datagov_inventory import action
+from ckanext.datagov_inventory import plugin as plugin_module
 
 is_allowed = True
 is_denied = False
@@ -130,6 +136,124 @@ class TestCreateInventoryUser(FunctionalTestBase):
         assert 'email' in exc_info.value.error_dict
 
 
+@pytest.mark.usefixtures("clean_db")
+@pytest.mark.usefixtures("with_request_context")
+class TestCreateInventoryUsersBulk(FunctionalTestBase):
+
+    def setup_method(self):
+        super(TestCreateInventoryUsersBulk, self).setup_class()
+        self.sysadmin = factories.Sysadmin()
+        self.regular_user = factories.User()
+
+    def test_create_users_bulk(self, monkeypatch):
+        monkeypatch.setattr(action, 'CREATE_USERS_BATCH_SIZE', 2)
+        factories.User(name='taken_user')
+        users = [
+            {'name': 'bulk_user1', 'email': 'bulk1@gsa.gov'},
+            {'name': 'bulk_user2', 'email': 'invalid-email'},
+            {'name': 'taken_user', 'email': 'bulk3@gsa.gov'},
+            {'name': 'bulk_user4', 'email': 'bulk4@gsa.gov'},
+            {'name': 'bulk_user4', 'email': 'bulk5@gsa.gov'},
+            {'name': 'bulk_user6', 'email': 'BULK1@gsa.gov'},
+            {'name': 'bulk_user7', 'email': 'bulk7@gsa.gov'},
+        ]
+
+        result = helpers.call_action(
+            'create_inventory_users_bulk',
+            context={'user': self.sysadmin['name']},
+            users=users
+        )
+
+        assert result['created'] == 3
+        assert result['failed'] == 4
+        results = result['results']
+        assert [r['row'] for r in results] == list(range(1, 8))
+        assert [r['success'] for r in results] == [
+            True, False, False, True, False, False, True
+        ]
+        assert 'email' in results[1]['errors']
+        assert 'name' in results[2]['errors']
+        assert 'name' in results[4]['errors']
+        assert 'email' in results[5]['errors']
+        for r in results:
+            assert 'password' not in r
+            if r['success']:
+                user_obj = model.User.get(r['id'])
+                assert user_obj.name == r['name']
+                assert user_obj.password
+        assert model.User.get('bulk_user2') is None
+
+    def test_create_users_bulk_retries_failed_batch_per_user(
+        self, monkeypatch
+    ):
+        # a name taken between validation and creation fails the batch
+        validate = action._user_schema_errors
+        monkeypatch.setattr(
+            action, '_user_schema_errors',
+            lambda context, user_dict: (
+                {} if user_dict['name'] == 'raced_user'
+                else validate(context, user_dict)
+            )
+        )
+        factories.User(name='raced_user')
+
+        result = helpers.call_action(
+            'create_inventory_users_bulk',
+            context={'user': self.sysadmin['name']},
+            users=[
+                {'name': 'before_race', 'email': 'before@gsa.gov'},
+                {'name': 'raced_user', 'email': 'raced@gsa.gov'},
+                {'name': 'after_race', 'email': 'after@gsa.gov'},
+            ]
+        )
+
+        assert [r['success'] for r in result['results']] == [
+            True, False, True
+        ]
+        assert 'name' in result['results'][1]['errors']
+        assert model.User.get('before_race') is not None
+        assert model.User.get('after_race') is not None
+
+    def test_create_users_bulk_requires_users(self):
+        with assert_raises(logic.ValidationError) as exc_info:
+            helpers.call_action(
+                'create_inventory_users_bulk',
+                context={'user': self.sysadmin['name']},
+                users=[]
+            )
+
+        assert 'users' in exc_info.value.error_dict
+
+    def test_create_users_bulk_requires_sysadmin(self):
+        context = {
+            'user': self.regular_user['name'],
+            'ignore_auth': False
+        }
+
+        with assert_raises(logic.NotAuthorized):
+            helpers.call_action(
+                'create_inventory_users_bulk',
+                context=context,
+                users=[{'name': 'bulk_user', 'email': 'bulk@gsa.gov'}]
+            )
+
+    def test_parse_users_csv(self):
+        upload = FileStorage(
+            io.BytesIO(
+                b'\xef\xbb\xbfName,Email\r\n'
+                b'first_user,first@gsa.gov\r\n'
+                b',\r\n'
+                b'second_user\r\n'
+            ),
+            filename='users.csv'
+        )
+
+        assert plugin_module._parse_users_csv(upload) == [
+            {'name': 'first_user', 'email': 'first@gsa.gov'},
+            {'name': 'second_user', 'email': ''},
+        ]
+
+
 @pytest.mark.usefixtures("clean_db")
 @pytest.mark.usefixtures("with_request_context")
 class TestReactivateUser(FunctionalTestBase):
@@ -212,3 +336,118 @@ class TestReactivateUser(FunctionalTestBase):
         assert result['state'] == 'active'
         user_obj = model.User.get(deleted_user['name'])
         assert user_obj.state == 'active'
+
+
+@pytest.mark.usefixtures("clean_db")
+@pytest.mark.usefixtures("with_request_context")
+class TestBulkUserState(FunctionalTestBase):
+
+    def setup_method(self):
+        super(TestBulkUserState, self).setup_class()
+        self.sysadmin = factories.Sysadmin()
+        self.regular_user = factories.User()
+
+    def test_reactivate_users_bulk(self):
+        deleted_users = [factories.User(state='deleted') for i in range(3)]
+        active_user = factories.User()
+
+        result = helpers.call_action(
+            'reactivate_users_bulk',
+            context={'user': self.sysadmin['name']},
+            ids=[
+                deleted_users[0]['id'],
+                deleted_users[1]['name'],
+                active_user['id'],
+                'nonexistent-user-id',
+            ]
+        )
+
+        assert result['updated'] == 2
+        assert sorted(user['id'] for user in result['users']) == sorted(
+            [deleted_users[0]['id'], deleted_users[1]['id']]
+        )
+        assert result['not_updated'] == [
+            active_user['id'], 'nonexistent-user-id'
+        ]
+        assert model.User.get(deleted_users[0]['id']).state == 'active'
+        assert model.User.get(deleted_users[1]['id']).state == 'active'
+        assert model.User.get(deleted_users[2]['id']).state == 'deleted'
+
+    def test_deactivate_users_bulk_removes_memberships(self):
+        users = [factories.User() for i in range(2)]
+        organization = factories.Organization(users=[
+            {'name': users[0]['name'], 'capacity': 'editor'}
+        ])
+
+        result = helpers.call_action(
+            'deactivate_users_bulk',
+            context={'user': self.sysadmin['name']},
+            ids=','.join(user['name'] for user in users)
+        )
+
+        assert result['updated'] == 2
+        assert result['not_updated'] == []
+        for user in users:
+            assert model.User.get(user['id']).state == 'deleted'
+        assert model.Session.query(model.Member).filter(
+            model.Member.table_id == users[0]['id'],
+            model.Member.group_id == organization['id'],
+            model.Member.state == 'active',
+        ).count() == 0
+
+    @pytest.mark.ckan_config('ckan.auth.allow_dataset_collaborators', True)
+    def test_deactivate_users_bulk_removes_collaborations(self):
+        user = factories.User()
+        dataset = factories.Dataset(owner_org=factories.Organization()['id'])
+        helpers.call_action(
+            'package_collaborator_create',
+            id=dataset['id'], user_id=user['id'], capacity='editor'
+        )
+
+        helpers.call_action(
+            'deactivate_users_bulk',
+            context={'user': self.sysadmin['name']},
+            ids=[user['id']]
+        )
+
+        assert model.Session.query(model.PackageMember).filter(
+            model.PackageMember.user_id == user['id']
+        ).count() == 0
+
+    def test_deactivate_users_bulk_refuses_current_user(self):
+        sysadmin = factories.Sysadmin()
+        user = factories.User()
+
+        with assert_raises(logic.ValidationError):
+            helpers.call_action(
+                'deactivate_users_bulk',
+                context={'user': sysadmin['name']},
+                ids=[user['id'], sysadmin['id']]
+            )
+
+        assert model.User.get(user['id']).state == 'active'
+
+    def test_bulk_user_state_requires_ids(self):
+        with assert_raises(logic.ValidationError) as exc_info:
+            helpers.call_action(
+                'reactivate_users_bulk',
+                context={'user': self.sysadmin['name']},
+                ids=[]
+            )
+
+        assert 'ids' in exc_info.value.error_dict
+
+    def test_bulk_user_state_requires_sysadmin(self):
+        deleted_user = factories.User(state='deleted')
+        context = {
+            'user': self.regular_user['name'],
+            'ignore_auth': False
+        }
+
+        for action_name in ('reactivate_users_bulk', 'deactivate_users_bulk'):
+            with assert_raises(logic.NotAuthorized):
+                helpers.call_action(
+                    action_name,
+                    context=dict(context),
+                    ids=[deleted_user['id']]
+                )
@@ -1,5 +1,10 @@
 """Tests for datagov_inventory plugin.py."""
 
+import csv
+import io
+import json
+from unittest import mock
+
 from pytest import raises as assert_raises
 import pytest
 
@@ -11,6 +16,8 @@ import ckan.tests.factories as factories
 import ckan.tests.helpers as helpers
 import ckanext.datastore.tests.helpers as datastore_helpers
 
+from ckanext.datagov_inventory import action as action_module
+from ckanext.datagov_inventory import plugin as plugin_module
 from ckanext.datagov_inventory.plugin import inventory_package_show
 
 import logging
@@ -24,6 +31,7 @@ is_denied = False
 
 @pytest.mark.usefixtures(u"clean_index")
 @pytest.mark.usefixtures(u"clean_db")
+@pytest.mark.usefixtures(u"clean_redis")
 @pytest.mark.usefixtures("with_request_context")
 class TestDatagovInventoryAuth(FunctionalTestBase):
 
@@ -31,6 +39,7 @@ class TestDatagovInventoryAuth(FunctionalTestBase):
         super(TestDatagovInventoryAuth, self).setup_class()
         # Start with a clean database and index for each test
         self.clean_datastore()
+        plugin_module._package_private_cache.clear()
 
     def create_datasets(self):
         self.sysadmin = factories.Sysadmin(name='admin')
@@ -314,6 +323,36 @@ class TestDatagovInventoryAuth(FunctionalTestBase):
             'anonymous': is_allowed
         }, object_id=dataset['resource_id'])
 
+    def test_auth_resource_show_anonymous_follows_private_changes(self):
+        self.setup_test_orgs_users()
+        dataset = self.factory_dataset(owner_org='gsa', private=False)
+        context = {'model': model, 'ignore_auth': False, 'user': ''}
+
+        assert helpers.call_auth(
+            'resource_show', context=dict(context),
+            id=dataset['resource_id']
+        )
+        # cached now: no package is loaded for anonymous users
+        with mock.patch.object(
+            model.Session, 'query', side_effect=AssertionError
+        ), mock.patch.object(
+            plugin_module, '_get_package', side_effect=AssertionError
+        ):
+            assert helpers.call_auth(
+                'resource_show', context=dict(context),
+                id=dataset['resource_id']
+            )
+
+        helpers.call_action(
+            'package_patch', id=dataset['package_id'], private=True
+        )
+
+        with assert_raises(logic.NotAuthorized):
+            helpers.call_auth(
+                'resource_show', context=dict(context),
+                id=dataset['resource_id']
+            )
+
     def test_auth_tag_list(self):
         # Create test users and test data
         self.setup_test_orgs_users()
@@ -443,6 +482,71 @@ class TestDatagovInventoryAuth(FunctionalTestBase):
             assert inventory_package_show(context,
                                           data_dict) == {'success': False}
 
+    def test_package_show_anonymous_fast_path(self):
+        self.app = self._get_test_app()
+
+        self.create_datasets()
+        context = {'user': '', 'model': model}
+        data_dict = {'id': self.dataset_public['id']}
+        download_url = '/dataset/'+'0'*36+'/resource/'+'0'*36+'/download/1'
+
+        with mock.patch.object(
+            plugin_module, '_get_user', side_effect=AssertionError
+        ), mock.patch.object(
+            plugin_module, '_get_package', side_effect=AssertionError
+        ):
+            with self.app.flask_app.test_request_context('/dataset/x'):
+                # not a download, so no package lookup at all
+                with mock.patch.object(
+                    model.Session, 'query', side_effect=AssertionError
+                ):
+                    assert inventory_package_show(
+                        context, data_dict) == {'success': False}
+
+            with self.app.flask_app.test_request_context(download_url):
+                assert inventory_package_show(
+                    context, data_dict) == {'success': True}
+                # the private flag is cached now
+                with mock.patch.object(
+                    model.Session, 'query', side_effect=AssertionError
+                ):
+                    assert inventory_package_show(
+                        context, data_dict) == {'success': True}
+                assert inventory_package_show(
+                    context, {'id': 'no-such-dataset'}
+                ) == {'success': False}
+
+    def test_resource_show_auth_lookups_are_memoized_per_request(self):
+        self.setup_test_orgs_users()
+        dataset = self.factory_dataset(owner_org='gsa', private=True)
+        lookups = []
+        by_name = model.User.by_name
+
+        def counting_by_name(name, *args, **kwargs):
+            lookups.append(name)
+            return by_name(name, *args, **kwargs)
+
+        self.app = self._get_test_app()
+        with mock.patch.object(
+            plugin_module.User, 'by_name', side_effect=counting_by_name
+        ):
+            with self.app.flask_app.test_request_context('/'):
+                for _ in range(5):
+                    assert helpers.call_auth(
+                        'resource_show',
+                        context={'model': model, 'user': 'gsa_member'},
+                        id=dataset['resource_id']
+                    )
+            with self.app.flask_app.test_request_context('/'):
+                with assert_raises(logic.NotAuthorized):
+                    helpers.call_auth(
+                        'resource_show',
+                        context={'model': model, 'user': 'doi_member'},
+                        id=dataset['resource_id']
+                    )
+
+        assert lookups == ['gsa_member', 'doi_member']
+
     def test_auth_user_org_roles(self):
         self.setup_test_orgs_users()
 
@@ -485,3 +589,191 @@ class TestDatagovInventoryAuth(FunctionalTestBase):
             users['no_org_user'])
         assert result.index(users['no_org_user']) < result.index(
             users['deleted_user'])
+
+    def test_user_org_roles_section_paging_and_sort(self):
+        self.setup_test_orgs_users()
+        factories.User(name='no_org_user')
+
+        context = {
+            'model': model,
+            'ignore_auth': False,
+            'user': self.test_users['sysadmin']['name']
+        }
+
+        def names(**data_dict):
+            return [
+                user['name'] for user in helpers.call_action(
+                    'user_org_roles', context=dict(context), **data_dict
+                )
+            ]
+
+        with_orgs = names(section='users-with-organizations')
+        assert with_orgs == sorted(with_orgs)
+        assert {'gsa_admin', 'doi_member'} <= set(with_orgs)
+        assert 'no_org_user' not in with_orgs
+        assert 'sysadmin' not in with_orgs
+
+        assert names(
+            section='users-with-organizations', sort='name desc'
+        ) == with_orgs[::-1]
+        assert names(
+            section='users-with-organizations', limit=2, offset=1
+        ) == with_orgs[1:3]
+        assert names(section='users-with-organizations', q='DOI_') == [
+            name for name in with_orgs if name.startswith('doi_')
+        ]
+        assert names(section='users-without-organizations') == [
+            'no_org_user'
+        ]
+
+        with assert_raises(logic.ValidationError):
+            names(sort='organizations desc')
+        with assert_raises(logic.ValidationError):
+            names(section='nobody')
+        with assert_raises(logic.ValidationError):
+            names(limit=-1)
+
+    def test_user_org_roles_counts(self):
+        self.setup_test_orgs_users()
+        factories.User(name='no_org_user')
+        factories.User(name='deleted_user', state='deleted')
+
+        context = {
+            'model': model,
+            'ignore_auth': False,
+            'user': self.test_users['sysadmin']['name']
+        }
+        with_orgs = helpers.call_action(
+            'user_org_roles', context=context,
+            section='users-with-organizations'
+        )
+
+        counts = action_module.user_org_roles_counts()
+
+        assert counts['users-with-organizations'] == {
+            'users': len(with_orgs),
+            'rows': sum(len(user['organizations']) for user in with_orgs),
+        }
+        assert counts['users-without-organizations']['users'] == 1
+        assert counts['deleted-users'] == {'users': 1, 'rows': 1}
+        assert action_module.user_org_roles_counts(q='no_org')[
+            'users-without-organizations'
+        ] == {'users': 1, 'rows': 1}
+        assert action_module.user_org_roles_counts(q='no_org')[
+            'users-with-organizations'
+        ] == {'users': 0, 'rows': 0}
+
+    def test_user_org_roles_is_cached_until_memberships_change(self):
+        self.setup_test_orgs_users()
+        user = factories.User(name='no_org_user')
+
+        context = {
+            'model': model,
+            'ignore_auth': False,
+            'user': self.test_users['sysadmin']['name']
+        }
+
+        def user_orgs():
+            result = helpers.call_action(
+                'user_org_roles', context=dict(context), q='no_org_user'
+            )
+            return [org['name'] for org in result[0]['organizations']]
+
+        assert user_orgs() == []
+        with mock.patch.object(
+            action_module, '_user_org_roles',
+            side_effect=AssertionError('not cached')
+        ):
+            assert user_orgs() == []
+            assert action_module.user_org_roles_counts(q='no_org_user')[
+                'users-without-organizations'
+            ] == {'users': 1, 'rows': 1}
+
+        helpers.call_action(
+            'organization_member_create',
+            id='gsa',
+            username=user['name'],
+            role='member'
+        )
+
+        assert user_orgs() == ['gsa']
+        assert action_module.user_org_roles_counts(q='no_org_user')[
+            'users-with-organizations'
+        ] == {'users': 1, 'rows': 1}
+
+    def test_user_org_roles_page_empty_rows_span_all_columns(self):
+        factories.Sysadmin(name='sysadmin')
+        token = factories.APIToken(user='sysadmin')['token']
+        self.app = self._get_test_app()
+
+        response = self.app.get(
+            '/user/user-org-roles', headers={'Authorization': token}
+        )
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        deleted_users = html[html.index('<section id="deleted-users"'):]
+        # user, email and last active, plus the actions and select columns
+        assert '<td colspan="5">' in deleted_users.split('</table>')[0]
+
+    def test_user_org_roles_export(self):
+        self.setup_test_orgs_users()
+        factories.User(name='no_org_user', email='no_org@example.com')
+        token = factories.APIToken(user='sysadmin')['token']
+        self.app = self._get_test_app()
+
+        response = self.app.get(
+            '/user/user-org-roles.csv?q=gsa_',
+            headers={'Authorization': token}
+        )
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/csv')
+        assert 'user-org-roles.csv' in response.headers['Content-Disposition']
+        rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+        assert rows[0] == [
+            'Section', 'User', 'Email', 'Last Active', 'Sysadmin',
+            'Organization', 'Role'
+        ]
+        assert [(row[1], row[5], row[6]) for row in rows[1:]] == [
+            ('gsa_admin', 'gsa', 'admin'),
+            ('gsa_editor', 'gsa', 'editor'),
+            ('gsa_member', 'gsa', 'member'),
+        ]
+
+        response = self.app.get(
+            '/user/user-org-roles.jsonl?sort=name+desc',
+            headers={'Authorization': token}
+        )
+        assert response.status_code == 200
+        records = [
+            json.loads(line)
+            for line in response.get_data(as_text=True).splitlines()
+        ]
+        no_org_user = [r for r in records if r['user'] == 'no_org_user'][0]
+        assert no_org_user == {
+            'section': 'users-without-organizations',
+            'user': 'no_org_user',
+            'email': 'no_org@example.com',
+            'last_active': no_org_user['last_active'],
+            'sysadmin': 'no',
+            'organization': '',
+            'role': '',
+        }
+        names = [
+            r['user'] for r in records
+            if r['section'] == 'users-with-organizations'
+        ]
+        assert names == sorted(names, reverse=True)
+
+        response = self.app.get(
+            '/user/user-org-roles.csv?sort=role+asc',
+            headers={'Authorization': token}
+        )
+        assert response.status_code == 400
+
+        response = self.app.get(
+            '/user/user-org-roles.csv',
+            headers={
+                'Authorization': factories.APIToken(user='gsa_admin')['token']
+            }
+        )
+        assert response.status_code == 403
@@ -0,0 +1,415 @@
+import pytest
+
+from ckanext.datagov_inventory import jobs
+from ckanext.datagov_inventory import plugin as plugin_module
+from ckanext.datagov_inventory.dcat import validator
+
+
+class FakeJob(object):
+
+    def __init__(self, job_id='job-id', meta=None, status='queued'):
+        self.id = job_id
+        self.meta = meta or {}
+        self.status = status
+        self.saved_meta = []
+
+    def save_meta(self):
+        self.saved_meta.append(dict(self.meta))
+
+    def get_status(self):
+        return self.status
+
+
+class FakeRedis(object):
+
+    def __init__(self):
+        self.values = {}
+        self.expiry = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        self.values[key] = value
+        if ex is not None:
+            self.expiry[key] = ex
+        return True
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def append(self, key, value):
+        self.values[key] = self.values.get(key, b'') + value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def rename(self, src, dst):
+        self.values[dst] = self.values.pop(src)
+
+    def expire(self, key, ttl):
+        self.expiry[key] = ttl
+
+    def strlen(self, key):
+        return len(self.values.get(key, b''))
+
+    def getrange(self, key, start, end):
+        return self.values.get(key, b'')[start:end + 1]
+
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline(object):
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.commands = []
+
+    def watch(self, key):
+        pass
+
+    def multi(self):
+        pass
+
+    def get(self, key):
+        return self.redis.get(key)
+
+    def set(self, key, value, ex=None):
+        self.commands.append((self.redis.set, (key, value, False, ex)))
+
+    def delete(self, key):
+        self.commands.append((self.redis.delete, (key,)))
+
+    def execute(self):
+        for command, args in self.commands:
+            command(*args)
+        self.commands = []
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(jobs.redis, 'connect_to_redis', lambda: fake)
+    return fake
+
+
+def test_export_dcat_v3_stores_zip_for_job(monkeypatch, fake_redis):
+    # the download view looks the zip up by job id, so it must be stored so.
+    job = FakeJob(meta={'org_id': 'org-id'})
+    catalog = {'dataset': []}
+    monkeypatch.setattr(jobs, 'get_current_job', lambda: job)
+    monkeypatch.setattr(jobs, 'dcat_v3_dataset_cache_ttl', lambda: 0)
+    monkeypatch.setattr(
+        jobs, 'build_v1_1_catalog', lambda org_id, job: catalog
+    )
+    monkeypatch.setattr(
+        validator, 'iter_export_with_error_tracking',
+        lambda v1_1_catalog, workers: iter([b'zip-', b'bytes'])
+    )
+    monkeypatch.setattr(jobs, 'EXPORT_CHUNK_SIZE', 4)
+    jobs.claim_dcat_v3_export('org-id', 'job-id')
+
+    jobs.export_dcat_v3('org-id')
+
+    key = jobs.DCAT_V3_EXPORT_KEY.format('job-id')
+    # the organization's export claim is released
+    assert fake_redis.values == {key: b'zip-bytes'}
+    assert fake_redis.expiry[key] == jobs.DCAT_V3_EXPORT_TTL
+    assert job.meta['stage'] == 'finished'
+    assert jobs.get_dcat_v3_export_size('job-id') == 9
+    assert list(jobs.iter_dcat_v3_export('job-id', chunk_size=4)) == [
+        b'zip-', b'byte', b's'
+    ]
+
+
+def test_build_v1_1_catalog_reports_progress(monkeypatch):
+    job = FakeJob()
+    packages = [{'id': 'pkg-1'}, {'id': 'pkg-2'}, {'id': 'pkg-3'}]
+    monkeypatch.setattr(
+        jobs, 'get_packages', lambda owner_org, with_private: packages
+    )
+    monkeypatch.setattr(
+        jobs, 'get_export_map_json', lambda: {'catalog_headers': {}}
+    )
+    monkeypatch.setattr(
+        jobs.Package2Pod, 'convert_package',
+        staticmethod(lambda pkg, export_map, redaction_enabled: (
+            None if pkg['id'] == 'pkg-2' else {'identifier': pkg['id']}
+        ))
+    )
+
+    catalog = jobs.build_v1_1_catalog('org-id', job)
+
+    assert [d['identifier'] for d in catalog['dataset']] == ['pkg-1', 'pkg-3']
+    assert job.saved_meta[-1] == {
+        'stage': 'collecting', 'processed': 3, 'total': 3
+    }
+
+
+@pytest.fixture
+def org_packages(monkeypatch):
+    packages = [
+        {
+            'id': 'pkg-{}'.format(i),
+            'metadata_modified': '2024-01-0{}T00:00:00'.format(i),
+            'title': 'Dataset {}'.format(i),
+        }
+        for i in range(1, 5)
+    ]
+    converted = []
+
+    def convert_package(pkg, export_map, redaction_enabled):
+        converted.append(pkg['id'])
+        if pkg['id'] == 'pkg-4':
+            return None
+        entry = {
+            'title': pkg['title'],
+            'identifier': pkg['id'],
+            'modified': pkg['metadata_modified'],
+            'license': 'https://example.gov/license',
+        }
+        # a dataset the transforms choke on
+        entry['distribution'] = 5 if pkg['id'] == 'pkg-2' else [
+            {'accessURL': 'https://example.gov/{}'.format(pkg['id'])}
+        ]
+        return entry
+
+    monkeypatch.setattr(
+        jobs, 'get_packages', lambda owner_org, with_private: packages
+    )
+    monkeypatch.setattr(jobs, 'get_export_map_json', lambda: {
+        'catalog_headers': {
+            'conformsTo': 'https://project-open-data.cio.gov/v1.1/schema',
+        }
+    })
+    monkeypatch.setattr(
+        jobs.Package2Pod, 'convert_package', staticmethod(convert_package)
+    )
+    return packages, converted
+
+
+def _zip_contents(zip_binary):
+    import io
+    import zipfile
+
+    with zipfile.ZipFile(io.BytesIO(zip_binary)) as zip_file:
+        return {name: zip_file.read(name) for name in zip_file.namelist()}
+
+
+def test_build_v3_0_export_matches_uncached_export(fake_redis, org_packages):
+    cached = b''.join(validator.iter_export_zip(
+        *jobs.build_v3_0_export('org-id')
+    ))
+    uncached = validator.process_export_with_error_tracking(
+        jobs.build_v1_1_catalog('org-id')
+    )
+
+    contents = _zip_contents(cached)
+    assert contents == _zip_contents(uncached)
+    assert set(contents) == {'data.json', 'errors.json'}
+
+
+def test_build_v3_0_export_only_converts_changed_packages(
+    fake_redis, org_packages
+):
+    packages, converted = org_packages
+    first = jobs.build_v3_0_export('org-id')
+    assert converted == ['pkg-1', 'pkg-2', 'pkg-3', 'pkg-4']
+
+    del converted[:]
+    packages[2]['metadata_modified'] = '2024-02-01T00:00:00'
+    packages[2]['title'] = 'Renamed'
+    second = jobs.build_v3_0_export('org-id')
+
+    assert converted == ['pkg-3']
+    assert [d['title'] for d in second[0]['dataset']] == [
+        'Dataset 1', 'Renamed'
+    ]
+    assert second[1] == first[1]
+    assert [e['identifier'] for e in second[1]] == ['pkg-2']
+
+
+def test_build_v3_0_export_reconverts_after_organization_changes(
+    fake_redis, org_packages
+):
+    # renaming an organization doesn't bump its packages'
+    # metadata_modified, but their fallback publisher changes
+    packages, converted = org_packages
+    for pkg in packages:
+        pkg['organization'] = {'id': 'org-id', 'title': 'Old Name'}
+    jobs.build_v3_0_export('org-id')
+
+    del converted[:]
+    for pkg in packages:
+        pkg['organization'] = {'id': 'org-id', 'title': 'New Name'}
+    jobs.build_v3_0_export('org-id')
+
+    assert converted == ['pkg-1', 'pkg-2', 'pkg-3', 'pkg-4']
+
+
+def test_dcat_v3_cache_fingerprint_covers_validation_code(monkeypatch):
+    from ckanext.datagov_inventory.dcat import validator as validator_module
+
+    fingerprint = jobs._dcat_v3_cache_fingerprint({})
+    read_bytes = jobs.Path.read_bytes
+
+    def edited(path):
+        data = read_bytes(path)
+        if path == jobs.Path(validator_module.__file__):
+            data += b'# edited'
+        return data
+
+    monkeypatch.setattr(jobs.Path, 'read_bytes', edited)
+
+    assert jobs._dcat_v3_cache_fingerprint({}) != fingerprint
+
+
+def test_build_v3_0_export_with_workers_matches_one_worker(
+    monkeypatch, fake_redis, org_packages
+):
+    single = jobs.build_v3_0_export('org-id')
+    fake_redis.values.clear()
+    monkeypatch.setattr(jobs, 'dcat_v3_export_workers', lambda: 2)
+
+    assert jobs.build_v3_0_export('org-id') == single
+
+
+@pytest.mark.usefixtures('with_request_context')
+def test_generate_dcat_v3_queues_export_job(monkeypatch, fake_redis):
+    # web workers only queue the export, they never build it themselves.
+    queued = []
+
+    def enqueue_job(fn, args, title=None, rq_kwargs=None):
+        queued.append((fn, args, rq_kwargs))
+        return FakeJob(rq_kwargs['job_id'], meta=rq_kwargs['meta'])
+
+    monkeypatch.setattr(
+        plugin_module, '_can_export_dcat_v3', lambda org_id: True
+    )
+    monkeypatch.setattr(plugin_module.toolkit, 'enqueue_job', enqueue_job)
+    monkeypatch.setattr(plugin_module.uuid, 'uuid4', lambda: 'job-id')
+
+    response, status = plugin_module.generate_dcat_v3('org-id')
+
+    assert status == 202
+    assert queued[0][0] is jobs.export_dcat_v3
+    assert queued[0][1] == ['org-id']
+    assert queued[0][2]['meta']['org_id'] == 'org-id'
+    assert queued[0][2]['job_id'] == 'job-id'
+    assert fake_redis.get(
+        jobs.DCAT_V3_EXPORT_JOB_KEY.format('org-id')
+    ) == b'job-id'
+    body = response.get_json()
+    assert body['job_id'] == 'job-id'
+    assert body['status'] == 'queued'
+    assert body['status_url'].endswith('/organization/org-id/dcat-v3/job-id')
+    assert body['download_url'].endswith(
+        '/organization/org-id/dcat-v3/job-id/download'
+    )
+
+
+@pytest.mark.usefixtures('with_request_context')
+@pytest.mark.parametrize('claimed_status, queues', [
+    # retries and double clicks should not queue another full export
+    ('queued', False),
+    ('started', False),
+    # nor should a request racing the one still queueing it
+    (None, False),
+    # a job that died without releasing its claim doesn't block exports
+    ('failed', True),
+])
+def test_generate_dcat_v3_reuses_export_in_progress(
+    monkeypatch, fake_redis, claimed_status, queues
+):
+    queued = []
+    jobs_by_id = {}
+    if claimed_status:
+        jobs_by_id['claimed-job'] = FakeJob(
+            'claimed-job', {'org_id': 'org-id'}, status=claimed_status
+        )
+
+    def job_from_id(job_id):
+        return jobs_by_id[job_id]
+
+    def enqueue_job(fn, args, title=None, rq_kwargs=None):
+        queued.append(rq_kwargs['job_id'])
+        return FakeJob(rq_kwargs['job_id'], meta=rq_kwargs['meta'])
+
+    monkeypatch.setattr(
+        plugin_module, '_can_export_dcat_v3', lambda org_id: True
+    )
+    monkeypatch.setattr(plugin_module, 'job_from_id', job_from_id)
+    monkeypatch.setattr(plugin_module.toolkit, 'enqueue_job', enqueue_job)
+    monkeypatch.setattr(plugin_module.uuid, 'uuid4', lambda: 'new-job')
+    jobs.claim_dcat_v3_export('org-id', 'claimed-job')
+
+    response, status = plugin_module.generate_dcat_v3('org-id')
+
+    assert status == 202
+    job_id = 'new-job' if queues else 'claimed-job'
+    assert queued == (['new-job'] if queues else [])
+    assert response.get_json()['job_id'] == job_id
+    assert response.get_json()['status'] == (
+        'queued' if queues else claimed_status or 'queued'
+    )
+    assert fake_redis.get(
+        jobs.DCAT_V3_EXPORT_JOB_KEY.format('org-id')
+    ) == job_id.encode('utf-8')
+
+
+@pytest.mark.usefixtures('with_plugins')
+def test_generate_dcat_v3_only_accepts_post(app):
+    # a GET, such as a prefetch or an <img> tag, must not queue exports
+    methods = {
+        rule.rule: rule.methods
+        for rule in app.flask_app.url_map.iter_rules()
+    }['/organization/<org_id>/dcat-v3.json']
+
+    assert 'POST' in methods
+    assert 'GET' not in methods
+
+
+@pytest.mark.usefixtures('with_request_context')
+def test_dcat_v3_export_status_hides_other_organizations_jobs(monkeypatch):
+    monkeypatch.setattr(
+        plugin_module, '_can_export_dcat_v3', lambda org_id: True
+    )
+    monkeypatch.setattr(
+        plugin_module, 'job_from_id',
+        lambda job_id: FakeJob(meta={'org_id': 'other-org-id'})
+    )
+
+    response, status = plugin_module.dcat_v3_export_status(
+        'org-id', 'job-id'
+    )
+
+    assert status == 404
+
+
+@pytest.mark.usefixtures('with_request_context')
+def test_dcat_v3_export_download_returns_stored_zip(monkeypatch, fake_redis):
+    monkeypatch.setattr(
+        plugin_module, '_can_export_dcat_v3', lambda org_id: True
+    )
+    monkeypatch.setattr(
+        plugin_module, 'job_from_id',
+        lambda job_id: FakeJob(meta={'org_id': 'org-id'}, status='finished')
+    )
+    fake_redis.set(jobs.DCAT_V3_EXPORT_KEY.format('job-id'), b'zip-bytes')
+
+    response = plugin_module.dcat_v3_export_download('org-id', 'job-id')
+
+    assert response.get_data() == b'zip-bytes'
+    assert response.headers['Content-Length'] == '9'
+    assert 'dcat-v3.zip' in response.headers['Content-Disposition']
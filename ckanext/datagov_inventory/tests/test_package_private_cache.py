@@ -0,0 +1,92 @@
+import pytest
+
+import ckan.tests.factories as factories
+
+from ckanext.datagov_inventory import plugin as plugin_module
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_items(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(plugin_module.time, 'monotonic', clock)
+    cache = plugin_module._TTLCache(maxsize=10, ttl=60)
+
+    cache.set('pkg-1', False)
+    clock.now += 59
+    assert cache.get('pkg-1') is False
+    clock.now += 1
+    assert cache.get('pkg-1') is None
+
+
+def test_ttl_cache_drops_least_recently_used():
+    cache = plugin_module._TTLCache(maxsize=2, ttl=60)
+
+    cache.set('pkg-1', False)
+    cache.set('pkg-2', True)
+    cache.get('pkg-1')
+    cache.set('pkg-3', False)
+
+    assert cache.get('pkg-1') is False
+    assert cache.get('pkg-2') is None
+    assert cache.get('pkg-3') is False
+
+
+def test_package_changes_forget_private_flag(monkeypatch):
+    cache = plugin_module._TTLCache(maxsize=10, ttl=60)
+    monkeypatch.setattr(plugin_module, '_package_private_cache', cache)
+    plugin = plugin_module.Datagov_IauthfunctionsPlugin()
+
+    for hook in (plugin.after_dataset_update, plugin.after_dataset_delete):
+        cache.set('pkg-id', False)
+        cache.set('pkg-name', False)
+        cache.set('other-pkg-id', False)
+
+        hook({}, {'id': 'pkg-id', 'name': 'pkg-name'})
+
+        assert cache.get('pkg-id') is None
+        assert cache.get('pkg-name') is None
+        assert cache.get('other-pkg-id') is False
+
+
+@pytest.mark.usefixtures('clean_db')
+@pytest.mark.ckan_config('ckan.auth.create_unowned_dataset', True)
+def test_bulk_updates_forget_private_flag(monkeypatch):
+    # bulk_update_private and friends skip the IPackageController hooks.
+    datasets = [factories.Dataset(), factories.Dataset()]
+    cache = plugin_module._TTLCache(maxsize=10, ttl=60)
+    monkeypatch.setattr(plugin_module, '_package_private_cache', cache)
+    plugin = plugin_module.Datagov_IauthfunctionsPlugin()
+    receivers = {
+        subscription['sender']: subscription['receiver']
+        for subscription in plugin.get_signal_subscriptions()[
+            plugin_module.toolkit.signals.action_succeeded
+        ]
+    }
+
+    for action_name in ('bulk_update_private', 'bulk_update_public'):
+        for dataset in datasets:
+            cache.set(dataset['id'], False)
+            cache.set(dataset['name'], False)
+        cache.set('other-pkg-id', False)
+
+        receivers[action_name](
+            action_name, context={}, result=None,
+            data_dict={
+                'datasets': [dataset['id'] for dataset in datasets],
+                'org_id': 'org-id',
+            }
+        )
+
+        for dataset in datasets:
+            assert cache.get(dataset['id']) is None
+            # anonymous requests may look packages up by name
+            assert cache.get(dataset['name']) is None
+        assert cache.get('other-pkg-id') is False
@@ -0,0 +1,44 @@
+import pytest
+
+from ckanext.datagov_inventory import plugin as plugin_module
+
+
+@pytest.mark.parametrize('path, hooks', [
+    ('/dataset', ('check_dataset_access', 'refresh_session')),
+    ('/dataset/', ('check_dataset_access', 'refresh_session')),
+    ('/dataset/some-dataset', ('refresh_session',)),
+    ('/user/user-org-roles', ('refresh_session',)),
+    ('/', ('refresh_session',)),
+    ('/api/3/action/package_show', ()),
+    ('/api', ()),
+    ('/webassets/base/main.css', ()),
+    ('/base/images/ckan-logo.png', ()),
+    ('/favicon.ico', ()),
+])
+def test_request_hooks_for_path(path, hooks):
+    assert tuple(
+        hook.__name__
+        for hook in plugin_module.request_hooks_for_path(path)
+    ) == hooks
+
+
+@pytest.mark.usefixtures('with_plugins')
+def test_api_requests_skip_request_hooks(app, monkeypatch):
+    def fail():
+        raise AssertionError('hook ran')
+
+    monkeypatch.setattr(plugin_module, 'DEFAULT_REQUEST_HOOKS', (fail,))
+    monkeypatch.setitem(
+        plugin_module.REQUEST_HOOKS_BY_PATH, '/dataset', (fail,)
+    )
+
+    response = app.get('/api/3/action/status_show')
+
+    assert response.status_code == 200
+
+
+@pytest.mark.usefixtures('with_plugins')
+def test_anonymous_dataset_list_is_forbidden(app):
+    response = app.get('/dataset')
+
+    assert response.status_code == 403
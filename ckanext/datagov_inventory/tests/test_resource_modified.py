@@ -1,7 +1,12 @@
 from datetime import datetime
 
 import pytest
+from sqlalchemy import text
 
+import ckan.model as model
+import ckan.tests.factories as factories
+
+from ckanext.datagov_inventory import jobs
 from ckanext.datagov_inventory import plugin as plugin_module
 
 
@@ -58,22 +63,178 @@ def test_resource_delete_touches_parent_when_no_resources_remain(
 def test_touch_dataset_modified_uses_utc_iso_timestamp(monkeypatch):
     # data.json exports this custom modified field, so keep its ISO UTC format.
     calls = []
-
-    def get_action(name):
-        assert name == 'package_patch'
-
-        def action(context, data_dict):
-            calls.append((context, data_dict))
-
-        return action
-
-    monkeypatch.setattr(plugin_module.toolkit, 'get_action', get_action)
+    monkeypatch.setattr(
+        plugin_module,
+        '_patch_dataset_modified',
+        lambda context, package_id, modified: calls.append(
+            (context, package_id, modified)
+        )
+    )
     context = {'user': 'editor'}
 
     plugin_module._touch_dataset_modified(context, 'dataset-id')
 
     assert calls[0][0] is context
-    assert calls[0][1]['id'] == 'dataset-id'
-    modified = calls[0][1]['modified']
+    assert calls[0][1] == 'dataset-id'
+    modified = calls[0][2]
     assert modified.endswith('Z')
     assert datetime.fromisoformat(modified.replace('Z', '+00:00')).tzinfo
+
+
+@pytest.mark.usefixtures('clean_db')
+@pytest.mark.ckan_config('ckan.auth.create_unowned_dataset', True)
+def test_patch_dataset_modified_updates_extra_and_queues_reindex(
+        monkeypatch):
+    # only the modified extra changes; the search index is updated later.
+    queued = []
+    monkeypatch.setattr(
+        plugin_module.toolkit,
+        'enqueue_job',
+        lambda fn, args, title=None: queued.append((fn, args))
+    )
+    with_extra = factories.Dataset(
+        extras=[{'key': 'modified', 'value': '2020-01-01T00:00:00.000Z'}],
+        resources=[{'url': 'https://example.gov/data.csv'}]
+    )
+    without_extra = factories.Dataset()
+    monkeypatch.setitem(
+        plugin_module.config, 'ckan.search.automatic_indexing', True
+    )
+    context = {'ignore_auth': True}
+
+    for dataset in (with_extra, without_extra):
+        plugin_module._patch_dataset_modified(
+            context, dataset['id'], '2024-05-01T12:00:00.000Z'
+        )
+
+    for dataset in (with_extra, without_extra):
+        pkg = model.Package.get(dataset['id'])
+        assert pkg.extras['modified'] == '2024-05-01T12:00:00.000Z'
+        assert pkg.metadata_modified.isoformat() > (
+            dataset['metadata_modified']
+        )
+    assert len(model.Package.get(with_extra['id']).resources) == 1
+    assert queued == [
+        (jobs.reindex_package, [with_extra['id']]),
+        (jobs.reindex_package, [without_extra['id']]),
+    ]
+
+
+@pytest.mark.usefixtures('clean_db')
+@pytest.mark.ckan_config('ckan.auth.create_unowned_dataset', True)
+def test_patch_dataset_modified_honours_defer_commit(monkeypatch):
+    # harvests and bulk imports commit their own transactions.
+    queued = []
+    monkeypatch.setattr(
+        plugin_module.toolkit, 'enqueue_job',
+        lambda fn, args, title=None: queued.append(args)
+    )
+    monkeypatch.setitem(
+        plugin_module.config, 'ckan.search.automatic_indexing', True
+    )
+    dataset = factories.Dataset()
+    other = model.Package.get(factories.Dataset()['id'])
+    other.title = 'Pending title'
+    commit = model.Session.commit
+    committed = []
+    monkeypatch.setattr(
+        model.Session, 'commit', lambda: committed.append(True)
+    )
+
+    plugin_module._patch_dataset_modified(
+        {'ignore_auth': True, 'defer_commit': True},
+        dataset['id'], '2024-05-01T12:00:00.000Z'
+    )
+
+    assert committed == []
+    assert model.Package.get(dataset['id']).extras['modified'] == (
+        '2024-05-01T12:00:00.000Z'
+    )
+    # the caller's other loaded objects are left alone
+    assert other.title == 'Pending title'
+    # nothing is reindexed until the caller commits
+    assert queued == []
+    commit()
+    assert queued == [[dataset['id']]]
+
+
+@pytest.mark.usefixtures('clean_db')
+@pytest.mark.ckan_config('ckan.auth.create_unowned_dataset', True)
+def test_patch_dataset_modified_rolled_back_is_not_reindexed(monkeypatch):
+    queued = []
+    monkeypatch.setattr(
+        plugin_module.toolkit, 'enqueue_job',
+        lambda fn, args, title=None: queued.append(args)
+    )
+    monkeypatch.setitem(
+        plugin_module.config, 'ckan.search.automatic_indexing', True
+    )
+    dataset = factories.Dataset()
+
+    plugin_module._patch_dataset_modified(
+        {'ignore_auth': True, 'defer_commit': True},
+        dataset['id'], '2024-05-01T12:00:00.000Z'
+    )
+    model.Session.rollback()
+    model.Session.commit()
+
+    assert queued == []
+    assert 'modified' not in model.Package.get(dataset['id']).extras
+
+
+@pytest.mark.usefixtures('with_request_context')
+def test_touches_within_a_request_are_patched_once(monkeypatch):
+    # bulk resource uploads should not patch and reindex per resource.
+    patched = []
+    monkeypatch.setattr(
+        plugin_module,
+        '_patch_dataset_modified',
+        lambda context, package_id, modified: patched.append(
+            (context, package_id, modified)
+        )
+    )
+    context = {'user': 'editor'}
+
+    for _ in range(3):
+        plugin_module._touch_dataset_modified(context, 'dataset-id')
+    plugin_module._touch_dataset_modified(context, 'other-dataset-id')
+    assert patched == []
+
+    response = object()
+    assert plugin_module.flush_dataset_modified(response) is response
+
+    assert [package_id for _, package_id, _ in patched] == [
+        'dataset-id', 'other-dataset-id'
+    ]
+    assert patched[0][0]['user'] == 'editor'
+    assert patched[0][2].endswith('Z')
+
+    plugin_module.flush_dataset_modified(response)
+    assert len(patched) == 2
+
+
+@pytest.mark.usefixtures('clean_db', 'with_request_context')
+@pytest.mark.ckan_config('ckan.auth.create_unowned_dataset', True)
+def test_failed_touch_does_not_lose_the_others(monkeypatch):
+    # one database error must not lose the remaining modified dates.
+    monkeypatch.setattr(
+        plugin_module.toolkit, 'enqueue_job', lambda *args, **kw: None
+    )
+    failing, other = factories.Dataset(), factories.Dataset()
+    patch = plugin_module._patch_dataset_modified
+
+    def patch_dataset_modified(context, package_id, modified):
+        if package_id == failing['id']:
+            model.Session.execute(text('SELECT * FROM no_such_table'))
+        patch(dict(context, ignore_auth=True), package_id, modified)
+
+    monkeypatch.setattr(
+        plugin_module, '_patch_dataset_modified', patch_dataset_modified
+    )
+    for dataset in (failing, other):
+        plugin_module._touch_dataset_modified({}, dataset['id'])
+
+    plugin_module.flush_dataset_modified(object())
+
+    assert 'modified' not in model.Package.get(failing['id']).extras
+    assert 'modified' in model.Package.get(other['id']).extras
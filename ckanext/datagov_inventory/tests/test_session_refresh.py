@@ -0,0 +1,73 @@
+import time
+from datetime import timedelta
+
+import pytest
+from flask import session
+
+from ckanext.datagov_inventory import plugin as plugin_module
+
+
+@pytest.fixture
+def refresh(app, monkeypatch):
+    """Run refresh_session for a request to `path` with a session that was
+    last refreshed `age` seconds ago, and return whether it will be saved.
+    """
+    monkeypatch.setattr(
+        app.flask_app, 'permanent_session_lifetime', timedelta(seconds=900)
+    )
+
+    def refresh(path='/dataset', age=None, headers=None, data=True):
+        with app.flask_app.test_request_context(path, headers=headers):
+            if data:
+                session['_user_id'] = 'user-id'
+            if age is not None:
+                session[plugin_module.SESSION_REFRESHED_KEY] = (
+                    int(time.time()) - age
+                )
+            session.modified = False
+
+            plugin_module.refresh_session()
+
+            return session.modified
+
+    return refresh
+
+
+def test_refresh_session_saves_session_without_refresh_time(refresh):
+    assert refresh() is True
+
+
+def test_refresh_session_skips_recently_refreshed_session(refresh):
+    assert refresh(age=60) is False
+    assert refresh(age=400) is False
+
+
+def test_refresh_session_saves_session_below_threshold(refresh):
+    # less than half of the 900 second lifetime is left
+    assert refresh(age=500) is True
+
+
+@pytest.mark.ckan_config(
+    'ckanext.datagov_inventory.session_refresh_threshold', '900'
+)
+def test_refresh_session_threshold_is_configurable(refresh):
+    assert refresh(age=1) is True
+
+
+def test_refresh_session_skips_empty_session(refresh):
+    assert refresh(data=False) is False
+
+
+@pytest.mark.parametrize('path', [
+    '/base/images/ckan-logo.png',
+    '/webassets/base/main.css',
+])
+def test_refresh_session_skips_assets(refresh, path):
+    assert refresh(path=path) is False
+
+
+def test_refresh_session_skips_api_token_requests(refresh):
+    assert refresh(
+        path='/api/3/action/package_search',
+        headers={'Authorization': 'api-token'}
+    ) is False